@@ -19,6 +19,7 @@
 
 import hashlib
 from enum import IntEnum
+from weakref import WeakValueDictionary
 
 from ..icon_constant import DATA_BYTE_ORDER, ICON_DEX_DB_NAME
 from ..utils import is_lowercase_hex_string, int_to_bytes
@@ -88,10 +89,21 @@ class AddressPrefix(IntEnum):
         raise InvalidParamsException('Invalid address prefix')
 
 
+# Address string or bytes -> Address made by Address.from_string() or Address.from_bytes()
+_interned_addresses: 'WeakValueDictionary' = WeakValueDictionary()
+
+
 class Address(object):
     """Address class
+
+    Address is immutable. Its bytes, string and hash are computed once and kept.
+    The addresses made by from_string() and from_bytes() are interned
+    so that the same address in many requests and keys shares one instance
+    while it is referred to.
     """
 
+    __slots__ = ('__prefix', '__body', '__bytes', '__str', '__hash', '__weakref__')
+
     def __init__(self,
                  address_prefix: AddressPrefix,
                  address_body: bytes, ignore_length_validate: bool = False) -> None:
@@ -112,6 +124,9 @@ class Address(object):
 
         self.__prefix = address_prefix
         self.__body = address_body
+        self.__bytes = None
+        self.__str = None
+        self.__hash = None
 
     @property
     def prefix(self) -> AddressPrefix:
@@ -135,7 +150,8 @@ class Address(object):
         :return: bool
         """
         return \
-            isinstance(other, Address) \
+            self is other \
+            or isinstance(other, Address) \
             and self.__prefix == other.prefix \
             and self.__body == other.body
 
@@ -153,14 +169,18 @@ class Address(object):
 
         :return: (str) 42-char address
         """
-        return f'{str(self.prefix)}{self.body.hex()}'
+        if self.__str is None:
+            self.__str = f'{str(self.prefix)}{self.body.hex()}'
+        return self.__str
 
     def __hash__(self) -> int:
         """Returns a hash value for this object
 
         :return: hash value
         """
-        return hash(self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body)
+        if self.__hash is None:
+            self.__hash = hash(self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body)
+        return self.__hash
 
     @property
     def is_contract(self) -> bool:
@@ -178,6 +198,9 @@ class Address(object):
 
         :return: :class:`.Address`
         """
+        instance = _interned_addresses.get(address) if isinstance(address, str) else None
+        if instance is not None:
+            return instance
 
         if not is_icon_address_valid(address):
             raise InvalidParamsException('Invalid address')
@@ -187,7 +210,10 @@ class Address(object):
         address_prefix = AddressPrefix.from_string(prefix)
         address_body = bytes.fromhex(body)
 
-        return Address(address_prefix, address_body)
+        instance = Address(address_prefix, address_body)
+        # A valid address string is the same as str() of the address
+        instance.__str = address
+        return Address._intern(instance)
 
     @staticmethod
     def from_data(prefix: AddressPrefix, data: bytes):
@@ -208,6 +234,10 @@ class Address(object):
         :param buf: :class:`.bytes` bytes data including Address information
         :return: :class:`.Address`
         """
+        instance = _interned_addresses.get(buf) if isinstance(buf, bytes) else None
+        if instance is not None:
+            return instance
+
         buf_size = len(buf)
 
         prefix = AddressPrefix.EOA
@@ -216,7 +246,16 @@ class Address(object):
             prefix_int = int.from_bytes(prefix_byte, DATA_BYTE_ORDER)
             prefix = AddressPrefix(prefix_int)
             buf = buf[1:]
-        return Address(prefix, buf)
+        return Address._intern(Address(prefix, buf))
+
+    @staticmethod
+    def _intern(address: 'Address') -> 'Address':
+        # Registered with both its string and bytes to be shared by from_string() and from_bytes()
+        instance: 'Address' = _interned_addresses.setdefault(str(address), address)
+        _interned_addresses.setdefault(instance.to_bytes(), instance)
+        hash(instance)
+
+        return instance
 
     def to_bytes(self) -> bytes:
         """
@@ -224,13 +263,14 @@ class Address(object):
 
         :return: :class:`.bytes` data including information of Address object
         """
-        body_bytes = self.body
-        if self.prefix != AddressPrefix.EOA:
-            prefix_byte = self.prefix.value.to_bytes(1, DATA_BYTE_ORDER)
-            address_bytes = prefix_byte + body_bytes
-        else:
-            address_bytes = body_bytes
-        return address_bytes
+        if self.__bytes is None:
+            body_bytes = self.body
+            if self.prefix != AddressPrefix.EOA:
+                prefix_byte = self.prefix.value.to_bytes(1, DATA_BYTE_ORDER)
+                self.__bytes = prefix_byte + body_bytes
+            else:
+                self.__bytes = body_bytes
+        return self.__bytes
 
     @staticmethod
     def from_prefix_and_int(prefix: 'AddressPrefix', num: int):
@@ -244,6 +284,9 @@ class Address(object):
 class MalformedAddress(Address):
     """This class only exists to support an invalid format address which was created by legacy bug
     """
+
+    __slots__ = ()
+
     def __init__(self,
                  address_prefix: AddressPrefix,
                  address_body: bytes) -> None:
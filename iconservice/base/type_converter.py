@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from copy import deepcopy
-from typing import Union, Any, get_type_hints
+from typing import Union, Any, Callable, Optional, get_type_hints
 
 from iconservice.base.type_converter_templates import ParamType, \
     type_convert_templates, ValueType, KEY_CONVERTER, CONVERT_USING_SWITCH_KEY, SWITCH_KEY
@@ -29,6 +29,27 @@ score_base_support_type = (int, str, bytes, bool, Address)
 class TypeConverter:
     @staticmethod
     def convert(params: dict, param_type: ParamType) -> Any:
+        """Converts params with the converter compiled from type_convert_templates[param_type]
+
+        params is not modified. Values which are not converted by the template
+        (ex: ValueType.LATER, ValueType.IGNORE) are shared with params.
+
+        :param params: JSON-RPC params
+        :param param_type: ParamType
+        :return: converted params
+        """
+        if param_type is None:
+            return params
+
+        return _compiled_converters[param_type](params)
+
+    @staticmethod
+    def convert_by_template(params: dict, param_type: ParamType) -> Any:
+        """Converts params by interpreting type_convert_templates[param_type]
+
+        It is the reference implementation of convert()
+        and is used to check if the compiled converters produce the same results.
+        """
         if param_type is None:
             return params
 
@@ -241,6 +262,47 @@ class TypeConverter:
             kw_param = TypeConverter._convert_data_value(param, kw_param)
             kw_params[key] = kw_param
 
+    @staticmethod
+    def make_data_params_converter(func: callable) -> Callable[[Optional[dict]], Optional[dict]]:
+        """Makes a converter which behaves the same as convert_data_params()
+        on a deep copy of kw_params
+
+        Annotations are read only once here
+        and the values which are never modified are not copied.
+
+        :param func: SCORE method
+        :return: converter which returns converted kw_params
+        """
+        annotation_params: dict = TypeConverter.make_annotations_from_method(func)
+
+        value_converters = []
+        for key, param in annotation_params.items():
+            if key == 'self' or key == 'cls':
+                continue
+
+            annotation_type = get_main_type_from_annotations_type(param)
+            for data_type, value_converter in _data_value_converters:
+                if annotation_type == data_type:
+                    value_converters.append((key, value_converter))
+                    break
+
+        def convert(kw_params: Optional[dict]) -> Optional[dict]:
+            if kw_params is None:
+                # Fails in the same way as convert_data_params() if there is any parameter
+                TypeConverter.convert_data_params(annotation_params, kw_params)
+                return kw_params
+
+            new_params = {key: value if type(value) in _immutable_types else deepcopy(value)
+                          for key, value in kw_params.items()}
+            for key, value_converter in value_converters:
+                value = kw_params.get(key)
+                if value is not None:
+                    new_params[key] = value_converter(value)
+
+            return new_params
+
+        return convert
+
     @staticmethod
     def _convert_data_value(annotation_type: type, param: Any) -> Any:
         if annotation_type == int:
@@ -282,3 +344,211 @@ class TypeConverter:
             return bytes.hex(value)
         else:
             return f'0x{bytes.hex(value)}'
+
+
+# Converter is a function which converts params by a template in a single pass.
+# Every converter below behaves exactly the same as TypeConverter._convert() on the same template
+# except that it does not copy params.
+Converter = Callable[[Any], Any]
+
+_value_converters = {
+    ValueType.INT: TypeConverter._convert_value_int,
+    ValueType.HEXADECIMAL: TypeConverter._convert_value_hexadecimal,
+    ValueType.STRING: TypeConverter._convert_value_string,
+    ValueType.BOOL: TypeConverter._convert_value_bool,
+    ValueType.ADDRESS: TypeConverter._convert_value_address,
+    ValueType.ADDRESS_OR_MALFORMED_ADDRESS: TypeConverter._convert_value_address_or_malformed_address,
+    ValueType.BYTES: TypeConverter._convert_value_bytes
+}
+
+
+# The same order as TypeConverter._convert_data_value()
+_data_value_converters = (
+    (int, TypeConverter._convert_value_int),
+    (str, TypeConverter._convert_value_string),
+    (bool, TypeConverter._convert_value_bool),
+    (Address, TypeConverter._convert_value_address),
+    (bytes, TypeConverter._convert_value_bytes)
+)
+
+# The types of values which are shared with the original params instead of being copied
+_immutable_types = (str, int, bool, float, bytes, type(None))
+
+
+def _raise_none_value(template: Any) -> None:
+    raise InvalidParamsException(f'TypeConvert Exception None value, template: {str(template)}')
+
+
+def _is_skipped(params: Any) -> bool:
+    """Same as TypeConverter._skip_params() with a truthy template
+    except that None params is checked by the caller
+    """
+    return not isinstance(params, str) and not params
+
+
+def _compile_template(template: Union[list, dict, ValueType, None], compiled: dict) -> Converter:
+    """Compiles a template into a converter
+
+    :param template: an item of type_convert_templates or its sub template
+    :param compiled: id(template) -> (template, converter) to share converters of the same template
+    :return: converter
+    """
+    entry = compiled.get(id(template))
+    if entry is not None:
+        return entry[1]
+
+    if not template:
+        converter = _make_passing_converter(template)
+    elif isinstance(template, dict):
+        converter = _make_dict_converter(template, compiled)
+    elif isinstance(template, list):
+        converter = _make_list_converter(template, compiled)
+    elif isinstance(template, ValueType):
+        converter = _make_value_converter(template)
+    else:
+        converter = _make_passing_converter(template)
+
+    compiled[id(template)] = (template, converter)
+    return converter
+
+
+def _make_passing_converter(template: Any) -> Converter:
+    def convert(params: Any) -> Any:
+        if params is None:
+            _raise_none_value(template)
+        return params
+
+    return convert
+
+
+def _make_value_converter(template: 'ValueType') -> Converter:
+    value_converter: Optional[Callable] = _value_converters.get(template)
+
+    if value_converter is None:
+        # ValueType.LATER
+        return _make_passing_converter(template)
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            _raise_none_value(template)
+        if _is_skipped(params):
+            return params
+        return value_converter(params)
+
+    return convert
+
+
+def _make_list_converter(template: list, compiled: dict) -> Converter:
+    item_converter: Converter = _compile_template(template[0], compiled)
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            _raise_none_value(template)
+        if _is_skipped(params) or not isinstance(params, list):
+            return params
+        return [item_converter(item) for item in params]
+
+    return convert
+
+
+def _make_dict_converter(template: dict, compiled: dict) -> Converter:
+    default_converter: Converter = _compile_template(None, compiled)
+    field_converters = {}
+    switch_converters = {}
+
+    for key, sub_template in template.items():
+        if isinstance(sub_template, dict) and CONVERT_USING_SWITCH_KEY in sub_template:
+            switch_converters[key] = _make_switch_converter(sub_template[CONVERT_USING_SWITCH_KEY], compiled)
+        else:
+            field_converters[key] = _compile_template(sub_template, compiled)
+
+    key_converter: Optional[dict] = template[KEY_CONVERTER] if KEY_CONVERTER in template else None
+
+    def convert(params: Any) -> Any:
+        if params is None:
+            _raise_none_value(template)
+        if _is_skipped(params):
+            return params
+        if key_converter is not None and \
+                not (isinstance(params, dict) and key_converter.keys().isdisjoint(params)):
+            params = TypeConverter._convert_key(params, key_converter)
+        if not isinstance(params, dict):
+            return params
+
+        new_params = {}
+        for key, value in params.items():
+            switch_converter = switch_converters.get(key)
+            if switch_converter is None:
+                new_params[key] = field_converters.get(key, default_converter)(value)
+            else:
+                # The values converted before are referred to choose a template
+                new_params[key] = switch_converter(value, new_params)
+
+        return new_params
+
+    return convert
+
+
+def _make_switch_converter(template: dict, compiled: dict) -> Callable[[Any, dict], Any]:
+    """Compiles a template under CONVERT_USING_SWITCH_KEY
+    which behaves the same as TypeConverter._convert_using_switch()
+    """
+    switch_key = template.get(SWITCH_KEY)
+    target_converters = {
+        case: _make_switch_target_converter(target_template, compiled)
+        for case, target_template in template.items()
+    }
+
+    def convert(params: Any, converted_params: dict) -> Any:
+        if params is None:
+            _raise_none_value(template)
+        if _is_skipped(params):
+            return params
+
+        target_converter: Optional[Converter] = target_converters.get(converted_params.get(switch_key))
+        if target_converter is None:
+            return params
+        return target_converter(params)
+
+    return convert
+
+
+def _make_switch_target_converter(template: Any, compiled: dict) -> Optional[Converter]:
+    if isinstance(template, dict):
+        default_converter: Converter = _compile_template(None, compiled)
+        field_converters = {
+            key: _compile_template(sub_template, compiled)
+            for key, sub_template in template.items()
+        }
+
+        def convert(params: Any) -> Any:
+            if not isinstance(params, dict):
+                return params
+            return {key: field_converters.get(key, default_converter)(value)
+                    for key, value in params.items()}
+
+        return convert
+    elif isinstance(template, list) and len(template) > 0:
+        item_converter: Converter = _compile_template(template[0], compiled)
+
+        def convert(params: Any) -> Any:
+            if not isinstance(params, list):
+                return params
+            return [item_converter(item) for item in params]
+
+        return convert
+    elif isinstance(template, ValueType):
+        return _value_converters.get(template)
+
+    return None
+
+
+def _compile_templates() -> dict:
+    compiled = {}
+    return {
+        param_type: _compile_template(template, compiled)
+        for param_type, template in type_convert_templates.items()
+    }
+
+
+_compiled_converters = _compile_templates()
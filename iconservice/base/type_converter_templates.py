@@ -34,6 +34,8 @@ class ParamType(IntEnum):
     ICX_GET_TOTAL_SUPPLY = 303
     ICX_GET_SCORE_API = 304
     ISE_GET_STATUS = 305
+    ISE_GET_EVENT_LOGS = 306
+    ISE_GET_TRANSACTION_RESULT = 307
 
     WRITE_PRECOMMIT = 400
     REMOVE_PRECOMMIT = 500
@@ -124,6 +126,15 @@ class ConstantKeys(object):
     ICX_GET_TOTAL_SUPPLY = "icx_getTotalSupply"
     ICX_GET_SCORE_API = "icx_getScoreApi"
     ISE_GET_STATUS = "ise_getStatus"
+    ISE_GET_EVENT_LOGS = "ise_getEventLogs"
+    ISE_GET_TRANSACTION_RESULT = "ise_getTransactionResult"
+
+    EVENT = "event"
+    INDEXED = "indexed"
+    FROM_BLOCK = "fromBlock"
+    TO_BLOCK = "toBlock"
+    LIMIT = "limit"
+    CURSOR = "cursor"
 
     # IISS
     DELEGATIONS = "delegations"
@@ -222,6 +233,21 @@ type_convert_templates[ParamType.ISE_GET_STATUS] = {
     ConstantKeys.FILTER: [ValueType.STRING]
 }
 
+type_convert_templates[ParamType.ISE_GET_EVENT_LOGS] = {
+    ConstantKeys.ADDRESS: ValueType.ADDRESS,
+    ConstantKeys.EVENT: ValueType.STRING,
+    # Converted into the types in the event signature later
+    ConstantKeys.INDEXED: ValueType.LATER,
+    ConstantKeys.FROM_BLOCK: ValueType.INT,
+    ConstantKeys.TO_BLOCK: ValueType.INT,
+    ConstantKeys.LIMIT: ValueType.INT,
+    ConstantKeys.CURSOR: ValueType.BYTES
+}
+
+type_convert_templates[ParamType.ISE_GET_TRANSACTION_RESULT] = {
+    ConstantKeys.TX_HASH: ValueType.BYTES
+}
+
 type_convert_templates[ParamType.QUERY] = {
     ConstantKeys.METHOD: ValueType.STRING,
     ConstantKeys.PARAMS: {
@@ -231,7 +257,9 @@ type_convert_templates[ParamType.QUERY] = {
             ConstantKeys.ICX_GET_BALANCE: type_convert_templates[ParamType.ICX_GET_BALANCE],
             ConstantKeys.ICX_GET_TOTAL_SUPPLY: type_convert_templates[ParamType.ICX_GET_TOTAL_SUPPLY],
             ConstantKeys.ICX_GET_SCORE_API: type_convert_templates[ParamType.ICX_GET_SCORE_API],
-            ConstantKeys.ISE_GET_STATUS: type_convert_templates[ParamType.ISE_GET_STATUS]
+            ConstantKeys.ISE_GET_STATUS: type_convert_templates[ParamType.ISE_GET_STATUS],
+            ConstantKeys.ISE_GET_EVENT_LOGS: type_convert_templates[ParamType.ISE_GET_EVENT_LOGS],
+            ConstantKeys.ISE_GET_TRANSACTION_RESULT: type_convert_templates[ParamType.ISE_GET_TRANSACTION_RESULT]
         }
     }
 }
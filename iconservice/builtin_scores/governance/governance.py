@@ -123,8 +123,8 @@ class Governance(IconScoreBase):
         super().__init__(db)
         self._score_status = DictDB(self._SCORE_STATUS, db, value_type=bytes, depth=3)
         self._auditor_list = ArrayDB(self._AUDITOR_LIST, db, value_type=Address)
-        self._deployer_list = ArrayDB(self._DEPLOYER_LIST, db, value_type=Address)
-        self._score_black_list = ArrayDB(self._SCORE_BLACK_LIST, db, value_type=Address)
+        self._deployer_list = IndexedArrayDB(self._DEPLOYER_LIST, db, value_type=Address)
+        self._score_black_list = IndexedArrayDB(self._SCORE_BLACK_LIST, db, value_type=Address)
         self._step_price = VarDB(self._STEP_PRICE, db, value_type=int)
         self._step_costs = StepCosts(db)
         self._max_step_limits = DictDB(self._MAX_STEP_LIMITS, db, value_type=int)
@@ -150,6 +150,10 @@ class Governance(IconScoreBase):
     def on_update(self) -> None:
         super().on_update()
 
+        # migrates from old DB of deployer_list and score_black_list stored by ArrayDB.
+        self._deployer_list.reindex()
+        self._score_black_list.reindex()
+
         if len(self._step_costs) == 0:
             # migrates from old DB of step_costs.
             for step_type in INITIAL_STEP_COST_KEYS:
@@ -356,12 +360,7 @@ class Governance(IconScoreBase):
         if self.msg.sender != self.owner:
             if self.msg.sender != address:
                 self.revert('Invalid sender: not yourself')
-        # get the topmost value
-        top = self._deployer_list.pop()
-        if top != address:
-            for i in range(len(self._deployer_list)):
-                if self._deployer_list[i] == address:
-                    self._deployer_list[i] = top
+        self._deployer_list.remove(address)
         if DEBUG is True:
             self._print_deployer_list('removeDeployer')
 
@@ -396,12 +395,7 @@ class Governance(IconScoreBase):
         # check message sender, only owner can remove from blacklist
         if self.msg.sender != self.owner:
             self.revert('Invalid sender: not owner')
-        # get the topmost value
-        top = self._score_black_list.pop()
-        if top != address:
-            for i in range(len(self._score_black_list)):
-                if self._score_black_list[i] == address:
-                    self._score_black_list[i] = top
+        self._score_black_list.remove(address)
         if DEBUG is True:
             self._print_black_list('removeScoreFromBlackList')
 
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import deque
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Optional
+
+from iconcommons.logger import Logger
+from ..base.exception import DatabaseException
+from ..icon_constant import ICON_DB_LOG_TAG
+
+if TYPE_CHECKING:
+    import plyvel
+
+
+class _PendingBatch(object):
+    def __init__(self, states: dict) -> None:
+        # None value means that the key will be deleted
+        self.states = states
+        self.requested_time: float = time.monotonic()
+
+
+class AsyncBatchWriter(object):
+    """Writes batches to db in a dedicated thread in the requested order
+
+    The batches which are not written yet are looked up with get() before db
+    so that the caller can go on as if they had been already written.
+    """
+
+    # Limits the memory used by the batches waiting to be written
+    MAX_PENDING_BATCHES = 16
+
+    # Returned by get() when the key is not found in the pending batches
+    MISSING = object()
+
+    def __init__(self, db: 'plyvel.DB') -> None:
+        """Constructor
+
+        :param db: plyvel db instance
+        """
+        self._db = db
+        self._pending = deque()
+        self._cond = Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+        # Seconds from the write request to the completion of the oldest batch in the last write
+        self.flush_lag: float = 0.0
+        self.max_flush_lag: float = 0.0
+        self.written_count: int = 0
+
+        self._thread = Thread(target=self._run, name='AsyncBatchWriter', daemon=True)
+        self._thread.start()
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Returns the value for a given key from the batches not written yet
+
+        :param key:
+        :return: value or AsyncBatchWriter.MISSING if the key is not in any pending batch
+        """
+        with self._cond:
+            for batch in reversed(self._pending):
+                value = batch.states.get(key, self.MISSING)
+                if value is not self.MISSING:
+                    return value
+
+        return self.MISSING
+
+    def get_pending_states(self) -> dict:
+        """Returns the states of the batches not written yet merged in the requested order
+
+        :return: key/value pairs. None value means that the key will be deleted
+        """
+        states = {}
+        with self._cond:
+            for batch in self._pending:
+                states.update(batch.states)
+
+        return states
+
+    def write(self, states: dict) -> None:
+        """Requests to write a batch
+
+        :param states: key/value pairs. Empty or None value means that the key is deleted
+        """
+        batch = _PendingBatch({key: value if value else None for key, value in states.items()})
+
+        with self._cond:
+            self._check_error()
+            while len(self._pending) >= self.MAX_PENDING_BATCHES and self._error is None:
+                self._cond.wait()
+            self._check_error()
+
+            self._pending.append(batch)
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Blocks until all the requested batches are written to db
+        """
+        with self._cond:
+            while len(self._pending) > 0 and self._error is None:
+                self._cond.wait()
+            self._check_error()
+
+    def close(self) -> None:
+        """Writes the remaining batches and stops the writer thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join()
+
+        if self._error is not None:
+            Logger.error(f'{len(self._pending)} batches are not written: {self._error}', ICON_DB_LOG_TAG)
+
+    def _check_error(self) -> None:
+        if self._error is not None:
+            raise DatabaseException(f'Failed to write a batch: {self._error}')
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while len(self._pending) == 0 and not self._closed:
+                    self._cond.wait()
+
+                if len(self._pending) == 0:
+                    return
+
+                # Writes all the pending batches at once
+                batches = list(self._pending)
+
+            try:
+                with self._db.write_batch() as wb:
+                    for batch in batches:
+                        for key, value in batch.states.items():
+                            if value is None:
+                                wb.delete(key)
+                            else:
+                                wb.put(key, value)
+            except BaseException as e:
+                Logger.error(f'Failed to write a batch: {e}', ICON_DB_LOG_TAG)
+                with self._cond:
+                    # The batches are kept to be read with get()
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            now: float = time.monotonic()
+
+            with self._cond:
+                # The batches are removed after written so that get() never misses them
+                for _ in batches:
+                    self._pending.popleft()
+
+                self.flush_lag = now - batches[0].requested_time
+                self.max_flush_lag = max(self.max_flush_lag, self.flush_lag)
+                self.written_count += len(batches)
+                self._cond.notify_all()
+
+            Logger.debug(f'{len(batches)} batches written: flush_lag({self.flush_lag:.6f})', ICON_DB_LOG_TAG)
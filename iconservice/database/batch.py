@@ -17,14 +17,19 @@
 
 import hashlib
 from collections import OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING, Optional
 from collections.abc import MutableMapping
 
+from ..base.address import GOVERNANCE_SCORE_ADDRESS
 from ..base.exception import DatabaseException
 
 if TYPE_CHECKING:
     from ..base.block import Block
 
+# The keys of governance SCORE states in StateDB start with it. See IconScoreDatabase._hash_key()
+GOVERNANCE_KEY_PREFIX: bytes = GOVERNANCE_SCORE_ADDRESS.to_bytes() + b'|'
+
 
 def digest(ordered_dict: OrderedDict):
     # items in data MUST be byte-like objects
@@ -60,12 +65,43 @@ class Batch(OrderedDict):
         return digest(self)
 
 
+class KeyAccessRecorder(object):
+    """Records the keys touched by a transaction
+
+    reads: keys which were not found in TransactionBatch
+        so that they were read from BlockBatch or StateDB
+    writes: keys written to TransactionBatch including the ones reverted later
+
+    Each key is mapped to the call depth where it was touched first.
+    0 means the transaction itself and 1 means the first internal call.
+    """
+    def __init__(self) -> None:
+        self.reads: OrderedDict = OrderedDict()
+        self.writes: OrderedDict = OrderedDict()
+
+    def on_read(self, key: bytes, depth: int) -> None:
+        if key not in self.reads:
+            self.reads[key] = depth
+
+    def on_write(self, key: bytes, depth: int) -> None:
+        if key not in self.writes:
+            self.writes[key] = depth
+
+
 class TransactionBatch(MutableMapping):
     """Contains the states changed by a transaction.
 
     key: Score Address
     value: IconScoreBatch
+
+    The states changed by the transaction and its internal calls are kept in a single dict.
+    Whenever a key is written in an internal call,
+    its previous value is appended to the journal to restore it on revert_call().
     """
+
+    # Journaled as the previous value of a key which was not in the batch
+    _ABSENT = object()
+
     def __init__(self, tx_hash: Optional[bytes]=None) -> None:
         """Constructor
 
@@ -73,68 +109,88 @@ class TransactionBatch(MutableMapping):
         """
         super().__init__()
         self.hash = tx_hash
-        self._call_batches = [OrderedDict()]
+        self._states = OrderedDict()
+        # (key, previous value) written in internal calls
+        self._journal = []
+        # The journal index where each internal call started
+        self._call_starts = []
+        # It is kept on clear() to record the keys touched until the transaction is finished
+        self.access_recorder: Optional['KeyAccessRecorder'] = None
+        # True if a state of the governance SCORE has been written. It is kept even if the write is reverted
+        self.is_governance_changed: bool = False
 
     def __getitem__(self, item):
-        for call_batch in reversed(self._call_batches):
-            if item in call_batch:
-                return call_batch[item]
-
-        return None
+        return self._states.get(item)
 
     def __setitem__(self, key, value):
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch[key] = value
+        if self._call_starts:
+            self._journal.append((key, self._states.get(key, self._ABSENT)))
+        self._states[key] = value
+
+        if not self.is_governance_changed and key.startswith(GOVERNANCE_KEY_PREFIX):
+            self.is_governance_changed = True
+
+        if self.access_recorder is not None:
+            self.access_recorder.on_write(key, self.call_depth)
 
     def __delitem__(self, key):
         raise DatabaseException('delete item is not allowed')
 
     def __contains__(self, item):
-        for call_batch in self._call_batches:
-            if item in call_batch:
-                return True
-
-        return False
+        return item in self._states
 
     def __iter__(self):
-        for call_batch in self._call_batches:
-            for key in call_batch:
-                yield key
+        return iter(self._states)
 
     def __len__(self):
-        length = 0
-
-        for call_batch in self._call_batches:
-            length += len(call_batch)
-
-        return length
+        return len(self._states)
 
     def enter_call(self):
-        self._call_batches.append(OrderedDict())
+        self._call_starts.append(len(self._journal))
 
     def revert_call(self):
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch.clear()
+        start: int = self._call_starts[-1]
+        states: OrderedDict = self._states
+        journal: list = self._journal
+
+        # Restores the previous values in the reverse order of writes
+        for i in range(len(journal) - 1, start - 1, -1):
+            key, value = journal[i]
+            if value is self._ABSENT:
+                del states[key]
+            else:
+                # The position of an existing key is not changed
+                states[key] = value
+
+        del journal[start:]
 
     def leave_call(self):
-        call_batch: OrderedDict = self._call_batches.pop()
+        self._call_starts.pop()
 
-        if call_batch:
-            self._call_batches[-1].update(call_batch)
+        if not self._call_starts:
+            # Nothing to revert any more
+            self._journal.clear()
 
     def digest(self) -> bytes:
-        if len(self._call_batches) != 1:
-            raise DatabaseException(f'Wrong call_batch count: {len(self._call_batches)}')
+        if len(self._call_starts) != 0:
+            raise DatabaseException(f'Wrong call_batch count: {self.call_count}')
 
-        return digest(self._call_batches[0])
+        return digest(self._states)
 
     @property
     def call_count(self) -> int:
-        return len(self._call_batches)
+        return len(self._call_starts) + 1
+
+    @property
+    def call_depth(self) -> int:
+        return len(self._call_starts)
 
     def clear(self):
         self.hash = None
-        self._call_batches = [OrderedDict()]
+        self._states = OrderedDict()
+        self._journal = []
+        self._call_starts = []
+        self.is_governance_changed = False
 
 
 class BlockBatch(Batch):
@@ -142,15 +198,129 @@ class BlockBatch(Batch):
 
     key: Address
     value: IconScoreBatch
+
+    parent: BlockBatch of the uncommitted parent block
+        It is None if the parent block has been committed.
+
+    The digest is updated with sha3_256 whenever a new key is appended
+    so that it is not necessary to hash the whole block at once.
+    If the value of a key which has been already hashed is changed,
+    the digest is recalculated lazily from the nearest checkpoint before the key.
     """
-    def __init__(self, block: Optional['Block'] = None):
+    # The number of entries between saved hash states
+    _CHECKPOINT_INTERVAL = 256
+
+    def __init__(self, block: Optional['Block'] = None, parent: Optional['BlockBatch'] = None):
         """Constructor
 
         :param block: block info
+        :param parent: BlockBatch of the uncommitted parent block
         """
         super().__init__()
         self.block = block
+        self.parent = parent
+        self._reset_digest_state()
+
+    def __setitem__(self, key, value):
+        position: Optional[int] = self._positions.get(key)
+
+        if position is None:
+            position = len(self._positions)
+            self._positions[key] = position
+            super().__setitem__(key, value)
+
+            if self._dirty_position is None:
+                self._hash_entry(position, key, value)
+        else:
+            if self._dirty_position is None or position < self._dirty_position:
+                if super().__getitem__(key) != value:
+                    self._dirty_position = position
+
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate_digest_state()
+
+    def pop(self, *args, **kwargs):
+        value = super().pop(*args, **kwargs)
+        self._invalidate_digest_state()
+        return value
+
+    def popitem(self, *args, **kwargs):
+        item = super().popitem(*args, **kwargs)
+        self._invalidate_digest_state()
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def move_to_end(self, *args, **kwargs):
+        super().move_to_end(*args, **kwargs)
+        self._invalidate_digest_state()
+
+    def digest(self) -> bytes:
+        """Returns the same hash value as Batch.digest() without joining all items
+
+        :return: sha3_256 hash value
+        """
+        if self._dirty_position is not None:
+            self._rehash(self._dirty_position)
+
+        return self._hasher.copy().digest()
 
     def clear(self) -> None:
         self.block = None
+        self.parent = None
         super().clear()
+        self._reset_digest_state()
+
+    def _reset_digest_state(self) -> None:
+        # key: position in the batch
+        self._positions: dict = {}
+        self._hasher = hashlib.sha3_256()
+        # checkpoints[i]: hash state before the entry at (i * _CHECKPOINT_INTERVAL) is hashed
+        self._checkpoints: list = []
+        # The first entry which has been changed after hashed
+        self._dirty_position: Optional[int] = None
+
+    def _invalidate_digest_state(self) -> None:
+        """Called when the order of entries is changed
+        """
+        self._reset_digest_state()
+        self._positions = {key: position for position, key in enumerate(self)}
+        self._dirty_position = 0
+
+    def _hash_entry(self, position: int, key: bytes, value: Optional[bytes]) -> None:
+        hasher = self._hasher
+
+        if position % self._CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append(hasher.copy())
+
+        if position > 0:
+            hasher.update(b'|')
+        hasher.update(key)
+
+        if value is not None:
+            hasher.update(b'|')
+            hasher.update(value)
+
+    def _rehash(self, position: int) -> None:
+        index: int = position // self._CHECKPOINT_INTERVAL
+        start: int = index * self._CHECKPOINT_INTERVAL
+
+        if index < len(self._checkpoints):
+            self._hasher = self._checkpoints[index]
+        else:
+            self._hasher = hashlib.sha3_256()
+        # The checkpoint at start is saved again by _hash_entry()
+        del self._checkpoints[index:]
+
+        items = super().items()
+        for offset, (key, value) in enumerate(islice(items, start, None)):
+            self._hash_entry(start + offset, key, value)
+
+        self._dirty_position = None
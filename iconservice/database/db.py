@@ -19,6 +19,10 @@ from typing import TYPE_CHECKING, Optional
 import plyvel
 
 from iconcommons.logger import Logger
+from .async_writer import AsyncBatchWriter
+from .lru_cache import LRUCache
+from .prefetcher import StatePrefetcher
+from .snapshot import DatabaseSnapshot
 from ..base.exception import DatabaseException, InvalidParamsException
 from ..icon_constant import ICON_DB_LOG_TAG
 from ..iconscore.icon_score_context import ContextGetter
@@ -51,30 +55,78 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool=True) -> 'KeyValueDatabase':
+                  create_if_missing: bool=True,
+                  cache_size: int=0,
+                  async_write: bool=False) -> 'KeyValueDatabase':
         """
 
         :param path: db path
         :param create_if_missing:
+        :param cache_size: the maximum bytes of read cache. 0 means no cache
+        :param async_write: if True, batches are written by a dedicated writer thread
         :return: KeyValueDatabase instance
         """
         db = plyvel.DB(path, create_if_missing=create_if_missing)
-        return KeyValueDatabase(db)
+        cache = LRUCache(cache_size) if cache_size > 0 else None
+        writer = AsyncBatchWriter(db) if async_write else None
+        return KeyValueDatabase(db, cache, writer)
 
-    def __init__(self, db: plyvel.DB) -> None:
+    def __init__(self,
+                 db: plyvel.DB,
+                 cache: Optional['LRUCache']=None,
+                 writer: Optional['AsyncBatchWriter']=None) -> None:
         """Constructor
 
         :param db: plyvel db instance
+        :param cache: read cache of committed key/value pairs
+        :param writer: writes batches asynchronously in the requested order
         """
         self._db = db
+        self._cache = cache
+        self._writer = writer
+
+    @property
+    def cache(self) -> Optional['LRUCache']:
+        return self._cache
+
+    @property
+    def writer(self) -> Optional['AsyncBatchWriter']:
+        return self._writer
 
     def get(self, key: bytes) -> bytes:
         """Get the value for the specified key.
 
+        Search order
+        1. Read cache
+        2. Batches not written by AsyncBatchWriter yet
+        3. LevelDB
+
         :param key: (bytes): key to retrieve
         :return: value for the specified key, or None if not found
         """
-        return self._db.get(key)
+        cache = self._cache
+        writer = self._writer
+        if cache is None and writer is None:
+            return self._db.get(key)
+
+        if cache is not None:
+            # It should be taken before looking up the pending batches
+            # not to cache the value overwritten by a batch requested in the meantime
+            generation: int = cache.generation
+            value = cache.get(key)
+            if value is not LRUCache.MISSING:
+                return value
+
+        if writer is not None:
+            value = writer.get(key)
+            if value is not AsyncBatchWriter.MISSING:
+                return value
+
+        value = self._db.get(key)
+        if cache is not None:
+            cache.put(key, value, generation)
+
+        return value
 
     def put(self, key: bytes, value: bytes) -> None:
         """Set a value for the specified key.
@@ -82,31 +134,74 @@ class KeyValueDatabase(object):
         :param key: (bytes): key to set
         :param value: (bytes): data to be stored
         """
-        self._db.put(key, value)
+        if self._writer is None:
+            self._db.put(key, value)
+        else:
+            # Keeps the order with the batches requested before
+            self._writer.write({key: value})
+
+        if self._cache is not None:
+            self._cache.update(((key, value),))
 
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
 
         :param key: key to delete
         """
-        self._db.delete(key)
+        if self._writer is None:
+            self._db.delete(key)
+        else:
+            self._writer.write({key: None})
+
+        if self._cache is not None:
+            self._cache.update(((key, None),))
+
+    def flush(self) -> None:
+        """Blocks until all the batches requested so far are written to LevelDB
+        """
+        if self._writer is not None:
+            self._writer.flush()
 
     def close(self) -> None:
         """Close the database.
+        The batches not written yet are written before closing.
         """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
         if self._db:
             self._db.close()
             self._db = None
 
+    def snapshot(self) -> 'DatabaseSnapshot':
+        """Returns a read-only view of the states written so far
+        including the batches not written to LevelDB yet
+        """
+        # The cache generation is taken first not to share the cache updated by a write in the meantime
+        cache_generation: int = 0 if self._cache is None else self._cache.generation
+        # Pending batches are taken before the snapshot not to miss the ones written in the meantime
+        pending_states: dict = {} if self._writer is None else self._writer.get_pending_states()
+        return DatabaseSnapshot(self._db.snapshot(), pending_states, self._cache, cache_generation)
+
     def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
         """Return a new prefixed database.
+        Read cache is not shared with the prefixed database.
 
         :param prefix: (bytes): prefix to use
         """
         return KeyValueDatabase(self._db.prefixed_db(prefix))
 
-    def iterator(self) -> iter:
-        return self._db.iterator()
+    def iterator(self, start: Optional[bytes]=None, stop: Optional[bytes]=None) -> iter:
+        """Returns an iterator over the key/value pairs in key order
+
+        :param start: the first key to iterate, inclusive
+        :param stop: the key to stop iterating at, exclusive
+        """
+        self.flush()
+        if start is None and stop is None:
+            return self._db.iterator()
+        return self._db.iterator(start=start, stop=stop)
 
     def write_batch(self, states: dict) -> None:
         """Write a batch to the database for the specified states dict.
@@ -117,12 +212,20 @@ class KeyValueDatabase(object):
         if states is None or len(states) == 0:
             return
 
-        with self._db.write_batch() as wb:
-            for key, value in states.items():
-                if value:
-                    wb.put(key, value)
-                else:
-                    wb.delete(key)
+        if self._writer is None:
+            with self._db.write_batch() as wb:
+                for key, value in states.items():
+                    if value:
+                        wb.put(key, value)
+                    else:
+                        wb.delete(key)
+        else:
+            self._writer.write(states)
+
+        if self._cache is not None:
+            # Empty value is deleted as well
+            self._cache.update(
+                (key, value if value else None) for key, value in states.items())
 
 
 class DatabaseObserver(object):
@@ -186,6 +289,9 @@ class ContextDatabase(object):
     Cache + LevelDB
     """
 
+    # Returned by get_uncommitted() when the key is not found in any batch
+    MISSING = object()
+
     def __init__(self, db: 'KeyValueDatabase', is_shared: bool=False) -> None:
         """Constructor
 
@@ -204,7 +310,9 @@ class ContextDatabase(object):
         """
         context_type = _get_context_type(context)
 
-        if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+        if context_type == IconScoreContextType.QUERY and context.db_snapshot is not None:
+            return context.db_snapshot.get(key)
+        elif context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
             return self.key_value_db.get(key)
         else:
             return self.get_from_batch(context, key)
@@ -217,13 +325,59 @@ class ContextDatabase(object):
         Search order
         1. TransactionBatch
         2. BlockBatch
-        3. StateDB
+        3. BlockBatches of uncommitted parent blocks
+        4. StateDB
 
         :param context:
         :param key:
 
         :return: a value for a given key
         """
+        value = self._get_from_batches(context, key)
+        if value is self.MISSING:
+            # get value from state_db
+            return self.get_from_state_db(context, key)
+
+        return value
+
+    def get_from_state_db(self, context: Optional['IconScoreContext'], key: bytes) -> Optional[bytes]:
+        """Returns a value for a given key from StateDB
+
+        The states prefetched for the block of the context are looked up first
+
+        :param context:
+        :param key:
+        :return: a value for a given key
+        """
+        prefetcher: Optional['StatePrefetcher'] = None if context is None else context.state_prefetcher
+        if prefetcher is not None:
+            value = prefetcher.get(key)
+            if value is not StatePrefetcher.MISSING:
+                return value
+
+        return self.key_value_db.get(key)
+
+    def get_uncommitted(self,
+                        context: Optional['IconScoreContext'],
+                        key: bytes) -> Optional[bytes]:
+        """Returns a value for a given key from the batches not committed yet
+
+        Search order
+        1. TransactionBatch
+        2. BlockBatch
+        3. BlockBatches of uncommitted parent blocks
+
+        :param context:
+        :param key:
+        :return: a value for a given key or ContextDatabase.MISSING if the key is not in any batch
+        """
+        context_type = _get_context_type(context)
+        if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+            return self.MISSING
+
+        return self._get_from_batches(context, key)
+
+    def _get_from_batches(self, context: 'IconScoreContext', key: bytes) -> Optional[bytes]:
         block_batch = context.block_batch
         tx_batch = context.tx_batch
 
@@ -231,12 +385,21 @@ class ContextDatabase(object):
         if key in tx_batch:
             return tx_batch[key]
 
+        if tx_batch.access_recorder is not None:
+            tx_batch.access_recorder.on_read(key, tx_batch.call_depth)
+
         # get value from block_batch
         if key in block_batch:
             return block_batch[key]
 
-        # get value from state_db
-        return self.key_value_db.get(key)
+        # get value from the block_batches of uncommitted parent blocks
+        block_batch = block_batch.parent
+        while block_batch is not None:
+            if key in block_batch:
+                return block_batch[key]
+            block_batch = block_batch.parent
+
+        return self.MISSING
 
     def put(self,
             context: Optional['IconScoreContext'],
@@ -297,8 +460,10 @@ class ContextDatabase(object):
 
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool=True) -> 'ContextDatabase':
-        db = KeyValueDatabase.from_path(path, create_if_missing)
+                  create_if_missing: bool=True,
+                  cache_size: int=0,
+                  async_write: bool=False) -> 'ContextDatabase':
+        db = KeyValueDatabase.from_path(path, create_if_missing, cache_size, async_write)
         return ContextDatabase(db)
 
 
@@ -32,19 +32,31 @@ class ContextDatabaseFactory(object):
     _state_db_root_path: str = None
     _mode: 'Mode' = Mode.SINGLE_DB
     _shared_context_db: 'ContextDatabase' = None
+    _cache_size: int = 0
+    _async_write: bool = False
 
     @classmethod
-    def open(cls, state_db_root_path: str, mode: 'Mode'):
+    def open(cls, state_db_root_path: str, mode: 'Mode', cache_size: int = 0, async_write: bool = False):
+        """
+
+        :param state_db_root_path:
+        :param mode:
+        :param cache_size: the maximum bytes of read cache for each db. 0 means no cache
+        :param async_write: if True, batches are written to each db by a dedicated writer thread
+        """
         cls.close()
 
         cls._state_db_root_path = state_db_root_path
         cls._mode = mode
+        cls._cache_size = cache_size
+        cls._async_write = async_write
 
     @classmethod
     def get_shared_db(cls) -> ContextDatabase:
         if cls._shared_context_db is None:
             path = os.path.join(cls._state_db_root_path, ICON_DEX_DB_NAME)
-            key_value_db = KeyValueDatabase.from_path(path)
+            key_value_db = KeyValueDatabase.from_path(
+                path, cache_size=cls._cache_size, async_write=cls._async_write)
             cls._shared_context_db = ContextDatabase(
                 key_value_db, is_shared=True)
 
@@ -63,7 +75,8 @@ class ContextDatabaseFactory(object):
             return cls.get_shared_db()
         else:
             path = os.path.join(cls._state_db_root_path, name)
-            return ContextDatabase.from_path(path)
+            return ContextDatabase.from_path(
+                path, cache_size=cls._cache_size, async_write=cls._async_write)
 
     @classmethod
     def close(cls):
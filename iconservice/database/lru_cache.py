@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Iterable, Tuple
+
+
+class LRUCache(object):
+    """Thread-safe LRU cache of committed key/value pairs
+    bounded by the total bytes of keys and values
+
+    None value means that the key does not exist in db.
+    """
+
+    # Returned by get() when the key is not cached
+    MISSING = object()
+
+    def __init__(self, max_size: int) -> None:
+        """Constructor
+
+        :param max_size: the maximum bytes of keys and values to keep
+        """
+        self._max_size = max_size
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        # Increased whenever db is written to discard values read before the write
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    def get(self, key: bytes, generation: Optional[int] = None) -> Optional[bytes]:
+        """Returns the cached value for a given key
+
+        :param key:
+        :param generation: if given, the value is returned only if db has not been written since then
+        :return: value or LRUCache.MISSING if the key is not cached
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return self.MISSING
+
+            value = self._entries.get(key, self.MISSING)
+            if value is self.MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+            return value
+
+    def put(self, key: bytes, value: Optional[bytes], generation: int) -> None:
+        """Caches a value read from db
+
+        :param key:
+        :param value:
+        :param generation: the generation taken before reading the value from db
+            If db has been written since then, the value is not cached
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._put(key, value)
+
+    def update(self, items: Iterable[Tuple[bytes, Optional[bytes]]]) -> None:
+        """Applies the key/value pairs written to db
+
+        :param items: (key, value) pairs. None value means the key was deleted
+        """
+        with self._lock:
+            for key, value in items:
+                self._put(key, value)
+
+            self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._generation += 1
+
+    def _put(self, key: bytes, value: Optional[bytes]) -> None:
+        old_value = self._entries.pop(key, self.MISSING)
+        if old_value is not self.MISSING:
+            self._size -= self._get_entry_size(key, old_value)
+
+        entry_size: int = self._get_entry_size(key, value)
+        if entry_size > self._max_size:
+            return
+
+        self._entries[key] = value
+        self._size += entry_size
+
+        while self._size > self._max_size:
+            old_key, old_value = self._entries.popitem(last=False)
+            self._size -= self._get_entry_size(old_key, old_value)
+            self.evictions += 1
+
+    @staticmethod
+    def _get_entry_size(key: bytes, value: Optional[bytes]) -> int:
+        return len(key) + (0 if value is None else len(value))
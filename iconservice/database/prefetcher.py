@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .db import KeyValueDatabase
+
+
+class StatePrefetcher(object):
+    """Block-scoped read cache of StateDB filled in the background
+
+    The keys which the transactions in a block are going to read are looked up in advance
+    while the transactions are executed, so that the execution does not wait for disk I/O.
+    StateDB is not written until the block is finished, so the prefetched values stay valid
+    until the prefetcher is cancelled at the end of the block.
+
+    None value means that the key does not exist in StateDB.
+    """
+
+    # Returned by get() when the key has not been prefetched yet
+    MISSING = object()
+
+    def __init__(self, db: 'KeyValueDatabase') -> None:
+        """Constructor
+
+        :param db: StateDB
+        """
+        self._db = db
+        self._states = {}
+        self._cancelled = False
+
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+
+    def start(self, executor: 'Executor', keys: Iterable[bytes]) -> None:
+        """Reads the states of keys on executor
+
+        :param executor: runs the prefetch in the background
+        :param keys: the keys to prefetch
+        """
+        # Sorted to read LevelDB in key order
+        executor.submit(self._prefetch, sorted(set(keys)))
+
+    def _prefetch(self, keys: list) -> None:
+        for key in keys:
+            if self._cancelled:
+                return
+            if key not in self._states:
+                self._states[key] = self._db.get(key)
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Returns a prefetched value
+
+        :param key:
+        :return: value or StatePrefetcher.MISSING if the key has not been prefetched
+        """
+        value = self._states.get(key, self.MISSING)
+        if value is self.MISSING:
+            self.miss_count += 1
+        else:
+            self.hit_count += 1
+        return value
+
+    def cancel(self) -> None:
+        """Stops prefetching. It should be called when the block is finished
+        """
+        self._cancelled = True
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
+from .lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    import plyvel
+    from ..base.block import Block
+    from .db import KeyValueDatabase
+
+
+class DatabaseSnapshot(object):
+    """Read-only view of the states in a KeyValueDatabase at a point of time
+
+    It consists of a LevelDB snapshot and the batches which were not written to LevelDB yet
+    by AsyncBatchWriter when the snapshot was taken.
+    The read cache of the KeyValueDatabase is shared as long as nothing has been written since then.
+    """
+
+    _MISSING = object()
+
+    def __init__(self,
+                 snapshot: 'plyvel.Snapshot',
+                 pending_states: dict,
+                 cache: Optional['LRUCache'] = None,
+                 cache_generation: int = 0) -> None:
+        """Constructor
+
+        :param snapshot: LevelDB snapshot
+        :param pending_states: the states not written yet. None value means that the key is deleted
+        :param cache: read cache of the KeyValueDatabase
+        :param cache_generation: the generation of cache taken before the snapshot
+        """
+        self._snapshot = snapshot
+        self._pending_states = pending_states
+        self._cache = cache
+        self._cache_generation = cache_generation
+
+        # The block whose states are in the snapshot
+        self.block: Optional['Block'] = None
+        self.ref_count: int = 0
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        cache = self._cache
+        if cache is not None:
+            # The cache holds the same states as the snapshot until db is written
+            value = cache.get(key, self._cache_generation)
+            if value is not LRUCache.MISSING:
+                return value
+
+        value = self._pending_states.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = self._snapshot.get(key)
+
+        if cache is not None:
+            cache.put(key, value, self._cache_generation)
+
+        return value
+
+    def record(self, key: bytes) -> None:
+        """Called when the state of key is read from a cache kept out of the snapshot
+
+        :param key: the key whose state has been read
+        """
+        pass
+
+    def close(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+            self._pending_states = None
+
+
+class SnapshotManager(object):
+    """Keeps the snapshot of the last committed block for queries
+
+    A query acquires the latest snapshot and releases it when finished,
+    so that it sees the same states even if a block is committed in the meantime.
+    A snapshot is closed when it is released by the last query after a newer block is committed.
+    """
+
+    def __init__(self, db: 'KeyValueDatabase') -> None:
+        self._db = db
+        self._lock = Lock()
+        self._latest: Optional['DatabaseSnapshot'] = None
+
+        self.open_count: int = 0
+
+    def update(self, block: Optional['Block']) -> None:
+        """Takes a new snapshot after the states of a block are committed
+
+        :param block: the last committed block
+        """
+        snapshot: 'DatabaseSnapshot' = self._db.snapshot()
+        snapshot.block = block
+        # Held by the manager until a newer one is taken
+        snapshot.ref_count = 1
+
+        with self._lock:
+            old, self._latest = self._latest, snapshot
+            self.open_count += 1
+            if old is not None:
+                self._release(old)
+
+    def acquire(self) -> Optional['DatabaseSnapshot']:
+        """Returns the latest snapshot which must be released after use
+
+        :return: None if no snapshot has been taken
+        """
+        with self._lock:
+            snapshot: Optional['DatabaseSnapshot'] = self._latest
+            if snapshot is not None:
+                snapshot.ref_count += 1
+            return snapshot
+
+    def release(self, snapshot: 'DatabaseSnapshot') -> None:
+        with self._lock:
+            self._release(snapshot)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._latest is not None:
+                self._release(self._latest)
+                self._latest = None
+
+    def _release(self, snapshot: 'DatabaseSnapshot') -> None:
+        snapshot.ref_count -= 1
+        if snapshot.ref_count == 0:
+            snapshot.close()
+            self.open_count -= 1
@@ -15,17 +15,23 @@
 
 import json
 import warnings
+from copy import copy
 from struct import pack, unpack
-from typing import TYPE_CHECKING, Optional, Tuple
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
 from . import DeployType, DeployState
 from ..base.address import Address, ICON_EOA_ADDRESS_BYTES_SIZE, ICON_CONTRACT_ADDRESS_BYTES_SIZE
 from ..base.exception import InvalidParamsException, AccessDeniedException
+from ..database.db import ContextDatabase
 from ..icon_constant import DEFAULT_BYTE_SIZE, REVISION_2, ZERO_TX_HASH
+from ..iconscore.icon_score_context import IconScoreContextType
 
 if TYPE_CHECKING:
     from ..iconscore.icon_score_context import IconScoreContext
-    from ..database.db import ContextDatabase
+    from ..base.block import Block
+    from ..database.batch import BlockBatch
+    from ..database.snapshot import DatabaseSnapshot
 
 
 class IconScoreDeployTXParams(object):
@@ -188,6 +194,10 @@ class IconScoreDeployInfo(object):
 
 class IconScoreDeployStorage(object):
     """Store deploy_int and tx_params on LevelDB.
+
+    The deploy info in the committed state is kept decoded
+    so that it is not read from LevelDB and decoded whenever a SCORE is called.
+    The deploy info returned by get_deploy_info() must not be modified.
     """
 
     _DEPLOY_STORAGE_PREFIX = b'isds|'
@@ -202,6 +212,18 @@ class IconScoreDeployStorage(object):
         super().__init__()
         self._db = db
 
+        # score_address: IconScoreDeployInfo in the committed state
+        self._committed_deploy_infos: Dict['Address', 'IconScoreDeployInfo'] = {}
+        self._lock = Lock()
+        # Increased whenever the committed state is written to discard deploy info read before the write
+        self._generation = 0
+        # The hash of the block whose states are kept in _committed_deploy_infos
+        # None if the committed state has been written without a block
+        self._block_hash: Optional[bytes] = None
+
+        self.hit_count = 0
+        self.miss_count = 0
+
     def put_deploy_info_and_tx_params(self,
                                       context: 'IconScoreContext',
                                       score_address: 'Address',
@@ -217,7 +239,7 @@ class IconScoreDeployStorage(object):
         tx_params = IconScoreDeployTXParams(tx_hash, deploy_type, score_address, deploy_data)
         self.put_deploy_tx_params(context, tx_params)
 
-        deploy_info = self.get_deploy_info(context, score_address)
+        deploy_info = self._get_deploy_info_to_update(context, score_address)
         if deploy_info is None:
             # SCORE install case
             deploy_info = IconScoreDeployInfo(
@@ -241,7 +263,7 @@ class IconScoreDeployStorage(object):
                           score_address: 'Address',
                           tx_hash: bytes) -> None:
 
-        deploy_info = self.get_deploy_info(context, score_address)
+        deploy_info = self._get_deploy_info_to_update(context, score_address)
         if deploy_info is None:
             raise InvalidParamsException(f'deploy_info is None: {score_address}')
 
@@ -268,21 +290,115 @@ class IconScoreDeployStorage(object):
         :param deploy_info:
         :return:
         """
-        key: bytes = self._create_db_key(
-            self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX, deploy_info.score_address.to_bytes())
+        key: bytes = self.get_deploy_info_key(deploy_info.score_address)
         value: bytes = deploy_info.to_bytes()
 
         self._db.put(context, key, value)
 
+        # The deploy info in the committed state is overwritten on DIRECT context
+        is_direct: bool = context is None or context.type == IconScoreContextType.DIRECT
+        self._discard_committed_deploy_infos((deploy_info.score_address,), keep_block_hash=not is_direct)
+
     def get_deploy_info(self, context: Optional['IconScoreContext'], score_address: 'Address') \
             -> Optional['IconScoreDeployInfo']:
 
-        data: bytes = self._db.get(context, self._create_db_key(
-            self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX, score_address.to_bytes()))
+        key: bytes = self.get_deploy_info_key(score_address)
+
+        # The deploy info changed in the transaction, the block or its uncommitted parents
+        data: Optional[bytes] = self._db.get_uncommitted(context, key)
+        if data is not ContextDatabase.MISSING:
+            if data is None:
+                return None
+            return IconScoreDeployInfo.from_bytes(data)
+
+        return self._get_committed_deploy_info(context, key, score_address)
+
+    def _get_committed_deploy_info(self,
+                                   context: Optional['IconScoreContext'],
+                                   key: bytes,
+                                   score_address: 'Address') -> Optional['IconScoreDeployInfo']:
+        snapshot: Optional['DatabaseSnapshot'] = None if context is None else context.db_snapshot
+
+        with self._lock:
+            # The committed state kept here can be newer than the snapshot of a query
+            is_latest: bool = snapshot is None or \
+                (snapshot.block is not None and snapshot.block.hash == self._block_hash)
+            deploy_info: Optional['IconScoreDeployInfo'] = \
+                self._committed_deploy_infos.get(score_address) if is_latest else None
+            generation: int = self._generation
+
+        if deploy_info is not None:
+            self.hit_count += 1
+            if snapshot is not None:
+                # The query depends on the deploy info as if it read the snapshot
+                snapshot.record(key)
+            return deploy_info
+
+        self.miss_count += 1
+
+        if snapshot is None:
+            data: Optional[bytes] = self._db.get_from_state_db(context, key)
+        else:
+            data: Optional[bytes] = self._db.get(context, key)
         if data is None:
+            # Unknown addresses are not kept not to be filled up with them
             return None
 
-        return IconScoreDeployInfo.from_bytes(data)
+        deploy_info = IconScoreDeployInfo.from_bytes(data)
+        if is_latest:
+            with self._lock:
+                if generation == self._generation:
+                    self._committed_deploy_infos[score_address] = deploy_info
+
+        return deploy_info
+
+    def _get_deploy_info_to_update(self,
+                                   context: 'IconScoreContext',
+                                   score_address: 'Address') -> Optional['IconScoreDeployInfo']:
+        deploy_info: Optional['IconScoreDeployInfo'] = self.get_deploy_info(context, score_address)
+        if deploy_info is None:
+            return None
+
+        # The deploy info kept in the committed state is not modified
+        return copy(deploy_info)
+
+    def on_block_committed(self, block_batch: 'BlockBatch') -> None:
+        """Discards the deploy info changed by the committed block
+
+        :param block_batch: the states written to LevelDB
+        """
+        prefix: bytes = self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX
+        prefix_size: int = len(prefix)
+
+        score_addresses = [
+            Address.from_bytes(key[prefix_size:]) for key in block_batch if key.startswith(prefix)]
+        self._discard_committed_deploy_infos(score_addresses, block_batch.block.hash)
+
+    def set_committed_block(self, block: Optional['Block']) -> None:
+        """Marks the committed state as the states of block, e.g. when it is loaded on startup
+
+        :param block: the last committed block
+        """
+        with self._lock:
+            self._block_hash = None if block is None else block.hash
+
+    def _discard_committed_deploy_infos(self,
+                                        score_addresses: Iterable['Address'],
+                                        block_hash: Optional[bytes] = None,
+                                        keep_block_hash: bool = False) -> None:
+        """
+
+        :param score_addresses: the SCOREs whose deploy info has been changed
+        :param block_hash: the hash of the block whose states are kept after the change
+        :param keep_block_hash: the committed state is not changed, so block_hash is ignored
+        """
+        with self._lock:
+            for score_address in score_addresses:
+                self._committed_deploy_infos.pop(score_address, None)
+
+            self._generation += 1
+            if not keep_block_hash:
+                self._block_hash = block_hash
 
     def put_deploy_tx_params(self, context: 'IconScoreContext', deploy_tx_params: 'IconScoreDeployTXParams') -> None:
         """
@@ -323,6 +439,9 @@ class IconScoreDeployStorage(object):
     def _create_db_key(prefix: bytes, src_key: bytes) -> bytes:
         return prefix + src_key
 
+    def get_deploy_info_key(self, score_address: 'Address') -> bytes:
+        return self._create_db_key(self._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX, score_address.to_bytes())
+
     def get_tx_hashes_by_score_address(self,
                                        context: 'IconScoreContext',
                                        score_address: 'Address') -> Tuple[Optional[bytes], Optional[bytes]]:
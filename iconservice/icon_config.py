@@ -24,6 +24,15 @@ default_icon_config = {
     ConfigKey.AMQP_KEY: "7100",
     ConfigKey.AMQP_TARGET: "127.0.0.1",
     ConfigKey.BUILTIN_SCORE_OWNER: "hxebf3a409845cd09dcb5af31ed5be5e34e2af9433",
+    ConfigKey.OPTIMISTIC_INVOKE_WORKERS: 0,
+    ConfigKey.QUERY_WORKERS: 1,
+    ConfigKey.QUERY_CACHE_SIZE: 0,
+    ConfigKey.PREFETCH_STATE: False,
+    ConfigKey.TRACK_KEY_ACCESS: False,
+    ConfigKey.STATE_DB_CACHE_SIZE: 64 * 1024 * 1024,
+    ConfigKey.ASYNC_COMMIT: False,
+    ConfigKey.EVENT_LOG_INDEX: False,
+    ConfigKey.TX_RESULT_STORE: False,
     ConfigKey.SERVICE: {
         ConfigKey.SERVICE_FEE: False,
         ConfigKey.SERVICE_AUDIT: False,
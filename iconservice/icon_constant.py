@@ -40,6 +40,8 @@ MAX_EXTERNAL_CALL_COUNT = 1 + 1024
 MAX_CALL_STACK_SIZE = 64
 
 ICON_DEX_DB_NAME = 'icon_dex'
+ICON_EVENT_LOG_INDEX_DB_NAME = 'event_log_index'
+ICON_TX_RESULT_STORE_NAME = 'tx_result_store'
 PACKAGE_JSON_FILE = 'package.json'
 
 ICX_TRANSFER_EVENT_LOG = 'ICXTransfer(Address,Address,int)'
@@ -74,6 +76,15 @@ class ConfigKey:
     AMQP_TARGET = 'amqpTarget'
     CONFIG = 'config'
     TBEARS_MODE = 'tbearsMode'
+    OPTIMISTIC_INVOKE_WORKERS = 'optimisticInvokeWorkers'
+    TRACK_KEY_ACCESS = 'trackKeyAccess'
+    STATE_DB_CACHE_SIZE = 'stateDbCacheSize'
+    ASYNC_COMMIT = 'asyncCommit'
+    EVENT_LOG_INDEX = 'eventLogIndex'
+    TX_RESULT_STORE = 'txResultStore'
+    QUERY_WORKERS = 'queryWorkers'
+    QUERY_CACHE_SIZE = 'queryCacheSize'
+    PREFETCH_STATE = 'prefetchState'
 
 
 class EnableThreadFlag(IntFlag):
@@ -24,9 +24,10 @@ from iconservice.base.block import Block
 from iconservice.base.exception import ExceptionCode, IconServiceBaseException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.icon_constant import ICON_INNER_LOG_TAG, ICON_SERVICE_LOG_TAG, \
-    EnableThreadFlag, ENABLE_THREAD_FLAG
+    EnableThreadFlag, ENABLE_THREAD_FLAG, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
-from iconservice.utils import check_error_response, to_camel_case
+from iconservice.iconscore.icon_score_result import TransactionResultSerializer
+from iconservice.utils import check_error_response
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
@@ -45,8 +46,10 @@ class IconScoreInnerTask(object):
         self._icon_service_engine = IconServiceEngine()
         self._open()
 
+        # Queries run concurrently on the snapshot of the last committed block
+        query_workers: int = max(self._conf.get(ConfigKey.QUERY_WORKERS, 1), 1)
         self._thread_pool = {THREAD_INVOKE: ThreadPoolExecutor(1),
-                             THREAD_QUERY: ThreadPoolExecutor(1),
+                             THREAD_QUERY: ThreadPoolExecutor(query_workers),
                              THREAD_VALIDATE: ThreadPoolExecutor(1)}
 
     def _open(self):
@@ -103,13 +106,14 @@ class IconScoreInnerTask(object):
             tx_results, state_root_hash = self._icon_service_engine.invoke(
                 block=block, tx_requests=converted_tx_requests)
 
+            # tx_results are serialized into the response format directly
+            serializer = TransactionResultSerializer()
             convert_tx_results = \
-                {bytes.hex(tx_result.tx_hash): tx_result.to_dict(to_camel_case) for tx_result in tx_results}
-            results = {
+                {bytes.hex(tx_result.tx_hash): serializer.serialize(tx_result) for tx_result in tx_results}
+            response = {
                 'txResults': convert_tx_results,
                 'stateRootHash': bytes.hex(state_root_hash)
             }
-            response = MakeResponse.make_response(results)
         except IconServiceBaseException as icon_e:
             self._log_exception(icon_e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(icon_e.code, icon_e.message)
@@ -14,7 +14,10 @@
 # limitations under the License.
 
 import os
-from typing import TYPE_CHECKING, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, List, Any, Optional, Dict
 
 from iconcommons.logger import Logger
 
@@ -22,16 +25,19 @@ from .base.address import Address, generate_score_address, generate_score_addres
 from .base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
 from .base.block import Block
 from .base.exception import ExceptionCode, IconServiceBaseException, ScoreNotFoundException, \
-    AccessDeniedException, IconScoreException
+    AccessDeniedException, IconScoreException, InvalidParamsException, InvalidRequestException
 from .base.message import Message
 from .base.transaction import Transaction
-from .database.batch import BlockBatch, TransactionBatch
+from .database.batch import BlockBatch, TransactionBatch, KeyAccessRecorder
 from .database.factory import ContextDatabaseFactory
+from .database.prefetcher import StatePrefetcher
+from .database.snapshot import DatabaseSnapshot, SnapshotManager
 from .deploy.icon_builtin_score_loader import IconBuiltinScoreLoader
 from .deploy.icon_score_deploy_engine import IconScoreDeployEngine
 from .deploy.icon_score_deploy_storage import IconScoreDeployStorage
-from .icon_constant import ICON_DEX_DB_NAME, ICON_SERVICE_LOG_TAG, IconServiceFlag, ConfigKey, \
-    REVISION_3
+from .icon_constant import ICON_DEX_DB_NAME, ICON_EVENT_LOG_INDEX_DB_NAME, ICON_SERVICE_LOG_TAG, \
+    ICON_TX_RESULT_STORE_NAME, IconServiceFlag, ConfigKey, REVISION_3
+from .iconscore.governance_snapshot import GovernanceSnapshot
 from .iconscore.icon_pre_validator import IconPreValidator
 from .iconscore.icon_score_class_loader import IconScoreClassLoader
 from .iconscore.icon_score_context import IconScoreContext, IconScoreFuncType, ContextContainer
@@ -39,22 +45,28 @@ from .iconscore.icon_score_context import IconScoreContextType
 from .iconscore.icon_score_context_util import IconScoreContextUtil
 from .iconscore.icon_score_engine import IconScoreEngine
 from .iconscore.icon_score_event_log import EventLogEmitter
+from .iconscore.icon_score_event_log_index import EventLogIndex
 from .iconscore.icon_score_mapper import IconScoreMapper
 from .iconscore.icon_score_result import TransactionResult
+from .iconscore.icon_score_result_store import TransactionResultStore
 from .iconscore.icon_score_step import IconScoreStepCounterFactory, StepType, get_input_data_size, \
     get_deploy_content_size
 from .iconscore.icon_score_trace import Trace, TraceType
 from .icx.icx_account import AccountType
 from .icx.icx_engine import IcxEngine
 from .icx.icx_storage import IcxStorage
+from .optimistic_executor import OptimisticExecutor, ReadRecordingBlockBatch, SpeculativeResult
 from .precommit_data_manager import PrecommitData, PrecommitDataManager, PrecommitFlag
+from .query_result_cache import QueryResultCache
 from .utils import sha3_256, int_to_bytes
 from .utils import to_camel_case
-from .utils.bloom import BloomFilter
+from .utils.bloom import BloomFilter, get_bloom_mask
 
 if TYPE_CHECKING:
     from .iconscore.icon_score_event_log import EventLog
     from .builtin_scores.governance.governance import Governance
+    from .icx.icx_account import Account
+    from .optimistic_executor import Speculation
     from iconcommons.icon_config import IconConfig
 
 
@@ -76,6 +88,13 @@ class IconServiceEngine(ContextContainer):
         self._icon_score_deploy_engine = None
         self._step_counter_factory = None
         self._icon_pre_validator = None
+        self._optimistic_executor: Optional['OptimisticExecutor'] = None
+        self._track_key_access = False
+        self._event_log_index: Optional['EventLogIndex'] = None
+        self._tx_result_store: Optional['TransactionResultStore'] = None
+        self._snapshot_manager: Optional['SnapshotManager'] = None
+        self._query_result_cache: Optional['QueryResultCache'] = None
+        self._prefetch_executor: Optional['ThreadPoolExecutor'] = None
 
         # JSON-RPC handlers
         self._handlers = {
@@ -85,7 +104,9 @@ class IconServiceEngine(ContextContainer):
             'icx_sendTransaction': self._handle_icx_send_transaction,
             'debug_estimateStep': self._handle_estimate_step,
             'icx_getScoreApi': self._handle_icx_get_score_api,
-            'ise_getStatus': self._handle_ise_get_status
+            'ise_getStatus': self._handle_ise_get_status,
+            'ise_getEventLogs': self._handle_ise_get_event_logs,
+            'ise_getTransactionResult': self._handle_ise_get_transaction_result
         }
 
         self._precommit_data_manager = PrecommitDataManager()
@@ -105,9 +126,12 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(score_root_path, exist_ok=True)
         os.makedirs(state_db_root_path, exist_ok=True)
 
+        state_db_cache_size: int = self._conf.get(ConfigKey.STATE_DB_CACHE_SIZE, 0)
+        async_commit: bool = self._conf.get(ConfigKey.ASYNC_COMMIT, False)
+
         # Share one context db with all SCOREs
         ContextDatabaseFactory.open(
-            state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+            state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB, state_db_cache_size, async_commit)
 
         self._icx_engine = IcxEngine()
         self._icon_score_deploy_engine = IconScoreDeployEngine()
@@ -136,6 +160,32 @@ class IconServiceEngine(ContextContainer):
 
         self._precommit_data_manager.last_block = self._icx_storage.last_block
 
+        self._icon_score_deploy_engine.icon_deploy_storage.set_committed_block(self._icx_storage.last_block)
+        self._snapshot_manager = SnapshotManager(self._icx_context_db.key_value_db)
+        self._snapshot_manager.update(self._icx_storage.last_block)
+
+        self._track_key_access: bool = self._conf.get(ConfigKey.TRACK_KEY_ACCESS, False)
+
+        optimistic_invoke_workers: int = self._conf.get(ConfigKey.OPTIMISTIC_INVOKE_WORKERS, 0)
+        if optimistic_invoke_workers > 0:
+            self._optimistic_executor = OptimisticExecutor(optimistic_invoke_workers)
+
+        if self._conf.get(ConfigKey.PREFETCH_STATE, False):
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='StatePrefetcher')
+
+        if self._conf.get(ConfigKey.EVENT_LOG_INDEX, False):
+            self._event_log_index = EventLogIndex.from_path(
+                os.path.join(state_db_root_path, ICON_EVENT_LOG_INDEX_DB_NAME))
+
+        if self._conf.get(ConfigKey.TX_RESULT_STORE, False):
+            self._tx_result_store = TransactionResultStore.from_path(
+                os.path.join(state_db_root_path, ICON_TX_RESULT_STORE_NAME))
+            self._tx_result_store.check_last_block(self._icx_storage.last_block)
+
+        query_cache_size: int = self._conf.get(ConfigKey.QUERY_CACHE_SIZE, 0)
+        if query_cache_size > 0:
+            self._query_result_cache = QueryResultCache(query_cache_size, self._icx_storage.last_block)
+
     @staticmethod
     def _make_service_flag(flag_table: dict) -> int:
         make_flag = 0
@@ -251,6 +301,28 @@ class IconServiceEngine(ContextContainer):
         """Free all resources occupied by IconServiceEngine
         including db, memory and so on
         """
+        if self._optimistic_executor is not None:
+            self._optimistic_executor.close()
+            self._optimistic_executor = None
+
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True)
+            self._prefetch_executor = None
+
+        if self._event_log_index is not None:
+            self._event_log_index.close()
+            self._event_log_index = None
+
+        if self._tx_result_store is not None:
+            self._tx_result_store.close()
+            self._tx_result_store = None
+
+        if self._snapshot_manager is not None:
+            self._snapshot_manager.close()
+            self._snapshot_manager = None
+
+        self._query_result_cache = None
+
         context = IconScoreContext(IconScoreContextType.DIRECT)
         try:
             self._push_context(context)
@@ -286,13 +358,25 @@ class IconServiceEngine(ContextContainer):
         # Check for block validation before invoke
         self._precommit_data_manager.validate_block_to_invoke(block)
 
+        self._icx_storage.clear_decoded_accounts()
+
+        # The block can be invoked on top of an uncommitted parent block
+        ancestors: list = self._precommit_data_manager.get_ancestors(block)
+        parent_block_batch: Optional['BlockBatch'] = ancestors[-1].block_batch if ancestors else None
+
         context = IconScoreContext(IconScoreContextType.INVOKE)
         context.step_counter = self._step_counter_factory.create(IconScoreContextType.INVOKE)
         context.block = block
-        context.block_batch = BlockBatch(Block.from_block(block))
+        context.block_batch = BlockBatch(Block.from_block(block), parent_block_batch)
         context.tx_batch = TransactionBatch()
-        context.new_icon_score_mapper = IconScoreMapper()
+        context.new_icon_score_mapper = self._create_new_icon_score_mapper(ancestors)
         self._set_revision_to_context(context)
+
+        if ancestors and context.revision < REVISION_3:
+            # The balance of a sender was checked against StateDB before REVISION_3
+            raise InvalidParamsException(
+                f'Failed to invoke a block on top of an uncommitted block: '
+                f'revision({context.revision}) block_to_invoke({block})')
         block_result = []
         precommit_flag = PrecommitFlag.NONE
 
@@ -303,15 +387,50 @@ class IconServiceEngine(ContextContainer):
             context.block_batch.update(context.tx_batch)
             context.tx_batch.clear()
         else:
-            for index, tx_request in enumerate(tx_requests):
-                tx_result = self._invoke_request(context, tx_request, index)
-                block_result.append(tx_result)
-                context.block_batch.update(context.tx_batch)
-                context.tx_batch.clear()
-                self._update_revision_if_necessary(context, tx_result)
-                tx_precommit_flag = self._generate_precommit_flag(tx_result)
-                self._update_step_properties_if_necessary(context, tx_precommit_flag)
-                precommit_flag |= tx_precommit_flag
+            # StateDB is read in the background while the transactions are executed
+            context.state_prefetcher = self._prefetch_states(tx_requests)
+            # The results read from the governance SCORE are reused until it is changed
+            context.governance_snapshot = GovernanceSnapshot()
+            speculation: Optional['Speculation'] = self._speculate(context, tx_requests, ancestors)
+            try:
+                for index, tx_request in enumerate(tx_requests):
+                    tx_result = None
+                    if speculation is not None:
+                        tx_result = self._merge_speculative_result(context, speculation, index)
+                    if tx_result is None:
+                        tx_result = self._invoke_request(context, tx_request, index)
+
+                    block_result.append(tx_result)
+                    context.block_batch.update(context.tx_batch)
+                    context.governance_snapshot.on_transaction_finished(context.tx_batch, tx_result.to)
+                    context.tx_batch.clear()
+                    self._update_revision_if_necessary(context, tx_result)
+                    tx_precommit_flag = self._generate_precommit_flag(tx_result)
+                    self._update_step_properties_if_necessary(context, tx_precommit_flag)
+                    precommit_flag |= tx_precommit_flag
+
+                    if speculation is not None and tx_precommit_flag != PrecommitFlag.NONE:
+                        # The revision and STEP properties which all speculative results
+                        # depend on can be changed. The rest of the block is executed serially
+                        speculation.cancel()
+                        speculation = None
+            finally:
+                if context.state_prefetcher is not None:
+                    context.state_prefetcher.cancel()
+                    Logger.debug(
+                        f'State prefetch: hit({context.state_prefetcher.hit_count}) '
+                        f'miss({context.state_prefetcher.miss_count})',
+                        ICON_SERVICE_LOG_TAG)
+                if speculation is not None:
+                    speculation.cancel()
+                    Logger.debug(
+                        f'Optimistic invoke: hit({speculation.hit_count}) '
+                        f'conflict({speculation.conflict_count})',
+                        ICON_SERVICE_LOG_TAG)
+                Logger.debug(
+                    f'Governance snapshot: hit({context.governance_snapshot.hit_count}) '
+                    f'miss({context.governance_snapshot.miss_count})',
+                    ICON_SERVICE_LOG_TAG)
 
         # Save precommit data
         # It will be written to levelDB on commit
@@ -321,6 +440,136 @@ class IconServiceEngine(ContextContainer):
 
         return block_result, precommit_data.state_root_hash
 
+    def _prefetch_states(self, tx_requests: list) -> Optional['StatePrefetcher']:
+        """Starts to read the states of StateDB which the transactions in a block are going to read
+
+        The accounts of senders and recipients, the deploy info of SCOREs,
+        the fee treasury and the governance SCORE are prefetched.
+
+        :param tx_requests: transactions in the block
+        :return: StatePrefetcher or None if prefetch is disabled
+        """
+        if self._prefetch_executor is None:
+            return None
+
+        deploy_storage: 'IconScoreDeployStorage' = self._icon_score_deploy_engine.icon_deploy_storage
+        keys = [deploy_storage.get_deploy_info_key(GOVERNANCE_SCORE_ADDRESS)]
+        if self._icx_engine.fee_treasury_address is not None:
+            keys.append(self._icx_engine.fee_treasury_address.to_bytes())
+
+        for tx_request in tx_requests:
+            params: dict = tx_request['params']
+            for address in (params.get('from'), params.get('to')):
+                if not isinstance(address, Address):
+                    continue
+
+                keys.append(address.to_bytes())
+                if address.is_contract:
+                    keys.append(deploy_storage.get_deploy_info_key(address))
+
+        prefetcher = StatePrefetcher(self._icx_context_db.key_value_db)
+        prefetcher.start(self._prefetch_executor, keys)
+        return prefetcher
+
+    @staticmethod
+    def _create_new_icon_score_mapper(ancestors: list) -> 'IconScoreMapper':
+        """Creates the mapper of SCOREs deployed in a block
+        including the ones deployed in its uncommitted ancestors
+
+        :param ancestors: precommit data of uncommitted ancestors from the oldest one
+        :return: IconScoreMapper
+        """
+        new_icon_score_mapper = IconScoreMapper()
+        for precommit_data in ancestors:
+            if precommit_data.score_mapper:
+                new_icon_score_mapper.update(precommit_data.score_mapper)
+
+        return new_icon_score_mapper
+
+    def _speculate(self,
+                   context: 'IconScoreContext',
+                   tx_requests: list,
+                   ancestors: list) -> Optional['Speculation']:
+        """Start executing the transactions in a block concurrently
+        against the state of the block start
+
+        Transactions heading for governance and deploy transactions are always executed serially.
+        Before REVISION_3, SCORE instances are shared among transactions
+        so that they cannot be executed concurrently.
+
+        :param context: invoke context of the block
+        :param tx_requests: transactions in the block
+        :param ancestors: precommit data of uncommitted ancestors from the oldest one
+        :return: Speculation or None if optimistic invoke is not available
+        """
+        if self._optimistic_executor is None or context.revision < REVISION_3:
+            return None
+
+        jobs = {}
+        for index, tx_request in enumerate(tx_requests):
+            params: dict = tx_request['params']
+            if params.get('to') == GOVERNANCE_SCORE_ADDRESS or params.get('dataType') == 'deploy':
+                continue
+
+            speculative_context = IconScoreContext(IconScoreContextType.INVOKE)
+            speculative_context.step_counter = \
+                self._step_counter_factory.create(IconScoreContextType.INVOKE)
+            speculative_context.block = context.block
+            speculative_context.block_batch = \
+                ReadRecordingBlockBatch(context.block_batch.block, context.block_batch.parent)
+            speculative_context.tx_batch = TransactionBatch()
+            speculative_context.new_icon_score_mapper = self._create_new_icon_score_mapper(ancestors)
+            speculative_context.revision = context.revision
+            speculative_context.deferred_fee = 0
+            speculative_context.state_prefetcher = context.state_prefetcher
+
+            jobs[index] = partial(self._invoke_speculatively, speculative_context, tx_request, index)
+
+        return self._optimistic_executor.execute(jobs)
+
+    def _invoke_speculatively(self,
+                              context: 'IconScoreContext',
+                              request: dict,
+                              index: int) -> 'SpeculativeResult':
+        """Invoke a transaction request on a speculative context
+
+        :param context: speculative context created by _speculate()
+        :param request:
+        :param index:
+        :return: SpeculativeResult
+        """
+        tx_result = self._invoke_request(context, request, index)
+        return SpeculativeResult(
+            tx_result, context.tx_batch, context.block_batch.read_keys, context.deferred_fee)
+
+    def _merge_speculative_result(self,
+                                  context: 'IconScoreContext',
+                                  speculation: 'Speculation',
+                                  index: int) -> Optional['TransactionResult']:
+        """Apply the speculative result of a transaction to context.tx_batch
+        if it does not conflict with the previous transactions in the block
+
+        :param context: invoke context of the block
+        :param speculation: speculation started by _speculate()
+        :param index: transaction index in the block
+        :return: transaction result or None if the transaction should be executed serially
+        """
+        result: Optional['SpeculativeResult'] = speculation.take(index, context.block_batch)
+        if result is None:
+            return None
+
+        tx_result: 'TransactionResult' = result.tx_result
+
+        # Keys touched on merge are recorded as the serial execution does
+        context.tx_batch.access_recorder = tx_result.key_access
+        context.tx_batch.update(result.tx_batch)
+        self._icx_engine.deposit_fee(context, result.deferred_fee)
+
+        context.cumulative_step_used += tx_result.step_used
+        tx_result.cumulative_step_used = context.cumulative_step_used
+
+        return tx_result
+
     def _update_revision_if_necessary(self, context, tx_result):
         """
         Updates the revision code of given context if governance or its states has been updated
@@ -473,7 +722,16 @@ class IconServiceEngine(ContextContainer):
         context.msg_stack.clear()
         context.event_log_stack.clear()
 
-        return self._call(context, method, params)
+        if not self._track_key_access:
+            if self._is_icx_transfer(method, params):
+                return self._invoke_icx_transfer(context, params)
+            return self._call(context, method, params)
+
+        context.tx_batch.access_recorder = KeyAccessRecorder()
+        tx_result = self._call(context, method, params)
+        tx_result.key_access = context.tx_batch.access_recorder
+
+        return tx_result
 
     def _estimate_step_by_request(self, request, context) -> int:
         """Calculates simply and estimates step with request data.
@@ -582,13 +840,34 @@ class IconServiceEngine(ContextContainer):
         * icx_getBalance
         * icx_getTotalSupply
         * icx_call
+        * ise_getEventLogs
+        * ise_getTransactionResult
 
         :param method:
         :param params:
         :return: the result of query
         """
+        # Pins the query to the states of the last committed block while other blocks are committed
+        snapshot: Optional['DatabaseSnapshot'] = self._snapshot_manager.acquire()
+        try:
+            cache: Optional['QueryResultCache'] = self._query_result_cache
+            if cache is None or snapshot is None or not cache.is_cacheable(method):
+                ret = self._query(snapshot, method, params)
+            else:
+                ret = cache.query(snapshot, method, params, self._query)
+        finally:
+            if snapshot is not None:
+                self._snapshot_manager.release(snapshot)
+
+        return ret
+
+    def _query(self, snapshot: Optional['DatabaseSnapshot'], method: str, params: dict) -> Any:
         context = IconScoreContext(IconScoreContextType.QUERY)
-        context.block = self._icx_storage.last_block
+        if snapshot is None:
+            context.block = self._icx_storage.last_block
+        else:
+            context.db_snapshot = snapshot
+            context.block = snapshot.block
         context.step_counter = self._step_counter_factory.create(IconScoreContextType.QUERY)
         self._set_revision_to_context(context)
         step_limit: int = context.step_counter.max_step_limit
@@ -601,9 +880,7 @@ class IconServiceEngine(ContextContainer):
         context.traces: List['Trace'] = []
         context.step_counter.reset(step_limit)
 
-        ret = self._call(context, method, params)
-
-        return ret
+        return self._call(context, method, params)
 
     def validate_transaction(self, request: dict) -> None:
         """Validate JSON-RPC transaction request
@@ -769,17 +1046,115 @@ class IconServiceEngine(ContextContainer):
                     tx_result.status,
                     context.step_counter.step_used)
 
-            # Finalize tx_result
-            context.cumulative_step_used += final_step_used
-            tx_result.step_used = final_step_used
-            tx_result.step_price = final_step_price
-            tx_result.cumulative_step_used = context.cumulative_step_used
-            tx_result.event_logs = context.event_logs
-            tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs)
-            tx_result.traces = context.traces
+            self._finalize_tx_result(context, tx_result, final_step_used, final_step_price)
+
+        return tx_result
+
+    @staticmethod
+    def _is_icx_transfer(method: str, params: dict) -> bool:
+        """Checks if a transaction only transfers icx to an EOA
+
+        :param method: JSON-RPC method
+        :param params: JSON-RPC params
+        """
+        return method == 'icx_sendTransaction' \
+            and 'data' not in params \
+            and 'dataType' not in params \
+            and not params['to'].is_contract
+
+    def _invoke_icx_transfer(self,
+                             context: 'IconScoreContext',
+                             params: dict) -> 'TransactionResult':
+        """Fast path of _handle_icx_send_transaction() for a transaction which only transfers icx to an EOA
+
+        It makes the same result and states without the dispatch and the SCORE invocation machinery.
+        The accounts involved in the transfer and the fee are read and written only once.
+
+        :param context:
+        :param params: JSON-RPC params
+        :return: transaction result
+        """
+        from_: 'Address' = params['from']
+        to: 'Address' = params['to']
+        value: int = params.get('value', 0)
+
+        tx_result = TransactionResult(context.tx, context.block)
+        tx_result.to = to
+        # The accounts to write in the order they are changed
+        accounts: Dict['Address', 'Account'] = OrderedDict()
+
+        try:
+            self._check_balance_to_charge_fee(context, params)
+
+            context.step_counter.apply_step(StepType.DEFAULT, 1)
+            input_size = get_input_data_size(context.revision, None)
+            context.step_counter.apply_step(StepType.INPUT, input_size)
+
+            if value < 0:
+                raise InvalidParamsException('Amount is less than zero')
+
+            if from_ != to and value > 0:
+                from_account: 'Account' = self._icx_engine.get_account(context, from_)
+                to_account: 'Account' = self._icx_engine.get_account(context, to)
+
+                from_account.withdraw(value)
+                to_account.deposit(value)
+                accounts[from_] = from_account
+                accounts[to] = to_account
+
+            tx_result.status = TransactionResult.SUCCESS
+        except BaseException as e:
+            tx_result.failure = self._get_failure_from_exception(e)
+            context.traces.append(self._get_trace_from_exception(to, e))
+            context.tx_batch.clear()
+
+            final_step_used, final_step_price = \
+                self._charge_transaction_fee(context, params, tx_result.status, context.step_counter.step_used)
+            self._finalize_tx_result(context, tx_result, final_step_used, final_step_price)
+            return tx_result
+
+        final_step_used, final_step_price = \
+            self._get_final_step(context, params, tx_result.status, context.step_counter.step_used)
+        fee: int = final_step_used * final_step_price
+        treasury: 'Address' = self._icx_engine.fee_treasury_address
+
+        # The same as IcxEngine.charge_fee() on the accounts read above
+        if from_ != treasury and fee > 0:
+            from_account: 'Account' = accounts.get(from_) or self._icx_engine.get_account(context, from_)
+            try:
+                from_account.withdraw(fee)
+            except BaseException as e:
+                Logger.exception(getattr(e, 'message', str(e)), ICON_SERVICE_LOG_TAG)
+                final_step_used = 0
+            else:
+                accounts[from_] = from_account
+                if context.deferred_fee is None:
+                    treasury_account: 'Account' = accounts.get(treasury) or \
+                        self._icx_engine.get_account(context, treasury)
+                    treasury_account.deposit(fee)
+                    accounts[treasury] = treasury_account
+                else:
+                    context.deferred_fee += fee
+
+        for address, account in accounts.items():
+            self._icx_storage.put_account(context, address, account)
 
+        self._finalize_tx_result(context, tx_result, final_step_used, final_step_price)
         return tx_result
 
+    def _finalize_tx_result(self,
+                            context: 'IconScoreContext',
+                            tx_result: 'TransactionResult',
+                            final_step_used: int,
+                            final_step_price: int) -> None:
+        context.cumulative_step_used += final_step_used
+        tx_result.step_used = final_step_used
+        tx_result.step_price = final_step_price
+        tx_result.cumulative_step_used = context.cumulative_step_used
+        tx_result.event_logs = context.event_logs
+        tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs)
+        tx_result.traces = context.traces
+
     def _handle_estimate_step(self,
                               context: 'IconScoreContext',
                               params: dict) -> int:
@@ -807,6 +1182,25 @@ class IconServiceEngine(ContextContainer):
 
         to: Address = params['to']
 
+        self._check_balance_to_charge_fee(context, params)
+
+        # Every send_transaction are calculated DEFAULT STEP at first
+        context.step_counter.apply_step(StepType.DEFAULT, 1)
+
+        input_size = get_input_data_size(context.revision, params.get('data', None))
+        context.step_counter.apply_step(StepType.INPUT, input_size)
+
+        self._transfer_coin(context, params)
+
+        score_address = None
+        if to.is_contract:
+            score_address = self._handle_score_invoke(context, to, params)
+
+        return score_address
+
+    def _check_balance_to_charge_fee(self,
+                                     context: 'IconScoreContext',
+                                     params: dict) -> None:
         # Checks the balance only on the invoke context(skip estimate context)
         if context.type == IconScoreContextType.INVOKE:
 
@@ -823,20 +1217,6 @@ class IconServiceEngine(ContextContainer):
                     params,
                     step_price=context.step_counter.step_price)
 
-        # Every send_transaction are calculated DEFAULT STEP at first
-        context.step_counter.apply_step(StepType.DEFAULT, 1)
-
-        input_size = get_input_data_size(context.revision, params.get('data', None))
-        context.step_counter.apply_step(StepType.INPUT, input_size)
-
-        self._transfer_coin(context, params)
-
-        score_address = None
-        if to.is_contract:
-            score_address = self._handle_score_invoke(context, to, params)
-
-        return score_address
-
     def _transfer_coin(self,
                        context: 'IconScoreContext',
                        params: dict) -> None:
@@ -868,9 +1248,36 @@ class IconServiceEngine(ContextContainer):
         :param status: 1: SUCCESS, 0: FAILURE
         :return: final step_used, step_price
         """
-        version: int = params.get('version', 2)
         from_: 'Address' = params['from']
+        step_used, step_price = self._get_final_step(context, params, status, step_used)
 
+        # Charge a fee to from account
+        fee: int = step_used * step_price
+        try:
+            self._icx_engine.charge_fee(context, from_, fee)
+        except BaseException as e:
+            if hasattr(e, 'message'):
+                message = e.message
+            else:
+                message = str(e)
+            Logger.exception(message, ICON_SERVICE_LOG_TAG)
+            step_used = 0
+
+        # final step_used and step_price
+        return step_used, step_price
+
+    @staticmethod
+    def _get_final_step(context: 'IconScoreContext',
+                        params: dict,
+                        status: int,
+                        step_used: int) -> (int, int):
+        """Returns step_used and step_price to charge a fee for a transaction
+
+        :param params:
+        :param status: 1: SUCCESS, 0: FAILURE
+        :return: final step_used, step_price
+        """
+        version: int = params.get('version', 2)
         step_price = context.step_counter.step_price
 
         if version < 3:
@@ -887,19 +1294,6 @@ class IconServiceEngine(ContextContainer):
                 # FIXED_FEE(0.01 icx) == step_used(10**6) * step_price(10**10)
                 step_price = 10 ** 10
 
-        # Charge a fee to from account
-        fee: int = step_used * step_price
-        try:
-            self._icx_engine.charge_fee(context, from_, fee)
-        except BaseException as e:
-            if hasattr(e, 'message'):
-                message = e.message
-            else:
-                message = str(e)
-            Logger.exception(message, ICON_SERVICE_LOG_TAG)
-            step_used = 0
-
-        # final step_used and step_price
         return step_used, step_price
 
     def _handle_score_invoke(self,
@@ -1006,15 +1400,22 @@ class IconServiceEngine(ContextContainer):
         :param event_logs: The event logs
         :return: Bloom data
         """
-        logs_bloom = BloomFilter()
+        value = 0
+        # Most event logs are emitted by a few SCOREs in a transaction
+        score_address_masks = {}
 
         for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+            score_address: 'Address' = event_log.score_address
+            score_address_mask: Optional[int] = score_address_masks.get(score_address)
+            if score_address_mask is None:
+                score_address_mask = get_bloom_mask(EventLogEmitter.get_ordered_bytes(0xff, score_address))
+                score_address_masks[score_address] = score_address_mask
+            value |= score_address_mask
+
             for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
-                logs_bloom.add(indexed_bytes)
+                value |= get_bloom_mask(EventLogEmitter.get_ordered_bytes(i, indexed_item))
 
-        return logs_bloom
+        return BloomFilter(value)
 
     def _handle_icx_get_score_api(self,
                                   context: 'IconScoreContext',
@@ -1039,6 +1440,35 @@ class IconServiceEngine(ContextContainer):
             response['lastBlock'] = last_block_status
         return response
 
+    def _handle_ise_get_event_logs(self, context: 'IconScoreContext', params: dict) -> dict:
+        """Returns the event logs in the committed blocks from the event log index
+
+        :param context:
+        :param params: filter and paging. See EventLogIndex.get_event_logs()
+        :return: {'eventLogs': [...], 'nextCursor': bytes}
+        """
+        if self._event_log_index is None:
+            raise InvalidRequestException('Event log index is disabled')
+
+        return self._event_log_index.get_event_logs(params)
+
+    def _handle_ise_get_transaction_result(self, context: 'IconScoreContext', params: dict) -> dict:
+        """Returns the result of a transaction in the committed blocks from the transaction result store
+
+        :param context:
+        :param params: txHash
+        :return: transaction result in the same format as the invoke response
+        """
+        if self._tx_result_store is None:
+            raise InvalidRequestException('Transaction result store is disabled')
+
+        tx_hash: bytes = params['txHash']
+        tx_result: Optional['TransactionResult'] = self._tx_result_store.get(tx_hash)
+        if tx_result is None:
+            raise InvalidParamsException(f'Transaction result not found: 0x{tx_hash.hex()}')
+
+        return tx_result.to_dict(to_camel_case)
+
     def _make_last_block_status(self) -> Optional[dict]:
         block = self._precommit_data_manager.last_block
         if block is None:
@@ -1083,21 +1513,35 @@ class IconServiceEngine(ContextContainer):
         if new_icon_score_mapper:
             context.icon_score_mapper.update(new_icon_score_mapper)
 
-        self._icx_context_db.write_batch(
-            context=context, states=block_batch)
-
-        self._icx_storage.put_block_info(context, block_batch.block)
+        # If ConfigKey.ASYNC_COMMIT is on, the states are written by a writer thread
+        # and looked up before LevelDB until written
+        self._icx_storage.commit_block(context, block_batch.block, block_batch)
+        self._icon_score_deploy_engine.icon_deploy_storage.on_block_committed(block_batch)
+        self._snapshot_manager.update(block_batch.block)
         self._precommit_data_manager.commit(block_batch.block)
 
-        if precommit_data.precommit_flag & PrecommitFlag.STEP_ALL_CHANGED != PrecommitFlag.NONE:
+        if self._event_log_index is not None:
+            self._event_log_index.put_block(block_batch.block, precommit_data.block_result)
+        if self._tx_result_store is not None:
+            self._tx_result_store.put_block(block_batch.block, precommit_data.block_result)
+
+        step_all_changed: bool = \
+            precommit_data.precommit_flag & PrecommitFlag.STEP_ALL_CHANGED != PrecommitFlag.NONE
+        if step_all_changed:
             self._init_global_value_by_governance_score()
 
+        # Switched to the new block last, so the results computed before the commit completes are not kept
+        if self._query_result_cache is not None:
+            self._query_result_cache.on_block_committed(
+                block_batch.block, block_batch.keys(), clear=step_all_changed)
+
     def rollback(self, block: 'Block') -> None:
         """Throw away a precommit state
         in context.block_batch and IconScoreEngine
         """
         # Check for block validation before rollback
-        self._precommit_data_manager.validate_precommit_block(block)
+        # The descendants of the block are thrown away as well
+        self._precommit_data_manager.validate_precommit_block(block, allow_uncommitted_parent=True)
         self._precommit_data_manager.rollback(block)
 
     def clear_context_stack(self):
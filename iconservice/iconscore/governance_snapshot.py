@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, Optional, Tuple
+
+from ..base.address import GOVERNANCE_SCORE_ADDRESS
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+    from ..database.batch import TransactionBatch
+    from .icon_score_base import IconScoreBase
+    from .icon_score_context import IconScoreContext
+    from .icon_score_step import IconScoreStepCounter, StepType
+
+
+class _StepRecorder(object):
+    """Records the steps applied while reading the governance SCORE
+    and passes them through to the step counter of the context if any
+    """
+
+    def __init__(self, step_counter: Optional['IconScoreStepCounter']) -> None:
+        self._step_counter = step_counter
+        self.steps: List[Tuple['StepType', int]] = []
+
+    def apply_step(self, step_type: 'StepType', count: int) -> int:
+        self.steps.append((step_type, count))
+
+        if self._step_counter is None:
+            return 0
+        return self._step_counter.apply_step(step_type, count)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._step_counter, name)
+
+
+class _Entry(object):
+    def __init__(self, value: Any, steps: List[Tuple['StepType', int]]) -> None:
+        self.value = value
+        self.steps = steps
+
+
+class GovernanceSnapshot(object):
+    """Results read from the governance SCORE while invoking a block
+
+    A result is reused by the following transactions
+    until a transaction changes the states or the code of the governance SCORE.
+    Whenever a result is reused, the steps applied to read it are applied again
+    so that the step used by a transaction is the same as without the snapshot.
+
+    The results must not be modified by the callers.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self,
+            context: 'IconScoreContext',
+            key: Hashable,
+            governance_score: Callable[[], 'IconScoreBase'],
+            func: Callable[['IconScoreBase'], Any]) -> Any:
+        """Returns the result of func(governance_score) reusing the one read before
+
+        :param context: invoke context of the block
+        :param key: identifies func and its arguments
+        :param governance_score: returns the governance SCORE
+        :param func: reads a result from the governance SCORE
+        :return: result of func
+        """
+        if not self.is_available(context):
+            return func(governance_score())
+
+        entry: Optional['_Entry'] = self._entries.get(key)
+        if entry is None:
+            self.miss_count += 1
+            entry = self._read(context, governance_score(), func)
+            self._entries[key] = entry
+        else:
+            self.hit_count += 1
+            self._apply_steps(context, entry.steps)
+
+        return entry.value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def on_transaction_finished(self, tx_batch: 'TransactionBatch', to: Optional['Address']) -> None:
+        """Clears the results if the transaction has changed the governance SCORE
+
+        :param tx_batch: the states changed by the transaction
+        :param to: the recipient of the transaction which deploys the governance SCORE if it is the governance SCORE
+        """
+        if to == GOVERNANCE_SCORE_ADDRESS or tx_batch.is_governance_changed:
+            self.clear()
+
+    @staticmethod
+    def is_available(context: 'IconScoreContext') -> bool:
+        tx_batch: Optional['TransactionBatch'] = context.tx_batch
+        if tx_batch is None:
+            return True
+
+        # The reads are recorded to be reported only when they are actually done
+        if tx_batch.access_recorder is not None:
+            return False
+
+        # The changes of the current transaction are not reflected to the results yet
+        return not tx_batch.is_governance_changed
+
+    @staticmethod
+    def _read(context: 'IconScoreContext',
+              governance_score: 'IconScoreBase',
+              func: Callable[['IconScoreBase'], Any]) -> '_Entry':
+        step_counter: Optional['IconScoreStepCounter'] = context.step_counter
+        recorder = _StepRecorder(step_counter)
+
+        context.step_counter = recorder
+        try:
+            value = func(governance_score)
+        finally:
+            context.step_counter = step_counter
+
+        return _Entry(value, recorder.steps)
+
+    @staticmethod
+    def _apply_steps(context: 'IconScoreContext', steps: List[Tuple['StepType', int]]) -> None:
+        step_counter: Optional['IconScoreStepCounter'] = context.step_counter
+        if step_counter is None:
+            return
+
+        for step_type, count in steps:
+            step_counter.apply_step(step_type, count)
@@ -31,6 +31,7 @@ V = TypeVar('V', int, str, Address, bytes, bool)
 ARRAY_DB_ID = b'\x00'
 DICT_DB_ID = b'\x01'
 VAR_DB_ID = b'\x02'
+INDEXED_ARRAY_DB_INDEX_ID = b'\x03'
 
 
 def get_encoded_key(key: V) -> bytes:
@@ -44,7 +45,7 @@ class ContainerUtil(object):
         """Create a prefix used
         as a parameter of IconScoreDatabase.get_sub_db()
 
-        :param cls: ArrayDB, DictDB, VarDB
+        :param cls: ArrayDB, DictDB, VarDB, IndexedArrayDB
         :param var_key:
         :return:
         """
@@ -52,6 +53,9 @@ class ContainerUtil(object):
             container_id = ARRAY_DB_ID
         elif cls == DictDB:
             container_id = DICT_DB_ID
+        elif cls == IndexedArrayDB:
+            # IndexedArrayDB keeps its values in an ArrayDB and its index under this prefix
+            container_id = INDEXED_ARRAY_DB_INDEX_ID
         else:
             raise InvalidParamsException(f'Unsupported container class: {cls}')
 
@@ -333,6 +337,93 @@ class ArrayDB(object):
             yield ArrayDB._get(db, size, index, value_type)
 
 
+class IndexedArrayDB(object):
+    """
+    Utility classes wrapping the state DB.
+    ArrayDB of unique values with an index from a value to its position,
+    which checks membership and removes a value without scanning the array.
+    The values are stored in the same way as ArrayDB with the same var_key.
+    """
+
+    def __init__(self, var_key: str, db: 'IconScoreDatabase', value_type: type) -> None:
+        self._array = ArrayDB(var_key, db, value_type)
+
+        prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
+        self._index_db = db.get_sub_db(prefix)
+
+    def put(self, value: V) -> None:
+        """
+        Puts the value at the end of array
+
+        :param value: value to add which is not in the array
+        """
+        if value in self:
+            raise InvalidParamsException(f'IndexedArrayDB already has the value: {value}')
+
+        self._array.put(value)
+        self.__set_position(value, len(self._array))
+
+    def remove(self, value: V) -> None:
+        """
+        Removes the value, moving the last value to its position
+
+        :param value: value to remove
+        """
+        position: int = self.__get_position(value)
+        if position == 0:
+            raise InvalidParamsException(f'IndexedArrayDB does not have the value: {value}')
+
+        last_value = self._array.pop()
+        if last_value != value:
+            self._array[position - 1] = last_value
+            self.__set_position(last_value, position)
+
+        self._index_db.delete(get_encoded_key(value))
+
+    def get(self, index: int=0) -> V:
+        """
+        Gets the value at index
+
+        :param index: index
+        :return: value at the index
+        """
+        return self._array[index]
+
+    def reindex(self) -> None:
+        """
+        Builds the index of the values.
+        It is used to migrate the values stored by ArrayDB with the same var_key.
+        """
+        for i, value in enumerate(self._array):
+            self.__set_position(value, i + 1)
+
+    def __get_position(self, value: V) -> int:
+        """
+        :return: 1-based position of the value or 0 if it is not in the array
+        """
+        position: int = ContainerUtil.decode_object(self._index_db.get(get_encoded_key(value)), int)
+
+        # The position is verified not to trust the index left by the removal without the index
+        if 0 < position <= len(self._array) and self._array[position - 1] == value:
+            return position
+        return 0
+
+    def __set_position(self, value: V, position: int) -> None:
+        self._index_db.put(get_encoded_key(value), ContainerUtil.encode_value(position))
+
+    def __iter__(self):
+        return iter(self._array)
+
+    def __len__(self):
+        return len(self._array)
+
+    def __getitem__(self, index: int) -> V:
+        return self._array[index]
+
+    def __contains__(self, item: V):
+        return self.__get_position(item) > 0
+
+
 class VarDB(object):
     """
     Utility classes wrapping the state DB. can be used to store simple key-value state
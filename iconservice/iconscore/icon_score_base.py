@@ -18,10 +18,12 @@ import warnings
 from abc import abstractmethod, ABC, ABCMeta
 from functools import partial, wraps
 from inspect import isfunction, getmembers, signature, Parameter
-from typing import TYPE_CHECKING, Callable, Any, List, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Any, List, Tuple, Mapping, Optional
 
 from ..base.address import Address, GOVERNANCE_SCORE_ADDRESS
 from ..base.exception import *
+from ..base.type_converter import TypeConverter
 from ..database.db import IconScoreDatabase, DatabaseObserver
 from ..icon_constant import ICX_TRANSFER_EVENT_LOG, REVISION_3
 from ..utils import get_main_type_from_annotations_type
@@ -30,7 +32,7 @@ from .icon_score_api_generator import ScoreApiGenerator
 from .icon_score_base2 import InterfaceScore, revert, Block
 from .icon_score_constant import CONST_INDEXED_ARGS_COUNT, FORMAT_IS_NOT_FUNCTION_OBJECT, CONST_BIT_FLAG, \
     ConstBitFlag, FORMAT_DECORATOR_DUPLICATED, FORMAT_IS_NOT_DERIVED_OF_OBJECT, STR_FALLBACK, CONST_CLASS_EXTERNALS, \
-    CONST_CLASS_PAYABLES, CONST_CLASS_API, T, BaseType
+    CONST_CLASS_PAYABLES, CONST_CLASS_API, CONST_CLASS_DISPATCH_TABLE, T, BaseType
 from .icon_score_context import ContextGetter, IconScoreContextType
 from .icon_score_context_util import IconScoreContextUtil
 from .icon_score_event_log import EventLogEmitter
@@ -276,6 +278,40 @@ class IconScoreObject(ABC):
         pass
 
 
+class ScoreFuncInfo(object):
+    """An entry of the dispatch table built by IconScoreBaseMeta
+
+    func: the function defined in SCORE class including its decorators
+    """
+    __slots__ = ('name', 'func', 'is_external', 'is_readonly', 'is_payable', '_params_converter')
+
+    def __init__(self, func: callable) -> None:
+        bit_flag: int = getattr(func, CONST_BIT_FLAG, 0)
+
+        self.name: str = func.__name__
+        self.func: callable = func
+        self.is_external: bool = bool(bit_flag & ConstBitFlag.External)
+        # readonly is meaningful only for external functions
+        self.is_readonly: bool = self.is_external and bool(bit_flag & ConstBitFlag.ReadOnly)
+        self.is_payable: bool = bool(bit_flag & ConstBitFlag.Payable)
+        self._params_converter: Optional[Callable[[Optional[dict]], Optional[dict]]] = None
+
+    @property
+    def params_converter(self) -> Callable[[Optional[dict]], Optional[dict]]:
+        """Converts the params of the function according to its annotations
+
+        It is made on the first call, not by IconScoreBaseMeta,
+        because the annotations may refer to the names defined after the SCORE class.
+        """
+        if self._params_converter is None:
+            self._params_converter = TypeConverter.make_data_params_converter(self.func)
+
+        return self._params_converter
+
+
+_EMPTY_DISPATCH_TABLE = MappingProxyType({})
+
+
 class IconScoreBaseMeta(ABCMeta):
 
     def __new__(mcs, name, bases, namespace, **kwargs):
@@ -310,6 +346,12 @@ class IconScoreBaseMeta(ABCMeta):
         api_list = ScoreApiGenerator.generate(custom_funcs)
         setattr(cls, CONST_CLASS_API, api_list)
 
+        # func_name: ScoreFuncInfo of the functions which can be called by IconScoreBase.__call()
+        dispatch_table = {func.__name__: ScoreFuncInfo(func) for func in custom_funcs
+                          if func.__name__ == STR_FALLBACK or
+                          getattr(func, CONST_BIT_FLAG, 0) & (ConstBitFlag.External | ConstBitFlag.Payable)}
+        setattr(cls, CONST_CLASS_DISPATCH_TABLE, MappingProxyType(dispatch_table))
+
         return cls
 
 
@@ -368,15 +410,21 @@ class IconScoreBase(IconScoreObject, ContextGetter,
 
         :param func_name: name of method
         """
-
-        if not self.__is_external_method(func_name):
-            raise MethodNotFoundException(
-                f"Method not found: {type(self).__name__}.{func_name}")
+        self.__get_external_func_info(func_name)
 
     @classmethod
     def __get_attr_dict(cls, attr: str) -> dict:
         return getattr(cls, attr, {})
 
+    def __get_external_func_info(self, func_name: str) -> 'ScoreFuncInfo':
+        func_info: 'ScoreFuncInfo' = \
+            getattr(type(self), CONST_CLASS_DISPATCH_TABLE, _EMPTY_DISPATCH_TABLE).get(func_name)
+        if func_info is None or not func_info.is_external:
+            raise MethodNotFoundException(
+                f"Method not found: {type(self).__name__}.{func_name}")
+
+        return func_info
+
     def __create_db_observer(self) -> 'DatabaseObserver':
         return DatabaseObserver(
             self.__on_db_get, self.__on_db_put, self.__on_db_delete)
@@ -387,44 +435,34 @@ class IconScoreBase(IconScoreObject, ContextGetter,
                kw_params: Optional[dict] = None) -> Any:
 
         if func_name == STR_FALLBACK:
+            func_info: 'ScoreFuncInfo' = \
+                getattr(type(self), CONST_CLASS_DISPATCH_TABLE, _EMPTY_DISPATCH_TABLE).get(func_name)
+            is_payable: bool = func_info is not None and func_info.is_payable
+
             if self._context.revision >= REVISION_3:
-                if not self.__is_payable_method(func_name):
+                if not is_payable:
                     raise MethodNotFoundException(
                         f"Method not found: {type(self).__name__}.{func_name}")
             else:
-                self.__check_payable(func_name)
+                self.__check_payable(func_name, is_payable)
 
-            score_func = getattr(self, func_name)
-            ret = score_func()
+            ret = self.fallback()
         else:
-            self.validate_external_method(func_name)
-            self.__check_payable(func_name)
-            score_func = getattr(self, func_name)
+            func_info: 'ScoreFuncInfo' = self.__get_external_func_info(func_name)
+            self.__check_payable(func_name, func_info.is_payable)
+
             if arg_params is None:
                 arg_params = []
             if kw_params is None:
                 kw_params = {}
-            ret = score_func(*arg_params, **kw_params)
+            ret = func_info.func(self, *arg_params, **kw_params)
         return ret
 
-    def __check_payable(self, func_name: str):
-        if self.msg.value > 0 and not self.__is_payable_method(func_name):
+    def __check_payable(self, func_name: str, is_payable: bool):
+        if not is_payable and self.msg.value > 0:
             raise MethodNotPayableException(
                 f"Method not payable: {type(self).__name__}.{func_name}")
 
-    def __is_external_method(self, func_name) -> bool:
-        return func_name in self.__get_attr_dict(CONST_CLASS_EXTERNALS)
-
-    def __is_payable_method(self, func_name) -> bool:
-        return func_name in self.__get_attr_dict(CONST_CLASS_PAYABLES)
-
-    def __is_func_readonly(self, func_name: str) -> bool:
-        if not self.__is_external_method(func_name):
-            return False
-
-        func = getattr(self, func_name)
-        return bool(getattr(func, CONST_BIT_FLAG, 0) & ConstBitFlag.ReadOnly)
-
     # noinspection PyUnusedLocal
     @staticmethod
     def __on_db_get(context: 'IconScoreContext',
@@ -23,13 +23,17 @@ from ..base.message import Message
 from ..base.transaction import Transaction
 from ..database.batch import BlockBatch, TransactionBatch
 from ..icon_constant import IconScoreContextType, IconScoreFuncType
+from .icon_score_constant import CONST_CLASS_DISPATCH_TABLE
 from .icon_score_trace import Trace
 
 if TYPE_CHECKING:
     from ..base.address import Address
+    from ..database.prefetcher import StatePrefetcher
+    from ..database.snapshot import DatabaseSnapshot
     from ..deploy.icon_score_deploy_engine import IconScoreDeployEngine
     from ..icx.icx_engine import IcxEngine
     from .icon_score_base import IconScoreBase
+    from .governance_snapshot import GovernanceSnapshot
     from .icon_score_event_log import EventLog
     from .icon_score_mapper import IconScoreMapper
     from .icon_score_step import IconScoreStepCounter
@@ -125,9 +129,18 @@ class IconScoreContext(object):
         self.step_counter: 'IconScoreStepCounter' = None
         self.event_logs: List['EventLog'] = None
         self.traces: List['Trace'] = None
+        # If not None, tx fees are accumulated here instead of being deposited to treasury
+        self.deferred_fee: Optional[int] = None
+        # If not None, the results read from the governance SCORE are reused in the block
+        self.governance_snapshot: Optional['GovernanceSnapshot'] = None
+        # If not None, a query reads the committed states from it
+        self.db_snapshot: Optional['DatabaseSnapshot'] = None
+        # If not None, the states of StateDB prefetched for the block are looked up first
+        self.state_prefetcher: Optional['StatePrefetcher'] = None
 
         self.msg_stack = []
-        self.event_log_stack = []
+        # The indexes of event_logs where the event logs of internal calls start
+        self.event_log_stack: List[int] = []
 
     @property
     def readonly(self):
@@ -135,8 +148,9 @@ class IconScoreContext(object):
                self.func_type == IconScoreFuncType.READONLY
 
     def set_func_type_by_icon_score(self, icon_score: 'IconScoreBase', func_name: str):
-        is_func_readonly = getattr(icon_score, '_IconScoreBase__is_func_readonly')
-        if func_name is not None and is_func_readonly(func_name):
+        # ScoreFuncInfo in the dispatch table built by IconScoreBaseMeta
+        func_info = getattr(type(icon_score), CONST_CLASS_DISPATCH_TABLE, {}).get(func_name)
+        if func_info is not None and func_info.is_readonly:
             self.func_type = IconScoreFuncType.READONLY
         else:
             self.func_type = IconScoreFuncType.WRITABLE
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 import warnings
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Tuple
 
 from .icon_score_class_loader import IconScoreClassLoader
 from .icon_score_mapper_object import IconScoreInfo
@@ -30,6 +30,7 @@ from ..deploy.utils import get_package_name_by_address_and_tx_hash, get_score_de
 from ..icon_constant import IconScoreContextType, IconServiceFlag
 
 if TYPE_CHECKING:
+    from .governance_snapshot import GovernanceSnapshot
     from .icon_score_context import IconScoreContext
     from .icon_score_base import IconScoreBase
     from .icon_score_mapper import IconScoreMapper
@@ -161,13 +162,13 @@ class IconScoreContextUtil(object):
 
     @staticmethod
     def _get_import_whitelist(context: 'IconScoreContext') -> dict:
-        governance_score =\
-            IconScoreContextUtil.get_builtin_score(context, GOVERNANCE_SCORE_ADDRESS)
+        def _get(governance_score: 'IconScoreBase') -> dict:
+            if hasattr(governance_score, 'import_white_list_cache'):
+                return governance_score.import_white_list_cache
 
-        if hasattr(governance_score, 'import_white_list_cache'):
-            return governance_score.import_white_list_cache
+            return {"iconservice": ['*']}
 
-        return {"iconservice": ['*']}
+        return IconScoreContextUtil._read_governance(context, 'import_white_list_cache', _get)
 
     @staticmethod
     def validate_score_blacklist(context: 'IconScoreContext', score_address: 'Address') -> None:
@@ -181,11 +182,12 @@ class IconScoreContextUtil(object):
         if score_address == ZERO_SCORE_ADDRESS:
             return
 
-        # Gets the governance SCORE
-        governance_score =\
-            IconScoreContextUtil.get_builtin_score(context, GOVERNANCE_SCORE_ADDRESS)
+        is_in_score_black_list: bool = IconScoreContextUtil._read_governance(
+            context, ('isInScoreBlackList', score_address),
+            lambda governance_score:
+            governance_score is not None and governance_score.isInScoreBlackList(score_address))
 
-        if governance_score is not None and governance_score.isInScoreBlackList(score_address):
+        if is_in_score_black_list:
             raise AccessDeniedException(f'SCORE in blacklist: {score_address}')
 
     @staticmethod
@@ -198,11 +200,11 @@ class IconScoreContextUtil(object):
         if not IconScoreContextUtil.is_service_flag_on(context, IconServiceFlag.DEPLOYER_WHITE_LIST):
             return
 
-        # Gets the governance SCORE
-        governance_score =\
-            IconScoreContextUtil.get_builtin_score(context, GOVERNANCE_SCORE_ADDRESS)
+        is_deployer: bool = IconScoreContextUtil._read_governance(
+            context, ('isDeployer', deployer),
+            lambda governance_score: governance_score.isDeployer(deployer))
 
-        if not governance_score.isDeployer(deployer):
+        if not is_deployer:
             raise AccessDeniedException(f'Invalid deployer: no permission (address: {deployer})')
 
     @staticmethod
@@ -216,15 +218,36 @@ class IconScoreContextUtil(object):
 
     @staticmethod
     def _get_service_flag(context: 'IconScoreContext') -> int:
-        governance_score = \
-            IconScoreContextUtil.get_builtin_score(context, GOVERNANCE_SCORE_ADDRESS)
-
-        service_config = context.icon_service_flag
-        try:
-            service_config = governance_score.service_config
-        except AttributeError:
-            pass
-        return service_config
+        def _get(governance_score: 'IconScoreBase') -> int:
+            service_config = context.icon_service_flag
+            try:
+                service_config = governance_score.service_config
+            except AttributeError:
+                pass
+            return service_config
+
+        return IconScoreContextUtil._read_governance(context, 'service_config', _get)
+
+    @staticmethod
+    def _read_governance(context: 'IconScoreContext',
+                         key: Hashable,
+                         func: Callable[['IconScoreBase'], Any]) -> Any:
+        """Reads a result from the governance SCORE with func
+        through the governance snapshot of the block if any
+
+        :param context:
+        :param key: identifies func and its arguments in the governance snapshot
+        :param func: reads a result from the governance SCORE
+        :return: result of func
+        """
+        def _get_governance_score() -> 'IconScoreBase':
+            return IconScoreContextUtil.get_builtin_score(context, GOVERNANCE_SCORE_ADDRESS)
+
+        governance_snapshot: Optional['GovernanceSnapshot'] = context.governance_snapshot
+        if governance_snapshot is None:
+            return func(_get_governance_score())
+
+        return governance_snapshot.get(context, key, _get_governance_score, func)
 
     @staticmethod
     def get_tx_hashes_by_score_address(context: 'IconScoreContext',
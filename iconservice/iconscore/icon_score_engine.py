@@ -16,10 +16,9 @@
 """IconScoreEngine module
 """
 
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
-from .icon_score_constant import STR_FALLBACK
+from .icon_score_constant import STR_FALLBACK, CONST_CLASS_DISPATCH_TABLE
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
 from ..base.address import Address, ZERO_SCORE_ADDRESS
@@ -27,7 +26,7 @@ from ..base.exception import ScoreNotFoundException, InvalidParamsException
 from ..base.type_converter import TypeConverter
 
 if TYPE_CHECKING:
-    from ..iconscore.icon_score_base import IconScoreBase
+    from ..iconscore.icon_score_base import IconScoreBase, ScoreFuncInfo
 
 
 class IconScoreEngine(object):
@@ -113,14 +112,17 @@ class IconScoreEngine(object):
 
     @staticmethod
     def _convert_score_params_by_annotations(icon_score: 'IconScoreBase', func_name: str, kw_params: dict) -> dict:
-        tmp_params = deepcopy(kw_params)
-
         icon_score.validate_external_method(func_name)
 
-        score_func = getattr(icon_score, func_name)
-        annotation_params = TypeConverter.make_annotations_from_method(score_func)
-        TypeConverter.convert_data_params(annotation_params, tmp_params)
-        return tmp_params
+        # The converter is made once per SCORE class and method
+        func_info: Optional['ScoreFuncInfo'] = \
+            getattr(type(icon_score), CONST_CLASS_DISPATCH_TABLE, {}).get(func_name)
+        if func_info is None:
+            converter = TypeConverter.make_data_params_converter(getattr(icon_score, func_name))
+        else:
+            converter = func_info.params_converter
+
+        return converter(kw_params)
 
     @staticmethod
     def _fallback(context: 'IconScoreContext',
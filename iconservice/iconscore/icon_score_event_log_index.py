@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+from ..base.address import Address
+from ..base.exception import InvalidParamsException
+from ..base.type_converter import TypeConverter
+from ..database.db import KeyValueDatabase
+from ..icon_constant import DATA_BYTE_ORDER
+from ..utils.bloom import get_bloom_mask
+from .icon_score_event_log import EventLog, EventLogEmitter
+from .icon_score_result import TransactionResultSerializer
+
+if TYPE_CHECKING:
+    from ..base.block import Block
+    from .icon_score_result import TransactionResult
+
+DEFAULT_EVENT_LOG_QUERY_LIMIT = 100
+MAX_EVENT_LOG_QUERY_LIMIT = 1000
+
+_HEIGHT_SIZE = 8
+_TX_INDEX_SIZE = 4
+_LOG_INDEX_SIZE = 4
+_BLOOM_SIZE = 256
+_CURSOR_SIZE = _HEIGHT_SIZE + _TX_INDEX_SIZE + _LOG_INDEX_SIZE
+
+# The types of event arguments. See icon_score_base.__retrieve_event_signature()
+_EVENT_ARGUMENT_TYPES = {
+    'int': int,
+    'str': str,
+    'bytes': bytes,
+    'bool': bool,
+    'Address': Address
+}
+
+
+def _height_to_bytes(height: int) -> bytes:
+    return height.to_bytes(_HEIGHT_SIZE, DATA_BYTE_ORDER)
+
+
+def _address_to_bytes(address: 'Address') -> bytes:
+    # Fixed size not to mix up the keys of EOA and SCORE addresses
+    return address.prefix.value.to_bytes(1, DATA_BYTE_ORDER) + address.body
+
+
+class EventLogIndex(object):
+    """On-disk index of the event logs in the committed blocks
+
+    Key layout
+    - b'b|' + height: the logs bloom of the block followed by (tx index, logs bloom) of its transactions
+    - b't|' + height + tx index: the tx hash and the event logs of a transaction in the invoke response format
+    - b's|' + SCORE address + height: marks a block which has the event logs of the SCORE
+    - b'r|' + first height: the last height of a range of the blocks indexed without a gap
+
+    Only the blocks having event logs are recorded,
+    and the logs blooms are looked up to skip the blocks and the transactions before reading the event logs.
+    A block which is not indexed, e.g. committed while the index was off or failed to be written,
+    leaves a gap between the ranges and the blocks indexed before it stay available.
+    """
+
+    _BLOCK_PREFIX = b'b|'
+    _TX_PREFIX = b't|'
+    _SCORE_PREFIX = b's|'
+    _RANGE_PREFIX = b'r|'
+
+    @staticmethod
+    def from_path(path: str) -> 'EventLogIndex':
+        return EventLogIndex(KeyValueDatabase.from_path(path))
+
+    def __init__(self, db: 'KeyValueDatabase') -> None:
+        self._db = db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get_height_ranges(self) -> List[Tuple[int, int]]:
+        """Returns the ranges of the heights of the blocks indexed without a gap
+
+        :return: (first height, last height) in ascending order
+        """
+        return [(int.from_bytes(key[-_HEIGHT_SIZE:], DATA_BYTE_ORDER), int.from_bytes(value, DATA_BYTE_ORDER))
+                for key, value in self._db.iterator(start=self._RANGE_PREFIX,
+                                                    stop=self._RANGE_PREFIX + b'\xff' * _HEIGHT_SIZE)]
+
+    def put_block(self, block: 'Block', tx_results: List['TransactionResult']) -> None:
+        """Indexes the event logs of a committed block
+
+        :param block: committed block
+        :param tx_results: the results of the transactions in the block
+        """
+        height_bytes: bytes = _height_to_bytes(block.height)
+        states = {}
+
+        height_ranges: List[Tuple[int, int]] = self.get_height_ranges()
+        if height_ranges and height_ranges[-1][1] + 1 == block.height:
+            # Extends the last range
+            states[self._RANGE_PREFIX + _height_to_bytes(height_ranges[-1][0])] = height_bytes
+        elif not any(first <= block.height <= last for first, last in height_ranges):
+            # The blocks committed before it have not been indexed
+            states[self._RANGE_PREFIX + height_bytes] = height_bytes
+
+        serializer = TransactionResultSerializer()
+        block_bloom = 0
+        tx_blooms = []
+        for tx_result in tx_results:
+            event_logs = [event_log for event_log in tx_result.event_logs or () if isinstance(event_log, EventLog)]
+            if len(event_logs) == 0:
+                continue
+
+            logs_bloom = int(tx_result.logs_bloom)
+            block_bloom |= logs_bloom
+            tx_blooms.append(tx_result.tx_index.to_bytes(_TX_INDEX_SIZE, DATA_BYTE_ORDER))
+            tx_blooms.append(logs_bloom.to_bytes(_BLOOM_SIZE, DATA_BYTE_ORDER))
+
+            tx_key: bytes = self._TX_PREFIX + height_bytes + tx_result.tx_index.to_bytes(_TX_INDEX_SIZE,
+                                                                                         DATA_BYTE_ORDER)
+            states[tx_key] = json.dumps({
+                'txHash': tx_result.tx_hash.hex(),
+                'eventLogs': [serializer.serialize_event_log(event_log) for event_log in event_logs]
+            }).encode('utf-8')
+
+            for event_log in event_logs:
+                score_key: bytes = self._SCORE_PREFIX + _address_to_bytes(event_log.score_address) + height_bytes
+                states[score_key] = b'\x01'
+
+        if tx_blooms:
+            block_key: bytes = self._BLOCK_PREFIX + height_bytes
+            states[block_key] = block_bloom.to_bytes(_BLOOM_SIZE, DATA_BYTE_ORDER) + b''.join(tx_blooms)
+
+        self._db.write_batch(states)
+
+    def get_event_logs(self, params: dict) -> dict:
+        """Returns the event logs matched with the filter in params in the order of emission
+
+        params
+        - address: SCORE address which has emitted the event logs
+        - event: event signature. ex) 'Transfer(Address,Address,int)'
+        - indexed: the values of the indexed arguments following the event signature. null matches any value
+        - fromBlock, toBlock: the range of block heights. The heights not indexed are excluded
+        - limit: the maximum count of the event logs to return
+        - cursor: nextCursor of the previous response to get the next page
+
+        :param params: converted request params
+        :return: {'eventLogs': [...], 'nextCursor': bytes} nextCursor is given only if there can be more event logs
+        """
+        score_address: Optional['Address'] = params.get('address')
+        event_signature: Optional[str] = params.get('event')
+        indexed: list = self._convert_indexed(event_signature, params.get('indexed'))
+        limit: int = params.get('limit', DEFAULT_EVENT_LOG_QUERY_LIMIT)
+        if not 0 < limit <= MAX_EVENT_LOG_QUERY_LIMIT:
+            raise InvalidParamsException(f'Invalid limit: {limit}')
+
+        response = {'eventLogs': []}
+        height_ranges: List[Tuple[int, int]] = self.get_height_ranges()
+        if len(height_ranges) == 0:
+            return response
+
+        from_height: int = max(params.get('fromBlock', height_ranges[0][0]), height_ranges[0][0])
+        to_height: int = min(params.get('toBlock', height_ranges[-1][1]), height_ranges[-1][1])
+
+        cursor: Tuple[int, int, int] = (from_height, 0, 0)
+        if 'cursor' in params:
+            cursor = max(cursor, self._parse_cursor(params['cursor']))
+        if cursor[0] > to_height:
+            return response
+
+        bloom_items: List[bytes] = []
+        if score_address is not None:
+            bloom_items.append(EventLogEmitter.get_ordered_bytes(0xff, score_address))
+        if event_signature is not None:
+            bloom_items.append(EventLogEmitter.get_ordered_bytes(0, event_signature))
+        for i, value in enumerate(indexed, start=1):
+            if value is not None:
+                bloom_items.append(EventLogEmitter.get_ordered_bytes(i, value))
+
+        bloom_mask = 0
+        for item in bloom_items:
+            bloom_mask |= get_bloom_mask(item)
+
+        expected_address: Optional[str] = None if score_address is None else str(score_address)
+        expected_indexed: list = [event_signature] + [TypeConverter.convert_type_reverse(value) for value in indexed]
+
+        event_logs: list = response['eventLogs']
+        for height, block_record in self._iterate_indexed_blocks(score_address, height_ranges, cursor[0], to_height):
+            if int.from_bytes(block_record[:_BLOOM_SIZE], DATA_BYTE_ORDER) & bloom_mask != bloom_mask:
+                continue
+
+            for tx_index in self._iterate_txs(block_record, bloom_mask):
+                if (height, tx_index) < cursor[:2]:
+                    continue
+
+                tx_record: dict = self._get_tx_record(height, tx_index)
+                for log_index, event_log in enumerate(tx_record['eventLogs']):
+                    if (height, tx_index, log_index) < cursor:
+                        continue
+                    if not self._is_matched(event_log, expected_address, expected_indexed):
+                        continue
+
+                    if len(event_logs) == limit:
+                        response['nextCursor'] = self._make_cursor(height, tx_index, log_index)
+                        return response
+
+                    event_logs.append({
+                        'blockHeight': height,
+                        'txHash': bytes.fromhex(tx_record['txHash']),
+                        'txIndex': tx_index,
+                        'logIndex': log_index,
+                        **event_log
+                    })
+
+        return response
+
+    def _iterate_indexed_blocks(self,
+                                score_address: Optional['Address'],
+                                height_ranges: List[Tuple[int, int]],
+                                from_height: int,
+                                to_height: int) -> Iterable[Tuple[int, bytes]]:
+        """Iterates the blocks which have event logs in the range of heights skipping the gaps between the ranges
+
+        :return: (height, block record)
+        """
+        for first, last in height_ranges:
+            first, last = max(first, from_height), min(last, to_height)
+            if first <= last:
+                yield from self._iterate_blocks(score_address, first, last)
+
+    def _iterate_blocks(self,
+                        score_address: Optional['Address'],
+                        from_height: int,
+                        to_height: int) -> Iterable[Tuple[int, bytes]]:
+        """Iterates the blocks which have event logs in the range of heights
+
+        :return: (height, block record)
+        """
+        if score_address is None:
+            for key, value in self._db.iterator(start=self._BLOCK_PREFIX + _height_to_bytes(from_height),
+                                                stop=self._BLOCK_PREFIX + _height_to_bytes(to_height + 1)):
+                yield int.from_bytes(key[-_HEIGHT_SIZE:], DATA_BYTE_ORDER), value
+        else:
+            prefix: bytes = self._SCORE_PREFIX + _address_to_bytes(score_address)
+            for key, _ in self._db.iterator(start=prefix + _height_to_bytes(from_height),
+                                            stop=prefix + _height_to_bytes(to_height + 1)):
+                height_bytes: bytes = key[-_HEIGHT_SIZE:]
+                yield int.from_bytes(height_bytes, DATA_BYTE_ORDER), self._db.get(self._BLOCK_PREFIX + height_bytes)
+
+    @staticmethod
+    def _iterate_txs(block_record: bytes, bloom_mask: int) -> Iterable[int]:
+        """Iterates the transactions whose logs bloom has all the bits in bloom_mask
+
+        :return: tx index
+        """
+        record_size: int = _TX_INDEX_SIZE + _BLOOM_SIZE
+        for offset in range(_BLOOM_SIZE, len(block_record), record_size):
+            bloom_offset: int = offset + _TX_INDEX_SIZE
+            logs_bloom = int.from_bytes(block_record[bloom_offset:bloom_offset + _BLOOM_SIZE], DATA_BYTE_ORDER)
+            if logs_bloom & bloom_mask == bloom_mask:
+                yield int.from_bytes(block_record[offset:bloom_offset], DATA_BYTE_ORDER)
+
+    def _get_tx_record(self, height: int, tx_index: int) -> dict:
+        key: bytes = self._TX_PREFIX + _height_to_bytes(height) + tx_index.to_bytes(_TX_INDEX_SIZE, DATA_BYTE_ORDER)
+        return json.loads(self._db.get(key).decode('utf-8'))
+
+    @staticmethod
+    def _is_matched(event_log: dict, expected_address: Optional[str], expected_indexed: list) -> bool:
+        if expected_address is not None and event_log['scoreAddress'] != expected_address:
+            return False
+
+        indexed: list = event_log['indexed']
+        if len(indexed) < len(expected_indexed):
+            return False
+
+        for value, expected_value in zip(indexed, expected_indexed):
+            if expected_value is not None and value != expected_value:
+                return False
+
+        return True
+
+    @staticmethod
+    def _convert_indexed(event_signature: Optional[str], indexed: Optional[list]) -> list:
+        """Converts the values of the indexed arguments into the types in the event signature
+        """
+        if indexed is None or len(indexed) == 0:
+            return []
+
+        if event_signature is None:
+            raise InvalidParamsException('event is required to filter indexed arguments')
+        if not isinstance(indexed, list):
+            raise InvalidParamsException(f'Invalid indexed: {indexed}')
+
+        type_names: List[str] = []
+        if event_signature.endswith(')') and '(' in event_signature:
+            arguments: str = event_signature[event_signature.index('(') + 1:-1]
+            type_names = arguments.split(',') if arguments else []
+        if len(indexed) > len(type_names):
+            raise InvalidParamsException(f'Too many indexed arguments for {event_signature}')
+
+        annotations = {}
+        values = {}
+        for i, value in enumerate(indexed):
+            if value is None:
+                continue
+
+            argument_type: Optional[type] = _EVENT_ARGUMENT_TYPES.get(type_names[i])
+            if argument_type is None:
+                raise InvalidParamsException(f'Invalid event signature: {event_signature}')
+
+            annotations[str(i)] = argument_type
+            values[str(i)] = value
+
+        try:
+            TypeConverter.convert_data_params(annotations, values)
+        except ValueError:
+            raise InvalidParamsException(f'Invalid indexed: {indexed}')
+        return [values.get(str(i)) for i in range(len(indexed))]
+
+    @staticmethod
+    def _make_cursor(height: int, tx_index: int, log_index: int) -> bytes:
+        return _height_to_bytes(height) + \
+            tx_index.to_bytes(_TX_INDEX_SIZE, DATA_BYTE_ORDER) + \
+            log_index.to_bytes(_LOG_INDEX_SIZE, DATA_BYTE_ORDER)
+
+    @staticmethod
+    def _parse_cursor(cursor: bytes) -> Tuple[int, int, int]:
+        if len(cursor) != _CURSOR_SIZE:
+            raise InvalidParamsException(f'Invalid cursor: 0x{cursor.hex()}')
+
+        tx_index_offset: int = _HEIGHT_SIZE + _TX_INDEX_SIZE
+        return (int.from_bytes(cursor[:_HEIGHT_SIZE], DATA_BYTE_ORDER),
+                int.from_bytes(cursor[_HEIGHT_SIZE:tx_index_offset], DATA_BYTE_ORDER),
+                int.from_bytes(cursor[tx_index_offset:], DATA_BYTE_ORDER))
@@ -14,11 +14,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from .icon_container_db import DictDB, VarDB
+from .icon_score_context import ContextContainer
 from ..base.address import Address, GOVERNANCE_SCORE_ADDRESS
 from ..base.exception import InvalidParamsException
 from ..database.db import IconScoreDatabase
 from ..icon_constant import REVISION_2
 
+if TYPE_CHECKING:
+    from .icon_score_base import IconScoreBase
+    from .icon_score_context import IconScoreContext
+
+# The types of member variables which can be shared by the instances of a SCORE
+# They are immutable or refer to nothing but the db of the SCORE
+_SHAREABLE_TYPES = (type(None), bool, int, float, str, bytes, Address, IconScoreDatabase, VarDB, DictDB)
+
+
+class _ContextAccessRecorder(object):
+    """Records the attribute names of IconScoreContext accessed through it
+    """
+
+    def __init__(self, context: 'IconScoreContext') -> None:
+        object.__setattr__(self, '_recorder_context', context)
+        object.__setattr__(self, 'accessed_names', [])
+
+    def __getattr__(self, name: str) -> Any:
+        self.accessed_names.append(name)
+        return getattr(self._recorder_context, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.accessed_names.append(name)
+        setattr(self._recorder_context, name, value)
+
 
 class IconScoreInfo(object):
     """Contains information on one icon score
@@ -37,6 +66,8 @@ class IconScoreInfo(object):
         self._score_class = score_class
         self._score_db = score_db
         self._score = None
+        # None: not taken yet, False: the SCORE cannot be created from a snapshot
+        self._snapshot = None
 
     @property
     def tx_hash(self) -> bytes:
@@ -57,7 +88,8 @@ class IconScoreInfo(object):
     def get_score(self, revision: int) -> 'IconScoreBase':
         """Provide a score instance according to the revision.
         1. revision <= 2: Returns a cached score instance
-        2. revision > 2: Returns a newly created score instance
+        2. revision > 2: Returns a new score instance
+            which has the same member variables as the one right after __init__()
 
         :param revision:
         :return:
@@ -68,11 +100,69 @@ class IconScoreInfo(object):
 
             return self._score
 
-        return self.create_score()
+        snapshot = self._snapshot
+        if snapshot is None:
+            score, self._snapshot = self._create_score_with_snapshot()
+            return score
+        if snapshot is False:
+            return self.create_score()
+
+        # Skips __init__() which would make the same member variables as snapshot
+        score = object.__new__(self._score_class)
+        score.__dict__.update(snapshot)
+        return score
 
     def create_score(self) -> 'IconScoreBase':
         return self._score_class(self._score_db)
 
+    def _create_score_with_snapshot(self) -> Tuple['IconScoreBase', Any]:
+        """Creates a score instance and takes a snapshot of its member variables
+
+        A snapshot is not available if __init__() of the SCORE makes a result
+        depending on anything else than its own class and db:
+        - accesses the context (msg, tx, block, states in db, steps and so on)
+        - keeps member variables which are mutable or depend on states (ArrayDB)
+
+        :return: (score, snapshot or False)
+        """
+        context: Optional['IconScoreContext'] = ContextContainer._get_context()
+        if context is None:
+            return self.create_score(), None
+
+        # IconScoreBase.__init__() reads its owner with the context
+        try:
+            placeholder = object.__new__(self._score_class)
+            expected_names: List[str] = \
+                self._record_context_access(context, lambda: placeholder.get_owner(self.address))[1]
+        except BaseException:
+            return self.create_score(), False
+
+        score, accessed_names = self._record_context_access(context, self.create_score)
+        if accessed_names != expected_names:
+            return score, False
+
+        snapshot: Optional[dict] = getattr(score, '__dict__', None)
+        if snapshot is None or not all(self._is_shareable(value) for value in snapshot.values()):
+            return score, False
+
+        return score, dict(snapshot)
+
+    @staticmethod
+    def _record_context_access(context: 'IconScoreContext', func: Callable[[], Any]) -> Tuple[Any, List[str]]:
+        recorder = _ContextAccessRecorder(context)
+        ContextContainer._push_context(recorder)
+        try:
+            return func(), recorder.accessed_names
+        finally:
+            ContextContainer._pop_context()
+
+    @classmethod
+    def _is_shareable(cls, value: Any) -> bool:
+        if type(value) in (tuple, frozenset):
+            return all(cls._is_shareable(item) for item in value)
+
+        return type(value) in _SHAREABLE_TYPES
+
 
 class IconScoreMapperObject(dict):
     def __getitem__(self, key: 'Address') -> 'IconScoreInfo':
@@ -13,17 +13,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Any
 
 from .icon_score_event_log import EventLog
 from ..base.address import Address
 from ..base.block import Block
 from ..base.exception import ExceptionCode
 from ..icon_constant import DATA_BYTE_ORDER
+from ..utils import to_camel_case
 from ..utils.bloom import BloomFilter
 
 if TYPE_CHECKING:
     from ..base.transaction import Transaction
+    from ..database.batch import KeyAccessRecorder
 
 
 class TransactionResult(object):
@@ -92,6 +94,10 @@ class TransactionResult(object):
         # Traces are managed in TransactionResult but not passed to chain engine
         self.traces = None
 
+        # Keys touched by the transaction
+        # It is only available when ConfigKey.TRACK_KEY_ACCESS is on and not passed to chain engine
+        self.key_access: Optional['KeyAccessRecorder'] = None
+
     def __str__(self) -> str:
         return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
 
@@ -121,7 +127,113 @@ class TransactionResult(object):
             elif key == 'traces':
                 # traces are excluded from dict property
                 continue
+            elif key == 'key_access':
+                # key_access is excluded from dict property
+                continue
             else:
                 new_dict[new_key] = value
 
         return new_dict
+
+
+class TransactionResultSerializer(object):
+    """Serializes TransactionResults into the invoke response format in a single pass
+
+    The output is the same as
+    TypeConverter.convert_type_reverse(tx_result.to_dict(to_camel_case))
+    without building an intermediate dict or modifying event logs.
+
+    An instance caches the string of addresses it has serialized,
+    so it is supposed to be used for the results of a block and thrown away.
+    """
+
+    # snake_case attribute name -> camelCase key
+    _camel_case_keys = {}
+
+    # Keys whose bytes value is serialized without '0x' prefix
+    _HASH_KEYS = ('blockHash', 'txHash', 'prevBlockHash')
+
+    def __init__(self) -> None:
+        # id(address) -> (address, str(address))
+        self._address_strings = {}
+
+    def serialize(self, tx_result: 'TransactionResult') -> dict:
+        """Returns a dict of tx_result in the invoke response format
+
+        :param tx_result: transaction result
+        :return: dict which has camelCase keys and hex string values
+        """
+        new_dict = {}
+        for key, value in tx_result.__dict__.items():
+            # Excludes properties which have `None` value
+            if value is None:
+                continue
+
+            new_key = self._get_camel_case_key(key)
+            if key == 'event_logs':
+                new_dict[new_key] = [self.serialize_event_log(v) for v in value if isinstance(v, EventLog)]
+            elif isinstance(value, BloomFilter):
+                new_dict[new_key] = f'0x{int(value).to_bytes(256, byteorder=DATA_BYTE_ORDER).hex()}'
+            elif key == 'failure' and value:
+                if tx_result.status == TransactionResult.FAILURE:
+                    new_dict[new_key] = {
+                        'code': self._serialize_value(value.code),
+                        'message': self._serialize_value(value.message)
+                    }
+            elif key == 'traces' or key == 'key_access':
+                # traces and key_access are not passed to chain engine
+                continue
+            elif isinstance(value, bytes) and new_key in self._HASH_KEYS:
+                new_dict[new_key] = value.hex()
+            else:
+                new_dict[new_key] = self._serialize_value(value)
+
+        return new_dict
+
+    def serialize_event_log(self, event_log: 'EventLog') -> dict:
+        """Returns a dict of event_log in the invoke response format
+
+        :param event_log: event log
+        :return: dict which has camelCase keys and hex string values
+        """
+        new_dict = {}
+        for key, value in event_log.__dict__.items():
+            if value is None:
+                continue
+
+            new_dict[self._get_camel_case_key(key)] = self._serialize_value(value)
+
+        return new_dict
+
+    def _serialize_value(self, value: Any) -> Any:
+        if isinstance(value, int):
+            return hex(value)
+        elif isinstance(value, Address):
+            return self._serialize_address(value)
+        elif isinstance(value, bytes):
+            return f'0x{value.hex()}'
+        elif isinstance(value, list):
+            return [self._serialize_value(v) for v in value]
+        elif isinstance(value, dict):
+            return {k: v.hex() if isinstance(v, bytes) and k in self._HASH_KEYS else self._serialize_value(v)
+                    for k, v in value.items()}
+
+        return value
+
+    def _serialize_address(self, address: 'Address') -> str:
+        entry = self._address_strings.get(id(address))
+        if entry is not None and entry[0] is address:
+            return entry[1]
+
+        address_string = str(address)
+        self._address_strings[id(address)] = (address, address_string)
+        return address_string
+
+    @classmethod
+    def _get_camel_case_key(cls, key: str) -> str:
+        new_key = cls._camel_case_keys.get(key)
+        if new_key is None:
+            new_key = to_camel_case(key)
+            cls._camel_case_keys[key] = new_key
+
+        return new_key
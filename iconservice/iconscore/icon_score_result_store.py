@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from threading import Lock
+from typing import List, Optional
+
+from iconcommons.logger import Logger
+
+from ..base.address import MalformedAddress
+from ..base.block import Block
+from ..base.exception import DatabaseException
+from ..base.transaction import Transaction
+from ..database.db import KeyValueDatabase
+from ..icon_constant import DATA_BYTE_ORDER, ICON_SERVICE_LOG_TAG
+from ..utils.bloom import BloomFilter
+from ..utils.msgpack_for_db import MsgPackForDB
+from .icon_score_event_log import EventLog
+from .icon_score_result import TransactionResult
+
+_OFFSET_SIZE = 8
+_LENGTH_SIZE = 4
+_HEIGHT_SIZE = 8
+
+
+class TransactionResultStore(object):
+    """Append-only store of the transaction results in the committed blocks
+
+    The results are encoded with MsgPackForDB and appended to a data file.
+    A LevelDB keeps tx hash -> (offset, length) of each result in the data file,
+    the size of the data file which has been indexed and the last block whose results are stored.
+    The results appended but not indexed by a crash are truncated on opening.
+
+    The store is best-effort. The results of a block are stored after its states are committed,
+    so the ones of the blocks committed just before a crash can be missing.
+    check_last_block() reports them on opening.
+    """
+
+    _VERSION = 0
+
+    DATA_FILE_NAME = 'tx_results.dat'
+    INDEX_DB_NAME = 'index'
+
+    _TX_PREFIX = b't|'
+    _SIZE_KEY = b'm|size'
+    _LAST_BLOCK_KEY = b'm|block'
+
+    @staticmethod
+    def from_path(path: str) -> 'TransactionResultStore':
+        """Opens the store in the directory of path
+
+        :param path: directory which has the data file and the index db
+        """
+        os.makedirs(path, exist_ok=True)
+        index_db = KeyValueDatabase.from_path(os.path.join(path, TransactionResultStore.INDEX_DB_NAME))
+        return TransactionResultStore(os.path.join(path, TransactionResultStore.DATA_FILE_NAME), index_db)
+
+    def __init__(self, data_path: str, index_db: 'KeyValueDatabase') -> None:
+        self._index_db = index_db
+        self._lock = Lock()
+
+        size_bytes: Optional[bytes] = index_db.get(self._SIZE_KEY)
+        self._size: int = 0 if size_bytes is None else int.from_bytes(size_bytes, DATA_BYTE_ORDER)
+
+        last_block_bytes: Optional[bytes] = index_db.get(self._LAST_BLOCK_KEY)
+        self._last_block: Optional['Block'] = None
+        if last_block_bytes is not None:
+            self._last_block = Block(int.from_bytes(last_block_bytes[:_HEIGHT_SIZE], DATA_BYTE_ORDER),
+                                     last_block_bytes[_HEIGHT_SIZE:], 0, None)
+
+        self._file = open(data_path, 'ab')
+        file_size: int = self._file.seek(0, os.SEEK_END)
+        if file_size > self._size:
+            Logger.warning(f'Truncate the transaction results not indexed: {file_size} > {self._size}',
+                           ICON_SERVICE_LOG_TAG)
+            self._file.truncate(self._size)
+        elif file_size < self._size:
+            raise DatabaseException(f'Transaction result store is broken: {file_size} < {self._size}')
+
+        self._fd: int = os.open(data_path, os.O_RDONLY)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+
+            self._file.close()
+            self._file = None
+            os.close(self._fd)
+            self._index_db.close()
+
+    @property
+    def last_block(self) -> Optional['Block']:
+        """The last block whose results are stored. Only its height and hash are available
+        """
+        return self._last_block
+
+    def check_last_block(self, last_block: Optional['Block']) -> bool:
+        """Compares the last block stored with the last committed block
+
+        The mismatch is logged because the missing results can't be restored.
+
+        :param last_block: the last committed block
+        :return: True if the results of the last committed block are stored
+        """
+        stored: Optional['Block'] = self._last_block
+        if last_block is None or (stored is not None and stored.hash == last_block.hash):
+            return True
+
+        if stored is None:
+            Logger.warning(f'Transaction results before block {last_block.height + 1} are not stored',
+                           ICON_SERVICE_LOG_TAG)
+        elif stored.height < last_block.height:
+            Logger.warning(f'Transaction results of block {stored.height + 1} ~ {last_block.height} are missing',
+                           ICON_SERVICE_LOG_TAG)
+        else:
+            Logger.warning(f'Transaction result store does not match the committed blocks: '
+                           f'stored({stored.height}, 0x{stored.hash.hex()}) '
+                           f'committed({last_block.height}, 0x{last_block.hash.hex()})',
+                           ICON_SERVICE_LOG_TAG)
+        return False
+
+    def put_block(self, block: 'Block', tx_results: List['TransactionResult']) -> None:
+        """Appends the results of a committed block
+
+        :param block: committed block
+        :param tx_results: the results of the transactions in the block
+        """
+        chunks = []
+        states = {}
+        offset: int = self._size
+        for tx_result in tx_results:
+            data: bytes = self.encode(tx_result)
+            chunks.append(data)
+            states[self._TX_PREFIX + tx_result.tx_hash] = \
+                offset.to_bytes(_OFFSET_SIZE, DATA_BYTE_ORDER) + len(data).to_bytes(_LENGTH_SIZE, DATA_BYTE_ORDER)
+            offset += len(data)
+
+        states[self._SIZE_KEY] = offset.to_bytes(_OFFSET_SIZE, DATA_BYTE_ORDER)
+        states[self._LAST_BLOCK_KEY] = block.height.to_bytes(_HEIGHT_SIZE, DATA_BYTE_ORDER) + block.hash
+
+        with self._lock:
+            # The results are indexed after written not to be read partially
+            self._file.write(b''.join(chunks))
+            self._file.flush()
+            self._index_db.write_batch(states)
+            self._size = offset
+            self._last_block = Block(block.height, block.hash, 0, None)
+
+    def get(self, tx_hash: bytes) -> Optional['TransactionResult']:
+        """Returns the result of a transaction
+
+        :param tx_hash: transaction hash
+        :return: None if the transaction is not in the committed blocks
+        """
+        value: Optional[bytes] = self._index_db.get(self._TX_PREFIX + tx_hash)
+        if value is None:
+            return None
+
+        offset: int = int.from_bytes(value[:_OFFSET_SIZE], DATA_BYTE_ORDER)
+        length: int = int.from_bytes(value[_OFFSET_SIZE:], DATA_BYTE_ORDER)
+        data: bytes = os.pread(self._fd, length, offset)
+        if len(data) != length:
+            raise DatabaseException(f'Transaction result store is broken: 0x{tx_hash.hex()}')
+
+        return self.decode(data)
+
+    @classmethod
+    def encode(cls, tx_result: 'TransactionResult') -> bytes:
+        to = tx_result.to
+        if isinstance(to, MalformedAddress):
+            # MalformedAddress can't be restored from bytes
+            to = str(to)
+
+        failure = None
+        if tx_result.status == TransactionResult.FAILURE and tx_result.failure:
+            failure = [tx_result.failure.code, tx_result.failure.message]
+
+        event_logs = None
+        if tx_result.event_logs is not None:
+            event_logs = [[event_log.score_address, event_log.indexed, event_log.data]
+                          for event_log in tx_result.event_logs if isinstance(event_log, EventLog)]
+
+        logs_bloom = None if tx_result.logs_bloom is None else int(tx_result.logs_bloom)
+
+        return MsgPackForDB.dumps([
+            cls._VERSION,
+            tx_result.tx_hash,
+            tx_result.block_height,
+            tx_result.block_hash,
+            tx_result.tx_index,
+            to,
+            tx_result.score_address,
+            tx_result.step_used,
+            tx_result.step_price,
+            tx_result.cumulative_step_used,
+            event_logs,
+            logs_bloom,
+            tx_result.status,
+            failure
+        ])
+
+    @classmethod
+    def decode(cls, data: bytes) -> 'TransactionResult':
+        version, tx_hash, block_height, block_hash, tx_index, to, score_address, step_used, step_price, \
+            cumulative_step_used, event_logs, logs_bloom, status, failure = MsgPackForDB.loads(data)
+        if version != cls._VERSION:
+            raise DatabaseException(f'Unsupported transaction result version: {version}')
+
+        if isinstance(to, str):
+            to = MalformedAddress.from_string(to)
+
+        tx_result = TransactionResult(
+            Transaction(tx_hash, tx_index),
+            Block(block_height, block_hash, 0, None),
+            to,
+            score_address,
+            step_used,
+            step_price,
+            cumulative_step_used,
+            None if event_logs is None else [EventLog(*event_log) for event_log in event_logs],
+            None if logs_bloom is None else BloomFilter(logs_bloom),
+            status)
+
+        if failure is not None:
+            tx_result.failure = TransactionResult.Failure(*failure)
+
+        return tx_result
@@ -168,8 +168,9 @@ class InternalCall(object):
 
         context.tx_batch.enter_call()
 
-        context.event_log_stack.append(context.event_logs)
-        context.event_logs = []
+        # The event logs of the transaction are kept in a single list
+        # and the call is recorded with the index where its event logs start
+        context.event_log_stack.append(len(context.event_logs))
 
     @staticmethod
     def revert_call(context: 'IconScoreContext') -> None:
@@ -180,7 +181,9 @@ class InternalCall(object):
             return
 
         context.tx_batch.revert_call()
-        context.event_logs.clear()
+
+        start: int = context.event_log_stack[-1]
+        del context.event_logs[start:]
 
     @staticmethod
     def leave_call(context: 'IconScoreContext') -> None:
@@ -190,6 +193,4 @@ class InternalCall(object):
             return
 
         context.tx_batch.leave_call()
-
-        prev_event_logs = context.event_log_stack.pop()
-        context.event_logs = prev_event_logs + context.event_logs
+        context.event_log_stack.pop()
@@ -15,12 +15,12 @@
 # limitations under the License.
 
 from enum import IntEnum, unique
-from struct import Struct
+from struct import Struct, error as struct_error
 
 from ..base.exception import InvalidParamsException, OutOfBalanceException
 from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ..base.address import Address
@@ -67,13 +67,22 @@ class AccountFlag(IntEnum):
 class Account(object):
     """Account class
     Contains information of the account indicated by address.
+
+    An account read from db keeps its bytes and decodes them on the first access to its fields.
+    The bytes are returned by to_bytes() until the account is changed.
     """
 
+    __slots__ = ('_address', '_bytes', '_decoded', '_type', '_icx', '_locked', '_c_rep', '_installed')
+
     # leveldb account value structure (bigendian, 36 bytes)
     # version(1) | type(1) | flags(1) | reserved(1) |
     # icx(DEFAULT_BYTE_SIZE)
     _struct = Struct(f'>BBBx{DEFAULT_BYTE_SIZE}s')
 
+    # The flags kept in bytes. Others are dropped by to_bytes()
+    _SERIALIZED_FLAGS = AccountFlag.LOCKED | AccountFlag.C_REP
+    _ACCOUNT_TYPE_VALUES = frozenset(AccountType)
+
     def __init__(self,
                  account_type: 'AccountType'=AccountType.GENERAL,
                  address: 'Address'=None,
@@ -83,13 +92,30 @@ class Account(object):
                  installed: bool=False) -> None:
         """Constructor
         """
-        self._type = account_type
         self._address = address
+        # Serialized form of the fields. None if they have been changed after serialized
+        self._bytes: Optional[bytes] = None
+        self._decoded = True
+        self._type = account_type
         self._icx = icx
         self._locked = locked
         self._c_rep = c_rep
         self._installed = installed
 
+    def _decode(self) -> None:
+        version, account_type, flags, amount = Account._struct.unpack(self._bytes)
+
+        self._type = AccountType(account_type)
+        self._icx = int.from_bytes(amount, DATA_BYTE_ORDER)
+        self._locked = bool(flags & AccountFlag.LOCKED)
+        self._c_rep = bool(flags & AccountFlag.C_REP)
+        self._decoded = True
+
+    def _on_change(self) -> None:
+        if not self._decoded:
+            self._decode()
+        self._bytes = None
+
     @property
     def address(self) -> 'Address':
         """Address object
@@ -112,6 +138,8 @@ class Account(object):
 
         :return: AccountType value
         """
+        if not self._decoded:
+            self._decode()
         return self._type
 
     @type.setter
@@ -122,6 +150,7 @@ class Account(object):
         """
         if not isinstance(value, AccountType):
             raise ValueError('Invalid AccountType')
+        self._on_change()
         self._type = value
 
     @property
@@ -130,6 +159,8 @@ class Account(object):
 
         :return: True(locked) False(unlocked)
         """
+        if not self._decoded:
+            self._decode()
         return self._locked
 
     @locked.setter
@@ -138,6 +169,7 @@ class Account(object):
 
         :param value: True(locked) False(unlocked)
         """
+        self._on_change()
         self._locked = bool(value)
 
     @property
@@ -146,6 +178,8 @@ class Account(object):
 
         :return: True(c_rep) False(not c_rep)
         """
+        if not self._decoded:
+            self._decode()
         return self._c_rep
 
     @c_rep.setter
@@ -154,6 +188,7 @@ class Account(object):
 
         :param value: True(c_rep) False(not c_rep)
         """
+        self._on_change()
         self._c_rep = bool(value)
 
     @property
@@ -174,6 +209,8 @@ class Account(object):
 
         :return: balance in loop
         """
+        if not self._decoded:
+            self._decode()
         return self._icx
 
     def deposit(self, value: int) -> None:
@@ -186,6 +223,7 @@ class Account(object):
             raise InvalidParamsException(
                 'Failed to deposit: value is not int type or value < 0')
 
+        self._on_change()
         self._icx += value
 
     def withdraw(self, value: int) -> None:
@@ -196,9 +234,10 @@ class Account(object):
         if not isinstance(value, int) or value < 0:
             raise InvalidParamsException(
                 'Failed to withdraw: value is not int type or value < 0')
-        if self._icx < value:
+        if self.icx < value:
             raise OutOfBalanceException('Out of balance')
 
+        self._on_change()
         self._icx -= value
 
     def __eq__(self, other) -> bool:
@@ -220,6 +259,24 @@ class Account(object):
         """
         return not self.__eq__(other)
 
+    def __copy__(self) -> 'Account':
+        """Returns a decoded copy which can be changed independently
+        """
+        if not self._decoded:
+            self._decode()
+
+        account = Account.__new__(Account)
+        account._address = self._address
+        account._bytes = self._bytes
+        account._decoded = True
+        account._type = self._type
+        account._icx = self._icx
+        account._locked = self._locked
+        account._c_rep = self._c_rep
+        account._installed = self._installed
+
+        return account
+
     @staticmethod
     def from_bytes(buf: bytes):
         """Create Account object from bytes data
@@ -227,17 +284,20 @@ class Account(object):
         :param buf: (bytes) bytes data including Account information
         :return: (Account) account object
         """
+        if len(buf) != Account._struct.size:
+            raise struct_error(f'unpack requires a buffer of {Account._struct.size} bytes')
 
-        version, account_type, flags, amount = \
-            Account._struct.unpack(buf)
+        account = Account.__new__(Account)
+        account._address = None
+        account._installed = False
+        account._decoded = False
 
-        amount = int.from_bytes(amount, DATA_BYTE_ORDER)
+        account._bytes = buf
 
-        account = Account()
-        account.type = AccountType.from_int(account_type)
-        account._locked = bool(flags & AccountFlag.LOCKED)
-        account._c_rep = bool(flags & AccountFlag.C_REP)
-        account._icx = amount
+        if buf[0] != ACCOUNT_DATA_STRUCTURE_VERSION or buf[3] != 0 \
+                or buf[2] & ~Account._SERIALIZED_FLAGS != 0 or buf[1] not in Account._ACCOUNT_TYPE_VALUES:
+            # Decoded at once to drop the fields which to_bytes() doesn't keep
+            account._on_change()
 
         return account
 
@@ -246,6 +306,8 @@ class Account(object):
 
         :return: data including information of account object
         """
+        if self._bytes is not None:
+            return self._bytes
 
         # for extendability
         version = ACCOUNT_DATA_STRUCTURE_VERSION
@@ -256,7 +318,9 @@ class Account(object):
         if self._c_rep:
             flags |= AccountFlag.C_REP
 
-        return Account._struct.pack(version, self._type, flags, self._icx.to_bytes(DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER))
+        self._bytes = Account._struct.pack(
+            version, self._type, flags, self._icx.to_bytes(DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER))
+        return self._bytes
 
     def __bytes__(self) -> bytes:
         """operator bytes() overriding
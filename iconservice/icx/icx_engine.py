@@ -67,6 +67,10 @@ class IcxEngine(object):
     def storage(self) -> 'IcxStorage':
         return self._storage
 
+    @property
+    def fee_treasury_address(self) -> 'Address':
+        return self._fee_treasury_address
+
     def close(self) -> None:
         """Close resources
         """
@@ -206,12 +210,37 @@ class IcxEngine(object):
         """Charge a fee for a tx
         It MUST NOT raise any exceptions
 
+        If context.deferred_fee is not None,
+        the fee is only withdrawn from the sender and added to context.deferred_fee.
+        It should be deposited to treasury later with deposit_fee()
+
         :param context:
         :param from_:
         :param fee:
         :return:
         """
-        self._transfer(context, from_, self._fee_treasury_address, fee)
+        if context.deferred_fee is None:
+            self._transfer(context, from_, self._fee_treasury_address, fee)
+        elif from_ != self._fee_treasury_address and fee > 0:
+            from_account = self._storage.get_account(context, from_)
+            from_account.withdraw(fee)
+            self._storage.put_account(context, from_account.address, from_account)
+
+            context.deferred_fee += fee
+
+    def deposit_fee(self,
+                    context: 'IconScoreContext',
+                    fee: int) -> None:
+        """Deposit the fee deferred by charge_fee() to treasury
+
+        :param context:
+        :param fee:
+        :return:
+        """
+        if fee > 0:
+            treasury_account = self._storage.get_account(context, self._fee_treasury_address)
+            treasury_account.deposit(fee)
+            self._storage.put_account(context, treasury_account.address, treasury_account)
 
     def transfer(self,
                  context: 'IconScoreContext',
@@ -14,12 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Optional
+from collections import ChainMap
+from copy import copy
+from typing import TYPE_CHECKING, Optional, Dict
 
 from .icx_account import Account
 from ..base.address import Address
 from ..base.block import Block
-from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER
+from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, IconScoreContextType
 
 if TYPE_CHECKING:
     from ..database.db import ContextDatabase
@@ -39,6 +41,8 @@ class IcxStorage(object):
         """
         self._db = db
         self._last_block = None
+        # The accounts decoded in the block being invoked. key: account key, value: decoded account
+        self._decoded_accounts: Dict[bytes, 'Account'] = {}
 
     @property
     def db(self) -> 'ContextDatabase':
@@ -63,6 +67,20 @@ class IcxStorage(object):
         self._db.put(context, self._LAST_BLOCK_KEY, bytes(block))
         self._last_block = block
 
+    def commit_block(self, context: 'IconScoreContext', block: 'Block', states: dict) -> None:
+        """Writes the states changed by a block and the block info in one batch
+
+        last_block in db never points to a block whose states are not written
+        even if the batch is written asynchronously.
+
+        :param context:
+        :param block: the block to commit
+        :param states: the states changed by the block
+        """
+        block_info = {self._LAST_BLOCK_KEY: bytes(block)}
+        self._db.write_batch(context, ChainMap(block_info, states))
+        self._last_block = block
+
     def get_text(self, context: 'IconScoreContext', name: str) -> Optional[str]:
         """Return text format value from db
 
@@ -107,13 +125,31 @@ class IcxStorage(object):
         value = self._db.get(context, key)
 
         if value:
-            account = Account.from_bytes(value)
+            account = self._decode_account(context, key, value)
         else:
             account = Account()
 
         account.address = address
         return account
 
+    def _decode_account(self, context: 'IconScoreContext', key: bytes, value: bytes) -> 'Account':
+        if context is None or context.type != IconScoreContextType.INVOKE:
+            return Account.from_bytes(value)
+
+        decoded: Optional['Account'] = self._decoded_accounts.get(key)
+        if decoded is None or decoded.to_bytes() != value:
+            decoded = Account.from_bytes(value)
+            self._decoded_accounts[key] = decoded
+
+        # The decoded one is kept unchanged for the next transactions
+        return copy(decoded)
+
+    def clear_decoded_accounts(self) -> None:
+        """Drops the accounts decoded in the previous block
+        It is called before a block is invoked
+        """
+        self._decoded_accounts.clear()
+
     def put_account(self,
                     context: 'IconScoreContext',
                     address: 'Address',
@@ -128,6 +164,10 @@ class IcxStorage(object):
         value = account.to_bytes()
         self._db.put(context, key, value)
 
+        if context is not None and context.type == IconScoreContextType.INVOKE:
+            # Looked up without decoding when read again in the block
+            self._decoded_accounts[key] = copy(account)
+
     def delete_account(self,
                        context: 'IconScoreContext',
                        address: 'Address') -> None:
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Set
+
+from iconcommons.logger import Logger
+
+from .database.batch import BlockBatch
+from .icon_constant import ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from .base.block import Block
+    from .database.batch import TransactionBatch
+    from .iconscore.icon_score_result import TransactionResult
+
+
+class ReadRecordingBlockBatch(BlockBatch):
+    """BlockBatch for a speculative transaction
+
+    It always stays empty, so the transaction runs against the state of the block start.
+    Every key which is looked up in it is recorded to detect conflicts
+    with the transactions executed before in the same block.
+    """
+
+    def __init__(self, block: Optional['Block'] = None, parent: Optional['BlockBatch'] = None):
+        super().__init__(block, parent)
+        self.read_keys: Set[bytes] = set()
+
+    def __contains__(self, key) -> bool:
+        self.read_keys.add(key)
+        return super().__contains__(key)
+
+
+class SpeculativeResult(object):
+    """The outcome of a transaction executed against the state of the block start
+    """
+
+    def __init__(self,
+                 tx_result: 'TransactionResult',
+                 tx_batch: 'TransactionBatch',
+                 read_keys: Set[bytes],
+                 deferred_fee: int) -> None:
+        """Constructor
+
+        :param tx_result: transaction result
+        :param tx_batch: states written by the transaction
+        :param read_keys: keys which were not found in tx_batch while executing
+        :param deferred_fee: fee withdrawn from the sender, not deposited to treasury yet
+        """
+        self.tx_result = tx_result
+        self.tx_batch = tx_batch
+        self.read_keys = read_keys
+        self.deferred_fee = deferred_fee
+
+    def conflicts_with(self, block_batch: 'BlockBatch') -> bool:
+        """Check if the transaction read any states changed in the current block
+
+        :param block_batch: states changed by the previous transactions in the block
+        :return: True if the result is not valid anymore
+        """
+        if len(block_batch) == 0:
+            return False
+
+        for key in self.read_keys:
+            if key in block_batch:
+                return True
+
+        return False
+
+
+class Speculation(object):
+    """Speculative results of the transactions in a block
+    """
+
+    def __init__(self, futures: Dict[int, Future]) -> None:
+        self._futures = futures
+        self.hit_count = 0
+        self.conflict_count = 0
+
+    def take(self, index: int, block_batch: 'BlockBatch') -> Optional['SpeculativeResult']:
+        """Returns the speculative result of the transaction indicated by index
+        only if it is still valid on block_batch
+
+        :param index: transaction index in the block
+        :param block_batch: states changed by the previous transactions in the block
+        :return: SpeculativeResult or None if the transaction should be executed serially
+        """
+        future: Future = self._futures.pop(index, None)
+        if future is None:
+            return None
+
+        try:
+            result: 'SpeculativeResult' = future.result()
+        except BaseException as e:
+            Logger.debug(f'Speculative execution failed: index({index}) {e}', ICON_SERVICE_LOG_TAG)
+            self.conflict_count += 1
+            return None
+
+        if result.conflicts_with(block_batch):
+            self.conflict_count += 1
+            return None
+
+        self.hit_count += 1
+        return result
+
+    def cancel(self) -> None:
+        """Cancel the remaining speculative executions
+        and wait for the running ones to finish
+        """
+        for future in self._futures.values():
+            future.cancel()
+
+        wait(self._futures.values())
+        self._futures.clear()
+
+
+class OptimisticExecutor(object):
+    """Runs transactions of a block concurrently against the state of the block start
+
+    IconServiceEngine merges each result in transaction order
+    and executes the transaction again serially when the result conflicts
+    with the states changed by the previous transactions.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Constructor
+
+        :param max_workers: the number of threads executing transactions speculatively
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='OptimisticExecutor')
+
+    def execute(self, jobs: Dict[int, Callable[[], 'SpeculativeResult']]) -> 'Speculation':
+        """Start speculative executions
+
+        :param jobs: transaction index -> function executing the transaction
+        :return: Speculation
+        """
+        futures = {index: self._executor.submit(job) for index, job in jobs.items()}
+        return Speculation(futures)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -59,8 +59,11 @@ class PrecommitData(object):
 
 
 class PrecommitDataManager(object):
-    """Manages multiple precommit data made from next candidate block
+    """Manages multiple precommit data made from next candidate blocks
 
+    Precommit data are organized as a tree rooted at the last committed block.
+    A block can be invoked on top of an uncommitted parent block
+    and looks up the states of its uncommitted ancestors through BlockBatch.parent.
     """
 
     def __init__(self):
@@ -91,16 +94,63 @@ class PrecommitDataManager(object):
         precommit_data = self._precommit_data_mapper.get(block_hash)
         return precommit_data
 
+    def get_parent(self, block: 'Block') -> Optional['PrecommitData']:
+        """Returns the precommit data of the uncommitted parent of a given block
+
+        :param block: block to invoke
+        :return: None if the parent is the last committed block
+        """
+        return self._precommit_data_mapper.get(block.prev_hash)
+
+    def get_ancestors(self, block: 'Block') -> list:
+        """Returns the precommit data of the uncommitted ancestors of a given block
+
+        :param block:
+        :return: precommit data list from the oldest one to the parent
+        """
+        ancestors = []
+
+        precommit_data: Optional['PrecommitData'] = self.get_parent(block)
+        while precommit_data is not None:
+            ancestors.append(precommit_data)
+            precommit_data = self.get_parent(precommit_data.block)
+
+        ancestors.reverse()
+        return ancestors
+
     def commit(self, block: 'Block'):
         with self._lock:
             self._last_block = block
 
-        # Clear remaining precommit data which have the same block height
-        self._precommit_data_mapper.clear()
+        # Keep the descendants of the committed block only
+        # Other precommit data are on the losing forks
+        remaining = {}
+        for precommit_data in sorted(self._precommit_data_mapper.values(), key=lambda x: x.block.height):
+            precommit_block: 'Block' = precommit_data.block
+            if precommit_block.height <= block.height:
+                continue
+
+            if precommit_block.prev_hash == block.hash:
+                # The states of the parent are written to StateDB
+                precommit_data.block_batch.parent = None
+                remaining[precommit_block.hash] = precommit_data
+            elif precommit_block.prev_hash in remaining:
+                remaining[precommit_block.hash] = precommit_data
+
+        self._precommit_data_mapper = remaining
 
     def rollback(self, block: 'Block'):
-        if block.hash in self._precommit_data_mapper:
-            del self._precommit_data_mapper[block.hash]
+        """Removes the precommit data of a given block and its descendants
+
+        :param block:
+        """
+        removed = {block.hash}
+        for precommit_data in sorted(self._precommit_data_mapper.values(), key=lambda x: x.block.height):
+            if precommit_data.block.prev_hash in removed:
+                removed.add(precommit_data.block.hash)
+
+        for block_hash in removed:
+            self._precommit_data_mapper.pop(block_hash, None)
 
     def empty(self) -> bool:
         return len(self._precommit_data_mapper) == 0
@@ -115,6 +165,10 @@ class PrecommitDataManager(object):
     def validate_block_to_invoke(self, block: 'Block'):
         """Check if the block to invoke is valid before invoking it
 
+        The parent of the block should be the last committed block or an uncommitted one.
+        An uncommitted parent should not have changed STEP properties
+        which are shared by all blocks until it is committed.
+
         :param block: block to invoke
         """
         if self._last_block is None:
@@ -124,16 +178,28 @@ class PrecommitDataManager(object):
                 block.height == self._last_block.height + 1:
             return
 
+        parent: Optional['PrecommitData'] = self._precommit_data_mapper.get(block.prev_hash)
+        if parent is not None and block.height == parent.block.height + 1:
+            for precommit_data in self.get_ancestors(block):
+                if precommit_data.precommit_flag & PrecommitFlag.STEP_ALL_CHANGED != PrecommitFlag.NONE:
+                    raise InvalidParamsException(
+                        f'Failed to invoke a block: '
+                        f'STEP properties changed in uncommitted block({precommit_data.block}) '
+                        f'block_to_invoke({block})')
+            return
+
         raise InvalidParamsException(
             f'Failed to invoke a block: '
             f'last_block({self._last_block}) '
             f'block_to_invoke({block})')
 
-    def validate_precommit_block(self, precommit_block: 'Block'):
+    def validate_precommit_block(self, precommit_block: 'Block', allow_uncommitted_parent: bool = False):
         """Check block validation
         before write_precommit_state() or remove_precommit_state()
 
         :param precommit_block:
+        :param allow_uncommitted_parent: if True, the parent of precommit_block can be uncommitted one
+            It is only available on remove_precommit_state()
         """
         assert isinstance(precommit_block, Block)
 
@@ -146,6 +212,8 @@ class PrecommitDataManager(object):
             return
 
         precommit_block = precommit_data.block
+        if allow_uncommitted_parent and precommit_block.prev_hash in self._precommit_data_mapper:
+            return
 
         if self._last_block.hash != precommit_block.prev_hash or \
                 self._last_block.height + 1 != precommit_block.height:
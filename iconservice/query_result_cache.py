@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Set
+
+from iconcommons.logger import Logger
+
+from .base.address import Address
+from .base.block import Block
+from .icon_constant import ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from .database.snapshot import DatabaseSnapshot
+
+
+class ReadRecordingBlock(Block):
+    """Block of a cached query
+
+    It records whether the query depends on the block height or timestamp
+    which change on every commit.
+    """
+
+    def __init__(self, block: 'Block') -> None:
+        super().__init__(block.height, block.hash, block.timestamp, block.prev_hash)
+        self.accessed = False
+
+    @property
+    def height(self) -> int:
+        self.accessed = True
+        return self._height
+
+    @property
+    def timestamp(self) -> int:
+        self.accessed = True
+        return self._timestamp
+
+
+class ReadRecordingSnapshot(object):
+    """DatabaseSnapshot for a cached query
+
+    Every key which is looked up in it is recorded
+    to invalidate the result when any of the keys is changed by a block.
+    """
+
+    def __init__(self, snapshot: 'DatabaseSnapshot') -> None:
+        self._snapshot = snapshot
+        self.block: Optional['Block'] = \
+            None if snapshot.block is None else ReadRecordingBlock(snapshot.block)
+        self.read_keys: Set[bytes] = set()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        self.read_keys.add(key)
+        return self._snapshot.get(key)
+
+    def record(self, key: bytes) -> None:
+        self.read_keys.add(key)
+
+    @property
+    def block_accessed(self) -> bool:
+        return self.block is not None and self.block.accessed
+
+
+class _Entry(object):
+    __slots__ = ('value', 'read_keys')
+
+    def __init__(self, value: Any, read_keys: Set[bytes]) -> None:
+        self.value = value
+        self.read_keys = read_keys
+
+
+class QueryResultCache(object):
+    """Caches the results of read-only queries on the last committed block
+
+    A result is valid for the block whose hash it was computed on
+    and is carried over to the next block unless the block changes any of the keys the query read.
+    Results depending on the block height or timestamp are dropped on every commit.
+    """
+
+    CACHEABLE_METHODS = ('icx_getBalance', 'icx_getTotalSupply', 'icx_call', 'icx_getScoreApi')
+    # A query reading more keys than this is not cached to bound the memory for the key index
+    MAX_READ_KEYS = 256
+
+    _IMMUTABLE_TYPES = (int, str, bytes, bool, Address, type(None))
+
+    def __init__(self, max_size: int, block: Optional['Block']) -> None:
+        """Constructor
+
+        :param max_size: the max number of results kept
+        :param block: the last committed block
+        """
+        self._max_size = max_size
+        self._lock = Lock()
+        self._block_hash: Optional[bytes] = None if block is None else block.hash
+        self._entries: 'OrderedDict[tuple, _Entry]' = OrderedDict()
+        # state key -> the keys of the entries which read it
+        self._key_index: Dict[bytes, Set[tuple]] = {}
+
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.invalidated_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total: int = self.hit_count + self.miss_count
+        return self.hit_count / total if total > 0 else 0.0
+
+    def is_cacheable(self, method: str) -> bool:
+        return method in self.CACHEABLE_METHODS
+
+    def query(self,
+              snapshot: 'DatabaseSnapshot',
+              method: str,
+              params: dict,
+              func: Callable[['ReadRecordingSnapshot', str, dict], Any]) -> Any:
+        """Returns the cached result of a query or runs it with func
+
+        :param snapshot: the snapshot the query is pinned to
+        :param method: query method
+        :param params: query params converted to the original types
+        :param func: runs the query on the given snapshot
+        :return: the result of the query
+        """
+        block_hash: Optional[bytes] = None if snapshot.block is None else snapshot.block.hash
+        key: tuple = (method, self._freeze(params))
+
+        with self._lock:
+            entry: Optional['_Entry'] = self._entries.get(key) if block_hash == self._block_hash else None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hit_count += 1
+                return self._copy(entry.value)
+            self.miss_count += 1
+
+        recording_snapshot = ReadRecordingSnapshot(snapshot)
+        value: Any = func(recording_snapshot, method, params)
+
+        if not recording_snapshot.block_accessed and len(recording_snapshot.read_keys) <= self.MAX_READ_KEYS:
+            self._put(block_hash, key, self._copy(value), recording_snapshot.read_keys)
+
+        return value
+
+    def _put(self, block_hash: Optional[bytes], key: tuple, value: Any, read_keys: Set[bytes]) -> None:
+        with self._lock:
+            # A block has been committed while the query was running
+            if block_hash != self._block_hash:
+                return
+
+            self._remove(key)
+            self._entries[key] = _Entry(value, read_keys)
+            for read_key in read_keys:
+                self._key_index.setdefault(read_key, set()).add(key)
+
+            while len(self._entries) > self._max_size:
+                self._remove(next(iter(self._entries)))
+
+    def on_block_committed(self, block: 'Block', changed_keys: Iterable[bytes], clear: bool = False) -> None:
+        """Invalidates the results which read any of the keys changed by the committed block
+
+        :param block: the committed block
+        :param changed_keys: the keys written by the block
+        :param clear: drops all results, when the states kept out of StateDB have been changed
+        """
+        with self._lock:
+            size: int = len(self._entries)
+
+            if clear:
+                self._entries.clear()
+                self._key_index.clear()
+            else:
+                for changed_key in changed_keys:
+                    for key in tuple(self._key_index.get(changed_key, ())):
+                        self._remove(key)
+
+            self.invalidated_count += size - len(self._entries)
+            self._block_hash = block.hash
+
+            Logger.debug(f'Query result cache: '
+                         f'height={block.height} '
+                         f'size={len(self._entries)} '
+                         f'invalidated={size - len(self._entries)} '
+                         f'hit_rate={self.hit_rate:.3f}',
+                         ICON_SERVICE_LOG_TAG)
+
+    def _remove(self, key: tuple) -> None:
+        entry: Optional['_Entry'] = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for read_key in entry.read_keys:
+            keys: Set[tuple] = self._key_index[read_key]
+            keys.discard(key)
+            if not keys:
+                del self._key_index[read_key]
+
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        """Converts query params to a hashable key
+        """
+        if isinstance(value, dict):
+            return tuple(sorted((k, cls._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        return value
+
+    @classmethod
+    def _copy(cls, value: Any) -> Any:
+        # The response of a query is modified in place when converted for JSON-RPC
+        if isinstance(value, cls._IMMUTABLE_TYPES):
+            return value
+        return deepcopy(value)
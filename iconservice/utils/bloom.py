@@ -9,6 +9,10 @@ from __future__ import absolute_import
 import numbers
 import operator
 import hashlib
+from functools import lru_cache
+
+# The number of values whose bloom bits are kept by get_bloom_mask()
+BLOOM_MASK_CACHE_SIZE = 4096
 
 
 def get_chunks_for_bloom(value_hash):
@@ -29,6 +33,18 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
+@lru_cache(maxsize=BLOOM_MASK_CACHE_SIZE)
+def get_bloom_mask(value):
+    """Returns all the bloom bits of a value at once
+
+    The result is kept for values added repeatedly like SCORE addresses and event signatures.
+    """
+    value_hash = hashlib.sha3_256(value).digest()
+    return (1 << (((value_hash[0] << 8) + value_hash[1]) & 2047)) | \
+        (1 << (((value_hash[2] << 8) + value_hash[3]) & 2047)) | \
+        (1 << (((value_hash[4] << 8) + value_hash[5]) & 2047))
+
+
 class BloomFilter(numbers.Number):
     value = None
 
@@ -41,8 +57,7 @@ class BloomFilter(numbers.Number):
     def add(self, value):
         if not isinstance(value, bytes):
             raise TypeError("Value must be of type `bytes`")
-        for bloom_bits in get_bloom_bits(value):
-            self.value |= bloom_bits
+        self.value |= get_bloom_mask(value)
 
     def extend(self, iterable):
         for value in iterable:
@@ -57,11 +72,8 @@ class BloomFilter(numbers.Number):
     def __contains__(self, value):
         if not isinstance(value, bytes):
             raise TypeError("Value must be of type `bytes`")
-        return all(
-            self.value & bloom_bits
-            for bloom_bits
-            in get_bloom_bits(value)
-        )
+        bloom_mask = get_bloom_mask(value)
+        return self.value & bloom_mask == bloom_mask
 
     def __index__(self):
         return operator.index(self.value)
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import unittest
+import weakref
+from copy import deepcopy
 
 from iconservice.base.address import Address, AddressPrefix, \
     ICON_EOA_ADDRESS_PREFIX, ICON_CONTRACT_ADDRESS_PREFIX, \
     ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS, is_icon_address_valid, split_icon_address, MalformedAddress
-from iconservice.base.exception import ExceptionCode
+from iconservice.base.exception import ExceptionCode, InvalidParamsException
 from tests import create_address
 
 
@@ -144,6 +147,30 @@ class TestAddress(unittest.TestCase):
         addr = MalformedAddress.from_string(address)
         self.assertEqual(str(addr), address)
 
+    def test_interned_address(self):
+        address: str = str(create_address(AddressPrefix.CONTRACT))
+        addr = Address.from_string(address)
+        self.assertIs(addr, Address.from_string(address))
+        self.assertIs(addr.to_bytes(), Address.from_string(address).to_bytes())
+        self.assertIs(addr, Address.from_bytes(addr.to_bytes()))
+        self.assertIs(address, str(addr))
+
+        # Not interned
+        addr2 = Address(AddressPrefix.CONTRACT, addr.body)
+        self.assertIsNot(addr, addr2)
+        self.assertEqual(addr, addr2)
+        self.assertEqual(hash(addr), hash(addr2))
+        self.assertEqual(addr, deepcopy(addr))
+
+        # Released when no longer referred to
+        ref = weakref.ref(addr)
+        del addr
+        gc.collect()
+        self.assertIsNone(ref())
+
+        with self.assertRaises(AttributeError):
+            addr2.unknown = 0
+
     def test_invalid_address(self):
         address: str = "hx123456"
         with self.assertRaises(BaseException) as e:
@@ -151,6 +178,12 @@ class TestAddress(unittest.TestCase):
         self.assertEqual(e.exception.code, ExceptionCode.INVALID_PARAMETER)
         self.assertEqual(e.exception.message, "Invalid address")
 
+        # Not a string
+        for address in (['hx' + '0' * 40], {'address': 'hx' + '0' * 40}, 1, None, b'\x00' * 20):
+            with self.assertRaises(InvalidParamsException) as e:
+                Address.from_string(address)
+            self.assertEqual(e.exception.message, "Invalid address")
+
 
 if __name__ == '__main__':
     unittest.main()
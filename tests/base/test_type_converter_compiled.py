@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checks if the compiled converters produce the same results as the template interpreter
+with the fixtures of test_type_converter*.py
+"""
+
+import unittest
+from copy import deepcopy
+from unittest.mock import patch
+
+from iconservice.base.type_converter import TypeConverter
+from iconservice.base.type_converter_templates import ParamType, ConstantKeys
+from tests import create_block_hash, create_address, create_tx_hash
+from tests.base import test_type_converter, test_type_converter_iiss
+
+_convert = TypeConverter.convert
+
+
+def _convert_and_compare(params, param_type):
+    original_params = deepcopy(params)
+
+    try:
+        expected = TypeConverter.convert_by_template(params, param_type)
+        expected_error = None
+    except BaseException as e:
+        expected_error = e
+
+    try:
+        actual = _convert(params, param_type)
+        actual_error = None
+    except BaseException as e:
+        actual_error = e
+
+    # params should not be modified
+    assert params == original_params
+
+    if expected_error is not None:
+        assert type(actual_error) == type(expected_error), f'{actual_error!r} != {expected_error!r}'
+        assert str(actual_error) == str(expected_error), f'{actual_error} != {expected_error}'
+        raise actual_error
+
+    assert actual_error is None, f'Unexpected error: {actual_error!r}'
+    assert actual == expected, f'{actual} != {expected}'
+    return actual
+
+
+class _CompareMixin(object):
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(TypeConverter, 'convert', _convert_and_compare)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestCompiledTypeConverter(_CompareMixin, test_type_converter.TestTypeConverter):
+    pass
+
+
+class TestCompiledTypeConverterIISS(_CompareMixin, test_type_converter_iiss.TestTypeConverter):
+    pass
+
+
+class TestCompiledTypeConverterEdgeCases(unittest.TestCase):
+    def test_edge_cases(self):
+        requests = [
+            {},
+            {'method': '', 'params': {'method': '', 'params': None}},
+            {'method': 'icx_getBalance', 'params': {}},
+            {'method': 'icx_getBalance', 'params': ''},
+            {'method': 'icx_getBalance', 'params': 'params'},
+            {'method': 'unknown', 'params': {'version': '0x3'}},
+            {'params': {'version': '0x3'}, 'method': 'icx_getTotalSupply'},
+            {'method': 'ise_getStatus', 'params': {'filter': ['lastBlock', '']}},
+            {'method': 'ise_getStatus', 'params': {'filter': 'lastBlock'}},
+            {'method': 'ise_getStatus', 'params': {'filter': [None]}},
+            {'method': 'icx_call', 'params': {'to': str(create_address(1)), 'data': {'params': {'a': None}}}},
+            {'method': 'icx_call', 'params': {'unknown': None}},
+            {'method': ['icx_call'], 'params': {}},
+        ]
+
+        for request in requests:
+            try:
+                _convert_and_compare(request, ParamType.QUERY)
+            except AssertionError:
+                raise
+            except BaseException:
+                pass
+
+        tx_params = [
+            {'tx_hash': create_tx_hash().hex(), 'data': {}, 'dataType': 'call'},
+            {'txHash': create_tx_hash().hex(), 'tx_hash': create_tx_hash().hex()},
+            {'data': {'method': 'transfer'}, 'dataType': 'call'},
+            {'dataType': 'deploy', 'data': {'contentType': 'application/zip', 'content': '0x00', 'params': {}}},
+            {'dataType': 'unknown', 'data': {'method': 'transfer'}},
+            {'dataType': 'call', 'data': 'data'},
+            {'dataType': 'call', 'data': ['data']},
+            {'value': '', 'fee': '0x0', 'nonce': '0'},
+            {'signature': ''},
+        ]
+
+        for params in tx_params:
+            try:
+                _convert_and_compare({'method': 'icx_sendTransaction', 'params': params},
+                                     ParamType.VALIDATE_TRANSACTION)
+            except AssertionError:
+                raise
+            except BaseException:
+                pass
+
+        self.assertEqual('', TypeConverter.convert('', ParamType.BLOCK))
+        self.assertEqual({}, TypeConverter.convert({}, ParamType.BLOCK))
+        self.assertIsNone(TypeConverter.convert(None, None))
+
+
+class TestCompiledTypeConverterBenchmark(unittest.TestCase):
+    def _make_invoke_request(self, tx_count: int) -> dict:
+        transactions = []
+        for i in range(tx_count):
+            params = {
+                ConstantKeys.VERSION: hex(3),
+                ConstantKeys.FROM: str(create_address()),
+                ConstantKeys.TO: str(create_address(1)),
+                ConstantKeys.VALUE: hex(10 ** 18),
+                ConstantKeys.STEP_LIMIT: hex(10 ** 6),
+                ConstantKeys.TIMESTAMP: hex(1234567890 + i),
+                ConstantKeys.NONCE: hex(i),
+                ConstantKeys.SIGNATURE: 'VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40sz=',
+                ConstantKeys.TX_HASH: create_tx_hash().hex(),
+                ConstantKeys.DATA_TYPE: ConstantKeys.CALL,
+                ConstantKeys.DATA: {
+                    ConstantKeys.METHOD: 'transfer',
+                    ConstantKeys.PARAMS: {'_to': str(create_address()), '_value': hex(i)}
+                }
+            }
+            transactions.append({ConstantKeys.METHOD: 'icx_sendTransaction', ConstantKeys.PARAMS: params})
+
+        return {
+            ConstantKeys.BLOCK: {
+                ConstantKeys.BLOCK_HEIGHT: hex(100),
+                ConstantKeys.BLOCK_HASH: create_block_hash().hex(),
+                ConstantKeys.TIMESTAMP: hex(1234567890),
+                ConstantKeys.PREV_BLOCK_HASH: create_block_hash().hex()
+            },
+            ConstantKeys.TRANSACTIONS: transactions
+        }
+
+    def test_invoke_request(self):
+        request = self._make_invoke_request(1000)
+
+        expected = TypeConverter.convert_by_template(request, ParamType.INVOKE)
+        actual = TypeConverter.convert(request, ParamType.INVOKE)
+        self.assertEqual(expected, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,9 @@
 # limitations under the License.
 
 import unittest
+from copy import deepcopy
+from typing import Optional
+
 from iconservice.base.type_converter import TypeConverter
 from iconservice.base.address import Address
 from tests import create_address
@@ -101,6 +104,50 @@ class TestTypeConverterFunc(unittest.TestCase):
         TypeConverter.convert_data_params(annotations, params)
         self.assertEqual(value, self.test_score.func_param_address1(**params))
 
+    def test_make_data_params_converter(self):
+        def _convert_by_annotations(func, params):
+            copied_params = deepcopy(params)
+            annotations = TypeConverter.make_annotations_from_method(func)
+            TypeConverter.convert_data_params(annotations, copied_params)
+            return copied_params
+
+        address = create_address()
+        cases = [
+            (self.test_score.func_param_int, {"value": hex(1)}),
+            (self.test_score.func_param_int, {"value": "-0x10"}),
+            (self.test_score.func_param_int, {"value": None}),
+            (self.test_score.func_param_int, {}),
+            (self.test_score.func_param_str, {"value": "a", "extra": {"a": ["b"]}}),
+            (self.test_score.func_param_bytes, {"value": "0x1234"}),
+            (self.test_score.func_param_bool, {"value": "0x0"}),
+            (self.test_score.func_param_address1, {"value": str(address)}),
+            (self.test_score.func_param_address2, {"value": str(address)}),
+            (self.test_score.func_param_multiple, {"b": "0x1", "a": str(address), "c": "0x01"}),
+            (self.test_score.func_param_int, {"value": 1}),
+            (self.test_score.func_param_multiple, {"a": "hx1234", "b": "b", "c": "c"}),
+        ]
+
+        for func, params in cases:
+            original_params = deepcopy(params)
+            converter = TypeConverter.make_data_params_converter(func)
+
+            try:
+                expected = _convert_by_annotations(func, params)
+            except BaseException as e:
+                with self.assertRaises(type(e)) as cm:
+                    converter(params)
+                self.assertEqual(str(e), str(cm.exception))
+                continue
+
+            converted_params = converter(params)
+            self.assertEqual(expected, converted_params)
+            self.assertEqual(list(expected), list(converted_params))
+            self.assertEqual(original_params, params)
+
+            # The mutable values are not shared with the original params
+            if "extra" in params:
+                self.assertIsNot(params["extra"], converted_params["extra"])
+
 
 class TestScore:
     def func_param_int(self, value: int) -> int:
@@ -120,4 +167,7 @@ class TestScore:
         return value
 
     def func_param_address2(self, value: 'Address') -> 'Address':
-        return value
\ No newline at end of file
+        return value
+
+    def func_param_multiple(self, a: Address, b: int, c: Optional[bytes] = None) -> None:
+        pass
\ No newline at end of file
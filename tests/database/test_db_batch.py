@@ -18,7 +18,7 @@
 import unittest
 
 from iconservice.base.block import Block
-from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.batch import BlockBatch, TransactionBatch, digest
 from iconservice.utils import sha3_256
 from tests import create_hash_256
 
@@ -122,3 +122,43 @@ class TestBatch(unittest.TestCase):
         block_batch[key2] = b''
         hash2 = block_batch.digest()
         self.assertNotEqual(hash1, hash2)
+
+    def test_digest_incremental(self):
+        block_batch = self.block_batch
+        self.assertEqual(sha3_256(b''), block_batch.digest())
+
+        keys = []
+        for i in range(3):
+            tx_batch = TransactionBatch(create_hash_256())
+            for j in range(300):
+                key = create_hash_256()
+                keys.append(key)
+                tx_batch[key] = None if j % 7 == 0 else f'value{i}{j}'.encode()
+
+            # Overwrites the keys of the previous transactions
+            for key in keys[::50]:
+                tx_batch[key] = f'overwritten{i}'.encode()
+
+            block_batch.update(tx_batch)
+            self.assertEqual(digest(block_batch), block_batch.digest())
+
+        # The same value does not change the digest
+        ret = block_batch.digest()
+        block_batch[keys[0]] = block_batch[keys[0]]
+        self.assertEqual(ret, block_batch.digest())
+
+        block_batch[keys[-1]] = b''
+        block_batch[keys[1]] = None
+        self.assertEqual(digest(block_batch), block_batch.digest())
+
+        del block_batch[keys[500]]
+        block_batch.pop(keys[10])
+        self.assertEqual(digest(block_batch), block_batch.digest())
+
+        block_batch.move_to_end(keys[20], last=False)
+        self.assertEqual(digest(block_batch), block_batch.digest())
+
+        block_batch.clear()
+        self.assertEqual(sha3_256(b''), block_batch.digest())
+        block_batch[keys[0]] = b'value'
+        self.assertEqual(sha3_256(keys[0] + b'|value'), block_batch.digest())
@@ -16,11 +16,15 @@
 
 
 import os
+import threading
 import unittest
+from unittest.mock import Mock, patch
+
+import plyvel
 
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import DatabaseException
-from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.batch import BlockBatch, TransactionBatch, KeyAccessRecorder
 from iconservice.database.db import ContextDatabase
 from iconservice.database.db import IconScoreDatabase
 from iconservice.database.db import KeyValueDatabase
@@ -66,6 +70,125 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value0', db.get(b'key0'))
 
 
+class TestKeyValueDatabaseWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=1024)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_get(self):
+        db = self.db
+        cache = db.cache
+        db.put(b'key0', b'value0')
+
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_write_batch(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        db.put(b'key1', b'value1')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key2'))
+
+        db.write_batch({b'key0': b'value00', b'key1': None, b'key2': b'value2'})
+
+        self.assertEqual(b'value00', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertEqual(b'value2', db.get(b'key2'))
+        # Written values are served from cache
+        self.assertEqual(1, db.cache.misses)
+
+    def test_delete(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+
+        db.delete(b'key0')
+        self.assertIsNone(db.get(b'key0'))
+
+
+class TestKeyValueDatabaseWithAsyncWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=1024, async_write=True)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_write_batch(self):
+        db = self.db
+        writer = db.writer
+        event = threading.Event()
+        write_batch = db._db.write_batch
+
+        def _write_batch(*args, **kwargs):
+            # Blocks the writer thread until the pending batches are checked
+            event.wait()
+            return write_batch(*args, **kwargs)
+
+        with patch.object(writer, '_db', Mock(write_batch=_write_batch)):
+            db.put(b'key0', b'value0')
+            db.write_batch({b'key0': b'value00', b'key1': b'value1'})
+            db.write_batch({b'key1': b'', b'key2': b'value2'})
+            db.delete(b'key2')
+
+            self.assertTrue(writer.pending_count > 0)
+            db.cache.clear()
+            self.assertEqual(b'value00', db.get(b'key0'))
+            self.assertIsNone(db.get(b'key1'))
+            self.assertIsNone(db.get(b'key2'))
+            # The values in the pending batches are not cached
+            self.assertEqual(0, len(db.cache))
+
+            event.set()
+            db.flush()
+
+        self.assertEqual(0, writer.pending_count)
+        self.assertTrue(writer.written_count >= 4)
+        self.assertTrue(writer.max_flush_lag >= writer.flush_lag > 0)
+
+        self.assertEqual(b'value00', db._db.get(b'key0'))
+        self.assertIsNone(db._db.get(b'key1'))
+        self.assertIsNone(db._db.get(b'key2'))
+
+    def test_close(self):
+        db = self.db
+        for i in range(100):
+            db.write_batch({i.to_bytes(1, 'big'): b'value'})
+        db.close()
+
+        db = KeyValueDatabase.from_path(self.state_db_root_path, True)
+        self.assertEqual(100, len(list(db.iterator())))
+        self.db = db
+
+    def test_write_error(self):
+        db = self.db
+
+        with patch.object(db.writer, '_db', Mock(write_batch=Mock(side_effect=plyvel.Error('error')))):
+            db.put(b'key0', b'value0')
+            self.assertRaises(DatabaseException, db.flush)
+
+        # The batch which is failed to be written is still read
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertRaises(DatabaseException, db.put, b'key1', b'value1')
+
+
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
         state_db_root_path = 'state_db'
@@ -185,6 +308,38 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         self.assertEqual(0, len(tx_batch))
         self.assertIsNone(db.get(context, b'key0'))
 
+    def test_get_from_batch_with_access_recorder(self):
+        context = self.context
+        db = self.context_db
+        tx_batch = context.tx_batch
+        tx_batch.access_recorder = KeyAccessRecorder()
+
+        context.block_batch[b'key0'] = b'value0'
+        db.put(context, b'key1', b'value1')
+
+        self.assertEqual(b'value0', db.get(context, b'key0'))
+        self.assertEqual(b'value1', db.get(context, b'key1'))
+        tx_batch.enter_call()
+        self.assertIsNone(db.get(context, b'key2'))
+        tx_batch.leave_call()
+
+        # Reads served by tx_batch itself are not recorded
+        self.assertEqual([(b'key0', 0), (b'key2', 1)], list(tx_batch.access_recorder.reads.items()))
+        self.assertEqual([(b'key1', 0)], list(tx_batch.access_recorder.writes.items()))
+
+    def test_get_uncommitted(self):
+        context = self.context
+        db = self.context_db
+
+        db.key_value_db.put(b'key0', b'value0')
+        context.block_batch[b'key1'] = b'value1'
+        db.put(context, b'key2', None)
+
+        self.assertIs(ContextDatabase.MISSING, db.get_uncommitted(context, b'key0'))
+        self.assertEqual(b'value1', db.get_uncommitted(context, b'key1'))
+        self.assertIsNone(db.get_uncommitted(context, b'key2'))
+        self.assertIs(ContextDatabase.MISSING, db.get_uncommitted(None, b'key1'))
+
     def test_delete_on_readonly_exception(self):
         context = self.context
         db = self.context_db
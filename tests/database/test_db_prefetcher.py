@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase, KeyValueDatabase
+from iconservice.database.prefetcher import StatePrefetcher
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
+
+
+class TestStatePrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.states = {b'key0': b'value0', b'key1': b'value1'}
+        self.db = Mock(spec=KeyValueDatabase)
+        self.db.get = Mock(side_effect=self.states.get)
+        # Runs the prefetch synchronously
+        self.executor = Mock(submit=lambda fn, *args: fn(*args))
+
+    def test_get(self):
+        prefetcher = StatePrefetcher(self.db)
+        prefetcher.start(self.executor, [b'key1', b'key0', b'key2', b'key0'])
+
+        self.assertEqual(3, self.db.get.call_count)
+        self.assertEqual(b'value0', prefetcher.get(b'key0'))
+        self.assertEqual(b'value1', prefetcher.get(b'key1'))
+        # Not present in StateDB
+        self.assertIsNone(prefetcher.get(b'key2'))
+        self.assertIs(StatePrefetcher.MISSING, prefetcher.get(b'key3'))
+        self.assertEqual(3, prefetcher.hit_count)
+        self.assertEqual(1, prefetcher.miss_count)
+
+    def test_cancel(self):
+        prefetcher = StatePrefetcher(self.db)
+        prefetcher.cancel()
+        prefetcher.start(self.executor, [b'key0'])
+
+        self.db.get.assert_not_called()
+        self.assertIs(StatePrefetcher.MISSING, prefetcher.get(b'key0'))
+
+    def test_context_database_get(self):
+        context_db = ContextDatabase(self.db)
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        context.block_batch[b'key1'] = b'value11'
+
+        context.state_prefetcher = StatePrefetcher(self.db)
+        context.state_prefetcher.start(self.executor, [b'key0', b'key1'])
+        self.db.get.reset_mock()
+
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+        # The batches have priority over the prefetched states
+        self.assertEqual(b'value11', context_db.get(context, b'key1'))
+        self.db.get.assert_not_called()
+
+        # Not prefetched
+        self.assertIsNone(context_db.get(context, b'key2'))
+        self.db.get.assert_called_once_with(b'key2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from iconservice.base.block import Block
+from iconservice.database.db import ContextDatabase, KeyValueDatabase
+from iconservice.database.snapshot import SnapshotManager
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
+from tests import create_block_hash, rmtree
+
+
+class TestSnapshotManager(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=1024)
+        self.manager = SnapshotManager(self.db)
+
+    def tearDown(self):
+        self.manager.close()
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_acquire(self):
+        self.assertIsNone(self.manager.acquire())
+
+        block0 = Block(0, create_block_hash(), 0, None)
+        self.db.write_batch({b'key0': b'value0', b'key1': b'value1'})
+        self.manager.update(block0)
+
+        snapshot = self.manager.acquire()
+        self.assertEqual(block0, snapshot.block)
+
+        block1 = Block(1, create_block_hash(), 0, block0.hash)
+        self.db.write_batch({b'key0': b'value00', b'key1': b''})
+        self.manager.update(block1)
+
+        # The acquired snapshot is kept until released
+        self.assertEqual(2, self.manager.open_count)
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertEqual(b'value1', snapshot.get(b'key1'))
+
+        latest = self.manager.acquire()
+        self.assertEqual(block1, latest.block)
+        self.assertEqual(b'value00', latest.get(b'key0'))
+        self.assertIsNone(latest.get(b'key1'))
+
+        self.manager.release(snapshot)
+        self.manager.release(latest)
+        self.assertEqual(1, self.manager.open_count)
+
+    def test_get_from_cache(self):
+        self.db.write_batch({b'key0': b'value0'})
+        self.manager.update(None)
+        cache = self.db.cache
+
+        # The snapshot of the latest states reads and fills the cache
+        snapshot = self.manager.acquire()
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertIn(b'key0', cache)
+        hits: int = cache.hits
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertEqual(hits + 1, cache.hits)
+
+        # The cache is not used once newer states are written
+        self.db.write_batch({b'key0': b'value00', b'key1': b'value1'})
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertIsNone(snapshot.get(b'key1'))
+        self.assertEqual(b'value1', cache.get(b'key1'))
+        self.manager.release(snapshot)
+
+    def test_context_database_get(self):
+        self.db.put(b'key0', b'value0')
+        self.manager.update(None)
+        self.db.put(b'key0', b'value00')
+
+        context_db = ContextDatabase(self.db)
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        self.assertEqual(b'value00', context_db.get(context, b'key0'))
+
+        context.db_snapshot = self.manager.acquire()
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+        self.manager.release(context.db_snapshot)
+
+
+class TestSnapshotManagerWithAsyncWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, async_write=True)
+        self.manager = SnapshotManager(self.db)
+
+    def tearDown(self):
+        self.manager.close()
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_acquire_with_pending_batches(self):
+        writer = self.db.writer
+        event = threading.Event()
+        write_batch = self.db._db.write_batch
+
+        def _write_batch(*args, **kwargs):
+            # Blocks the writer thread until the snapshot is taken
+            event.wait()
+            return write_batch(*args, **kwargs)
+
+        with patch.object(writer, '_db', Mock(write_batch=_write_batch)):
+            self.db.write_batch({b'key0': b'value0', b'key1': b'value1'})
+            self.db.write_batch({b'key1': b''})
+            self.manager.update(None)
+
+            self.assertTrue(writer.pending_count > 0)
+            event.set()
+            self.db.flush()
+
+        self.db.put(b'key0', b'value00')
+        self.db.flush()
+
+        snapshot = self.manager.acquire()
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertIsNone(snapshot.get(b'key1'))
+        self.manager.release(snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconservice.database.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = LRUCache(100)
+
+        self.assertIs(LRUCache.MISSING, cache.get(b'key0'))
+        cache.put(b'key0', b'value0', cache.generation)
+        cache.put(b'key1', None, cache.generation)
+
+        self.assertEqual(b'value0', cache.get(b'key0'))
+        self.assertIsNone(cache.get(b'key1'))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(len(b'key0value0key1'), cache.size)
+
+    def test_put_with_old_generation(self):
+        cache = LRUCache(100)
+
+        generation = cache.generation
+        cache.update([(b'key0', b'value1')])
+        # The value read before the update should be discarded
+        cache.put(b'key0', b'value0', generation)
+        cache.put(b'key1', b'value1', generation)
+
+        self.assertEqual(b'value1', cache.get(b'key0'))
+        self.assertNotIn(b'key1', cache)
+
+    def test_get_with_generation(self):
+        cache = LRUCache(100)
+        cache.update([(b'key0', b'value0')])
+
+        generation = cache.generation
+        self.assertEqual(b'value0', cache.get(b'key0', generation))
+
+        # The value written after the generation is not returned
+        cache.update([(b'key0', b'value1')])
+        self.assertIs(LRUCache.MISSING, cache.get(b'key0', generation))
+        self.assertEqual(b'value1', cache.get(b'key0', cache.generation))
+
+    def test_eviction(self):
+        cache = LRUCache(20)
+
+        cache.update([(b'key0', b'value0'), (b'key1', b'value1')])
+        self.assertEqual(20, cache.size)
+
+        # key0 becomes the most recently used one
+        self.assertEqual(b'value0', cache.get(b'key0'))
+
+        cache.update([(b'key2', b'value2')])
+        self.assertEqual(1, cache.evictions)
+        self.assertNotIn(b'key1', cache)
+        self.assertIn(b'key0', cache)
+        self.assertIn(b'key2', cache)
+        self.assertEqual(20, cache.size)
+
+        # Entry larger than max_size is not cached
+        cache.update([(b'key0', b'v' * 20)])
+        self.assertNotIn(b'key0', cache)
+        self.assertEqual(10, cache.size)
+
+    def test_clear(self):
+        cache = LRUCache(100)
+        cache.update([(b'key0', b'value0')])
+        generation = cache.generation
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+        self.assertNotEqual(generation, cache.generation)
+
+
+if __name__ == '__main__':
+    unittest.main()
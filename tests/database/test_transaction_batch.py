@@ -16,7 +16,8 @@
 import unittest
 
 from iconservice.base.exception import DatabaseException
-from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.batch import BlockBatch, TransactionBatch, KeyAccessRecorder, GOVERNANCE_KEY_PREFIX
+from tests import create_address
 
 
 class TestTransactionBatch(unittest.TestCase):
@@ -84,11 +85,12 @@ class TestTransactionBatch(unittest.TestCase):
         tx_batch[b'key0'] = None
         tx_batch[b'key1'] = b'key1'
         tx_batch[b'key2'] = b'value2'
-        self.assertEqual(5, len(tx_batch))
+        # A key written in several calls is counted once
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(init_call_count + 2, tx_batch.call_count)
 
         tx_batch.leave_call()
-        self.assertEqual(4, len(tx_batch))
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(b'key1', tx_batch[b'key1'])
         self.assertEqual(init_call_count + 1, tx_batch.call_count)
 
@@ -99,6 +101,55 @@ class TestTransactionBatch(unittest.TestCase):
         self.assertEqual(b'value2', tx_batch[b'key2'])
         self.assertEqual(init_call_count, tx_batch.call_count)
 
+    def test_revert_call(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = b'value0'
+        tx_batch[b'key1'] = b'value1'
+
+        tx_batch.enter_call()
+        tx_batch[b'key2'] = b'value2'
+        tx_batch[b'key0'] = b'value00'
+
+        tx_batch.enter_call()
+        tx_batch[b'key3'] = b'value3'
+        tx_batch[b'key1'] = None
+        tx_batch[b'key1'] = b'value11'
+        tx_batch.leave_call()
+
+        tx_batch.enter_call()
+        tx_batch[b'key4'] = b'value4'
+        tx_batch[b'key2'] = b'value22'
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        self.assertEqual([(b'key0', b'value00'), (b'key1', b'value11'), (b'key2', b'value2'),
+                          (b'key3', b'value3')],
+                         [(key, tx_batch[key]) for key in tx_batch])
+
+        # The changes of a call include the ones of its internal calls which have been left
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+        self.assertEqual([(b'key0', b'value0'), (b'key1', b'value1')],
+                         [(key, tx_batch[key]) for key in tx_batch])
+        self.assertEqual(1, tx_batch.call_count)
+
+    def test_digest(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = b'value0'
+
+        tx_batch.enter_call()
+        tx_batch[b'key1'] = b'value1'
+        tx_batch[b'key0'] = None
+        with self.assertRaises(DatabaseException):
+            tx_batch.digest()
+        tx_batch.leave_call()
+
+        # The keys keep the order where they were written first
+        block_batch = BlockBatch()
+        block_batch[b'key0'] = None
+        block_batch[b'key1'] = b'value1'
+        self.assertEqual(block_batch.digest(), tx_batch.digest())
+
     def test_delitem(self):
         tx_batch = TransactionBatch()
         tx_batch[b'key0'] = b'value0'
@@ -124,7 +175,7 @@ class TestTransactionBatch(unittest.TestCase):
         tx_batch[b'key0'] = None
         tx_batch[b'key1'] = b'key1'
         tx_batch[b'key2'] = b'value2'
-        self.assertEqual(5, len(tx_batch))
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(init_call_count + 2, tx_batch.call_count)
 
         keys = [b'key0', b'key1', b'key2']
@@ -150,3 +201,49 @@ class TestTransactionBatch(unittest.TestCase):
         block_batch = BlockBatch()
         block_batch.update(tx_batch)
         self.assertEqual(b'value0', block_batch[b'key0'])
+
+    def test_access_recorder(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = b'value0'
+        self.assertIsNone(tx_batch.access_recorder)
+
+        recorder = KeyAccessRecorder()
+        tx_batch.access_recorder = recorder
+        self.assertEqual(0, tx_batch.call_depth)
+        tx_batch[b'key1'] = b'value1'
+
+        tx_batch.enter_call()
+        self.assertEqual(1, tx_batch.call_depth)
+        tx_batch[b'key1'] = b'value2'
+        tx_batch[b'key2'] = b'value2'
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        # Reverted writes are recorded with the call depth where the key was written first
+        self.assertEqual([(b'key1', 0), (b'key2', 1)], list(recorder.writes.items()))
+        self.assertEqual(0, len(recorder.reads))
+
+        # Recorder is kept until the transaction is finished
+        tx_batch.clear()
+        tx_batch[b'key3'] = b'value3'
+        self.assertIs(recorder, tx_batch.access_recorder)
+        self.assertIn(b'key3', recorder.writes)
+
+    def test_is_governance_changed(self):
+        tx_batch = TransactionBatch()
+        tx_batch[create_address().to_bytes() + b'|key'] = b'value'
+        self.assertFalse(tx_batch.is_governance_changed)
+
+        tx_batch[GOVERNANCE_KEY_PREFIX + b'key'] = b'value'
+        self.assertTrue(tx_batch.is_governance_changed)
+
+        # It is kept even if the write is reverted
+        tx_batch.clear()
+        tx_batch.enter_call()
+        tx_batch[GOVERNANCE_KEY_PREFIX + b'key'] = b'value'
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+        self.assertTrue(tx_batch.is_governance_changed)
+
+        tx_batch.clear()
+        self.assertFalse(tx_batch.is_governance_changed)
@@ -22,6 +22,8 @@ from hypothesis import (
 
 from iconservice.utils.bloom import (
     BloomFilter,
+    get_bloom_bits,
+    get_bloom_mask,
 )
 
 
@@ -78,6 +80,16 @@ def test_bloom_filter_from_iterable_method(log_entries):
     check_bloom(bloom, log_entries)
 
 
+@given(st.binary(min_size=0, max_size=64))
+@settings(max_examples=2000)
+def test_get_bloom_mask(value):
+    expected = 0
+    for bloom_bits in get_bloom_bits(value):
+        expected |= bloom_bits
+
+    assert get_bloom_mask(value) == expected
+
+
 def test_casting_to_integer():
     bloom = BloomFilter()
 
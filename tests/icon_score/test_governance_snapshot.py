@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.address import GOVERNANCE_SCORE_ADDRESS
+from iconservice.database.batch import TransactionBatch
+from iconservice.iconscore.governance_snapshot import GovernanceSnapshot
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
+from iconservice.iconscore.icon_score_step import IconScoreStepCounter, StepType
+from tests import create_address
+
+
+class TestGovernanceSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.context = IconScoreContext(IconScoreContextType.INVOKE)
+        self.context.tx_batch = TransactionBatch()
+        self.context.step_counter = Mock(spec=IconScoreStepCounter)
+        self.governance_score = Mock()
+        self.snapshot = GovernanceSnapshot()
+
+    def _is_deployer(self, governance_score) -> bool:
+        # Imitates the step applied by the governance SCORE on reading its states
+        self.context.step_counter.apply_step(StepType.GET, 20)
+        return governance_score.isDeployer()
+
+    def _get(self) -> bool:
+        return self.snapshot.get(self.context, 'isDeployer', lambda: self.governance_score, self._is_deployer)
+
+    def test_get(self):
+        self.governance_score.isDeployer.return_value = True
+
+        self.assertTrue(self._get())
+        self.assertTrue(self._get())
+        self.assertEqual(1, self.governance_score.isDeployer.call_count)
+        self.assertEqual(1, self.snapshot.miss_count)
+        self.assertEqual(1, self.snapshot.hit_count)
+
+        # The step is applied on every get as if the governance SCORE was read
+        self.context.step_counter.apply_step.assert_called_with(StepType.GET, 20)
+        self.assertEqual(2, self.context.step_counter.apply_step.call_count)
+
+    def test_get_without_step_counter(self):
+        step_counter = self.context.step_counter
+        self.context.step_counter = None
+        self.assertIsNotNone(self._get())
+
+        self.context.step_counter = step_counter
+        self._get()
+        step_counter.apply_step.assert_called_once_with(StepType.GET, 20)
+
+    def test_on_transaction_finished(self):
+        self._get()
+
+        tx_batch = TransactionBatch()
+        tx_batch[create_address().to_bytes() + b'|key'] = b'value'
+        self.snapshot.on_transaction_finished(tx_batch, create_address())
+        self.assertEqual(1, len(self.snapshot))
+
+        self.snapshot.on_transaction_finished(TransactionBatch(), GOVERNANCE_SCORE_ADDRESS)
+        self.assertEqual(0, len(self.snapshot))
+
+        self._get()
+        tx_batch = TransactionBatch()
+        tx_batch[GOVERNANCE_SCORE_ADDRESS.to_bytes() + b'|key'] = b'value'
+        self.snapshot.on_transaction_finished(tx_batch, create_address())
+        self.assertEqual(0, len(self.snapshot))
+
+    def test_get_after_governance_changed_in_transaction(self):
+        self._get()
+        self.context.tx_batch[GOVERNANCE_SCORE_ADDRESS.to_bytes() + b'|key'] = b'value'
+
+        self._get()
+        self.assertEqual(2, self.governance_score.isDeployer.call_count)
+        self.assertEqual(0, self.snapshot.hit_count)
+
+        # Available again for the next transaction
+        self.snapshot.on_transaction_finished(self.context.tx_batch, create_address())
+        self.context.tx_batch.clear()
+        self._get()
+        self._get()
+        self.assertEqual(3, self.governance_score.isDeployer.call_count)
+        self.assertEqual(1, self.snapshot.hit_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,7 @@ from iconservice.database.db import ContextDatabase, IconScoreDatabase
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
 from iconservice.base.address import AddressPrefix
 from iconservice.base.exception import InvalidParamsException
-from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
+from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB, IndexedArrayDB
 from iconservice.iconscore.icon_score_context import ContextContainer
 from tests import create_address
 from tests.mock_db import MockKeyValueDatabase
@@ -328,6 +328,65 @@ class TestIconContainerDB(unittest.TestCase):
             testarray[5] = 1
             a = testarray[5]
 
+    def test_indexed_array_db(self):
+        addresses = [create_address() for _ in range(5)]
+
+        test_array = IndexedArrayDB('test_array', self.db, value_type=Address)
+        for address in addresses:
+            test_array.put(address)
+
+        self.assertEqual(5, len(test_array))
+        self.assertEqual(addresses, list(test_array))
+        self.assertTrue(all(address in test_array for address in addresses))
+        self.assertNotIn(create_address(), test_array)
+
+        with self.assertRaises(InvalidParamsException):
+            test_array.put(addresses[0])
+
+        # The last value is moved to the position of the removed one
+        test_array.remove(addresses[1])
+        self.assertEqual([addresses[0], addresses[4], addresses[2], addresses[3]], list(test_array))
+        self.assertNotIn(addresses[1], test_array)
+        self.assertIn(addresses[4], test_array)
+
+        test_array.remove(addresses[3])
+        self.assertEqual([addresses[0], addresses[4], addresses[2]], list(test_array))
+        self.assertEqual(addresses[2], test_array.get(2))
+        self.assertEqual(addresses[2], test_array[-1])
+
+        with self.assertRaises(InvalidParamsException):
+            test_array.remove(addresses[3])
+
+        test_array.remove(addresses[0])
+        test_array.remove(addresses[2])
+        test_array.remove(addresses[4])
+        self.assertEqual(0, len(test_array))
+
+        test_array.put(addresses[1])
+        self.assertIn(addresses[1], test_array)
+        self.assertEqual([addresses[1]], list(test_array))
+
+    def test_indexed_array_db_migration(self):
+        addresses = [create_address() for _ in range(3)]
+
+        test_array = ArrayDB('test_array', self.db, value_type=Address)
+        for address in addresses:
+            test_array.put(address)
+
+        # The values stored by ArrayDB are read but not indexed yet
+        indexed_array = IndexedArrayDB('test_array', self.db, value_type=Address)
+        self.assertEqual(addresses, list(indexed_array))
+        self.assertNotIn(addresses[0], indexed_array)
+
+        indexed_array.reindex()
+        self.assertTrue(all(address in indexed_array for address in addresses))
+
+        # The index is not trusted after the value is removed by ArrayDB
+        test_array.pop()
+        self.assertNotIn(addresses[2], indexed_array)
+        indexed_array.put(addresses[2])
+        self.assertEqual(addresses, list(test_array))
+
 
     def test_container_util(self):
         prefix: bytes = ContainerUtil.create_db_prefix(ArrayDB, 'a')
@@ -336,6 +395,9 @@ class TestIconContainerDB(unittest.TestCase):
         prefix: bytes = ContainerUtil.create_db_prefix(DictDB, 'dictdb')
         self.assertEqual(b'\x01|dictdb', prefix)
 
+        prefix: bytes = ContainerUtil.create_db_prefix(IndexedArrayDB, 'indexed')
+        self.assertEqual(b'\x03|indexed', prefix)
+
         with self.assertRaises(InvalidParamsException):
             prefix: bytes = ContainerUtil.create_db_prefix(VarDB, 'vardb')
 
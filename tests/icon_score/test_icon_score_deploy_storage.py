@@ -19,13 +19,15 @@ import unittest
 from copy import deepcopy
 from unittest.mock import Mock, patch
 
+from iconservice.base.block import Block
 from iconservice.base.exception import ExceptionCode, AccessDeniedException, InvalidParamsException
+from iconservice.database.batch import BlockBatch
 from iconservice.database.db import ContextDatabase
 from iconservice.deploy.icon_score_deploy_storage import \
     IconScoreDeployTXParams, IconScoreDeployInfo, DeployType, DeployState, IconScoreDeployStorage
 from iconservice.icon_constant import ZERO_TX_HASH
-from iconservice.iconscore.icon_score_context import IconScoreContext
-from tests import create_tx_hash, create_address
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType
+from tests import create_block_hash, create_tx_hash, create_address
 
 
 class TestIconScoreDeployTxParams(unittest.TestCase):
@@ -289,6 +291,7 @@ class TestIconScoreDeployStorage(unittest.TestCase):
 
     def test_put_deploy_info(self):
         context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.INVOKE
         score_address = create_address(1)
         deploy_info = IconScoreDeployInfo(
             score_address, DeployState.INACTIVE, create_address(), ZERO_TX_HASH, create_tx_hash())
@@ -300,18 +303,108 @@ class TestIconScoreDeployStorage(unittest.TestCase):
 
     def test_get_deploy_info(self):
         context = Mock(spec=IconScoreContext)
+        context.db_snapshot = None
+        self.storage._db.get_uncommitted = Mock(return_value=ContextDatabase.MISSING)
 
         score_address = create_address(1)
         self.storage._create_db_key = Mock(return_value=score_address.to_bytes())
-        self.storage._db.get = Mock(return_value=None)
+        self.storage._db.get_from_state_db = Mock(return_value=None)
         self.assertEqual(None, self.storage.get_deploy_info(context, score_address))
 
         score_address = create_address(1)
         deploy_info = IconScoreDeployInfo(
             score_address, DeployState.INACTIVE, create_address(), ZERO_TX_HASH, create_tx_hash())
         self.storage._create_db_key = Mock(return_value=score_address.to_bytes())
+        self.storage._db.get_from_state_db = Mock(return_value=deploy_info.to_bytes())
+        self.assertEqual(deploy_info.to_bytes(), self.storage.get_deploy_info(context, score_address).to_bytes())
+
+        # The deploy info changed in the uncommitted batches
+        self.storage._db.get_uncommitted = Mock(return_value=None)
+        self.assertEqual(None, self.storage.get_deploy_info(context, score_address))
+
+    def test_get_deploy_info_from_cache(self):
+        context = Mock(spec=IconScoreContext)
+        context.db_snapshot = None
+        self.storage._db.get_uncommitted = Mock(return_value=ContextDatabase.MISSING)
+
+        score_address = create_address(1)
+        deploy_info = IconScoreDeployInfo(
+            score_address, DeployState.ACTIVE, create_address(), create_tx_hash(), ZERO_TX_HASH)
+        self.storage._db.get_from_state_db = Mock(return_value=deploy_info.to_bytes())
+
+        deploy_info1 = self.storage.get_deploy_info(context, score_address)
+        deploy_info2 = self.storage.get_deploy_info(context, score_address)
+        self.assertIs(deploy_info1, deploy_info2)
+        self.storage._db.get_from_state_db.assert_called_once()
+        self.assertEqual(1, self.storage.hit_count)
+        self.assertEqual(1, self.storage.miss_count)
+
+        # The deploy info in the uncommitted batches has priority over the cached one
+        updated_deploy_info = IconScoreDeployInfo(
+            score_address, DeployState.ACTIVE, deploy_info.owner, create_tx_hash(), ZERO_TX_HASH)
+        self.storage._db.get_uncommitted = Mock(return_value=updated_deploy_info.to_bytes())
+        self.assertEqual(updated_deploy_info.to_bytes(),
+                         self.storage.get_deploy_info(context, score_address).to_bytes())
+
+        # Discarded on commit
+        self.storage._db.get_uncommitted = Mock(return_value=ContextDatabase.MISSING)
+        self.storage._db.get_from_state_db = Mock(return_value=updated_deploy_info.to_bytes())
+        key: bytes = self.storage._create_db_key(
+            IconScoreDeployStorage._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX, score_address.to_bytes())
+        block = Block(1, create_block_hash(), 0, None)
+        block_batch = BlockBatch(block)
+        block_batch[key] = updated_deploy_info.to_bytes()
+        block_batch[b'key'] = b'value'
+        self.storage.on_block_committed(block_batch)
+        self.assertEqual(updated_deploy_info.to_bytes(),
+                         self.storage.get_deploy_info(context, score_address).to_bytes())
+
+        # A query pinned to the snapshot of the last committed block reads the cached one
+        context.db_snapshot = Mock(block=block)
+        self.storage._db.get = Mock()
+        self.assertEqual(updated_deploy_info.to_bytes(),
+                         self.storage.get_deploy_info(context, score_address).to_bytes())
+        self.storage._db.get.assert_not_called()
+        # and reports the key read from the cache to the snapshot
+        context.db_snapshot.record.assert_called_once_with(key)
+
+        # but not with an older snapshot, because the cached one can be newer than it
+        context.db_snapshot = Mock(block=Block(0, create_block_hash(), 0, None))
         self.storage._db.get = Mock(return_value=deploy_info.to_bytes())
         self.assertEqual(deploy_info.to_bytes(), self.storage.get_deploy_info(context, score_address).to_bytes())
+        self.storage._db.get.assert_called_once_with(context, key)
+
+        # Discarded on put
+        self.storage._db.put = Mock()
+        self.storage.put_deploy_info(None, deploy_info)
+        self.storage._db.get_from_state_db = Mock(return_value=deploy_info.to_bytes())
+        self.assertEqual(deploy_info.to_bytes(), self.storage.get_deploy_info(None, score_address).to_bytes())
+
+        # The committed state written without a block is newer than any snapshot
+        context.db_snapshot = Mock(block=block)
+        self.storage._db.get = Mock(return_value=updated_deploy_info.to_bytes())
+        self.assertEqual(updated_deploy_info.to_bytes(),
+                         self.storage.get_deploy_info(context, score_address).to_bytes())
+        self.storage._db.get.assert_called_once_with(context, key)
+
+    def test_update_score_info_not_to_modify_cache(self):
+        context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.INVOKE
+        context.db_snapshot = None
+        self.storage._db.get_uncommitted = Mock(return_value=ContextDatabase.MISSING)
+        self.storage._db.put = Mock()
+
+        score_address = create_address(1)
+        tx_hash = create_tx_hash()
+        deploy_info = IconScoreDeployInfo(
+            score_address, DeployState.INACTIVE, create_address(), ZERO_TX_HASH, tx_hash)
+        self.storage._db.get_from_state_db = Mock(return_value=deploy_info.to_bytes())
+        self.storage.get_deploy_tx_params = Mock(
+            return_value=IconScoreDeployTXParams(tx_hash, DeployType.INSTALL, score_address, {}))
+
+        cached_deploy_info = self.storage.get_deploy_info(context, score_address)
+        self.storage.update_score_info(context, score_address, tx_hash)
+        self.assertEqual(deploy_info.to_bytes(), cached_deploy_info.to_bytes())
 
     def test_put_deploy_tx_params(self):
         context = Mock(spec=IconScoreContext)
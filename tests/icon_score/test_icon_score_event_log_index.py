@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.address import AddressPrefix
+from iconservice.base.block import Block
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_event_log_index import EventLogIndex
+from tests import create_address, create_block_hash, create_tx_hash, rmtree
+
+TRANSFER_SIGNATURE = 'Transfer(Address,Address,int)'
+
+
+class TestEventLogIndex(unittest.TestCase):
+    def setUp(self):
+        self.db_path = 'event_log_index'
+        rmtree(self.db_path)
+        self.index = EventLogIndex.from_path(self.db_path)
+        self.score_address = create_address(AddressPrefix.CONTRACT)
+
+    def tearDown(self):
+        self.index.close()
+        rmtree(self.db_path)
+
+    @staticmethod
+    def _make_tx_result(tx_index: int, event_logs: list) -> Mock:
+        return Mock(tx_hash=create_tx_hash(),
+                    tx_index=tx_index,
+                    event_logs=event_logs,
+                    logs_bloom=IconServiceEngine._generate_logs_bloom(event_logs))
+
+    def _put_block(self, height: int, *event_logs_list: list) -> list:
+        block = Block(height, create_block_hash(), 0, None)
+        tx_results = [self._make_tx_result(i, event_logs) for i, event_logs in enumerate(event_logs_list)]
+        self.index.put_block(block, tx_results)
+        return tx_results
+
+    def _make_transfer(self, _from, to, value: int) -> EventLog:
+        return EventLog(self.score_address, [TRANSFER_SIGNATURE, _from, to], [value])
+
+    def test_put_block(self):
+        self.assertEqual([], self.index.get_height_ranges())
+        self._put_block(1, [])
+        self._put_block(2, [])
+        self.assertEqual([(1, 2)], self.index.get_height_ranges())
+        self.assertEqual([], self.index.get_event_logs({})['eventLogs'])
+
+        # The blocks which are not indexed leave a gap
+        self._put_block(4, [self._make_transfer(create_address(), create_address(), 1)])
+        self.assertEqual([(1, 2), (4, 4)], self.index.get_height_ranges())
+        self.assertEqual(1, len(self.index.get_event_logs({'fromBlock': 0})['eventLogs']))
+
+        # Indexing a block again does not change the ranges
+        self._put_block(2, [])
+        self._put_block(5, [])
+        self.assertEqual([(1, 2), (4, 5)], self.index.get_height_ranges())
+
+    def test_get_event_logs_over_gap(self):
+        sender, receiver = create_address(), create_address()
+        self._put_block(1, [self._make_transfer(sender, receiver, 1)])
+        self._put_block(2, [self._make_transfer(sender, receiver, 2)])
+        # Block 3 is skipped
+        self._put_block(4, [self._make_transfer(sender, receiver, 4)])
+        self._put_block(5, [self._make_transfer(sender, receiver, 5)])
+        self.assertEqual([(1, 2), (4, 5)], self.index.get_height_ranges())
+
+        # The blocks indexed before the gap can still be queried
+        event_logs = self.index.get_event_logs({})['eventLogs']
+        self.assertEqual([1, 2, 4, 5], [e['blockHeight'] for e in event_logs])
+
+        event_logs = self.index.get_event_logs({'address': self.score_address, 'toBlock': 3})['eventLogs']
+        self.assertEqual([1, 2], [e['blockHeight'] for e in event_logs])
+
+        # Paging goes over the gap
+        response = self.index.get_event_logs({'limit': 2})
+        self.assertEqual([1, 2], [e['blockHeight'] for e in response['eventLogs']])
+        response = self.index.get_event_logs({'limit': 2, 'cursor': response['nextCursor']})
+        self.assertEqual([4, 5], [e['blockHeight'] for e in response['eventLogs']])
+
+    def test_get_event_logs_by_typed_indexed(self):
+        sender, receiver = create_address(), create_address()
+        tx_results = self._put_block(1,
+                                     [self._make_transfer(sender, receiver, 0x10),
+                                      self._make_transfer(receiver, sender, 0x20)],
+                                     [EventLog(create_address(AddressPrefix.CONTRACT),
+                                               [TRANSFER_SIGNATURE, sender, receiver], [0x30])])
+
+        params = {'address': self.score_address, 'event': TRANSFER_SIGNATURE, 'indexed': [str(sender)]}
+        event_logs = self.index.get_event_logs(params)['eventLogs']
+        self.assertEqual(1, len(event_logs))
+        self.assertEqual(tx_results[0].tx_hash, event_logs[0]['txHash'])
+        self.assertEqual(0, event_logs[0]['logIndex'])
+        self.assertEqual(['0x10'], event_logs[0]['data'])
+
+        params = {'event': TRANSFER_SIGNATURE, 'indexed': [None, str(sender)]}
+        event_logs = self.index.get_event_logs(params)['eventLogs']
+        self.assertEqual([(0, 1)], [(e['txIndex'], e['logIndex']) for e in event_logs])
+
+        params = {'event': TRANSFER_SIGNATURE, 'indexed': [str(sender), str(receiver)]}
+        event_logs = self.index.get_event_logs(params)['eventLogs']
+        self.assertEqual([(0, 0), (1, 0)], [(e['txIndex'], e['logIndex']) for e in event_logs])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.address import AddressPrefix
+from iconservice.base.message import Message
+from iconservice.database.db import ContextDatabase, IconScoreDatabase
+from iconservice.deploy.icon_score_deploy_engine import IconScoreDeployEngine
+from iconservice.iconscore.icon_container_db import ArrayDB, VarDB
+from iconservice.iconscore.icon_score_base import IconScoreBase, external
+from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContext, IconScoreContextType
+from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+from iconservice.icon_constant import REVISION_2, REVISION_3
+from tests import create_address, create_tx_hash
+from tests.mock_db import MockKeyValueDatabase
+
+
+class SimpleScore(IconScoreBase):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._value = VarDB('value', db, value_type=int)
+        self._names = ('a', 'b')
+
+    def on_install(self) -> None:
+        pass
+
+    def on_update(self) -> None:
+        pass
+
+    @external
+    def set_value(self, value: int) -> None:
+        self._value.set(value)
+        self._last_value = value
+
+    @external(readonly=True)
+    def get_value(self) -> int:
+        return self._value.get()
+
+
+class SenderScore(SimpleScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._sender = self.msg.sender
+
+
+class StateScore(SimpleScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._init_value = self._value.get()
+
+
+class MutableScore(SimpleScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._cache = []
+
+
+class ArrayScore(SimpleScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._array = ArrayDB('array', db, value_type=int)
+
+
+class TestIconScoreInfo(unittest.TestCase):
+    def setUp(self):
+        self.owner = create_address()
+        deploy_engine = Mock(spec=IconScoreDeployEngine)
+        deploy_engine.icon_deploy_storage.get_deploy_info.return_value = Mock(owner=self.owner)
+        IconScoreContext.icon_score_deploy_engine = deploy_engine
+
+        self.context = IconScoreContext(IconScoreContextType.DIRECT)
+        self.context.msg = Message(sender=create_address())
+        ContextContainer._push_context(self.context)
+
+        context_db = ContextDatabase(MockKeyValueDatabase.create_db())
+        self.score_db = IconScoreDatabase(create_address(AddressPrefix.CONTRACT), context_db)
+
+    def tearDown(self):
+        ContextContainer._pop_context()
+        IconScoreContext.icon_score_deploy_engine = None
+
+    def test_get_score_from_snapshot(self):
+        score_info = IconScoreInfo(SimpleScore, self.score_db, create_tx_hash())
+
+        score1 = score_info.get_score(REVISION_3)
+        self.assertIsInstance(score_info._snapshot, dict)
+        score1.set_value(1)
+        self.assertEqual(1, score1._last_value)
+
+        score2 = score_info.get_score(REVISION_3)
+        self.assertIsNot(score1, score2)
+        self.assertIsInstance(score2, SimpleScore)
+        # The member variables set after __init__() are not leaked
+        self.assertFalse(hasattr(score2, '_last_value'))
+        self.assertEqual(1, score2.get_value())
+        self.assertEqual(self.owner, score2.owner)
+        self.assertEqual(self.score_db.address, score2.address)
+
+        # The same member variables as the ones of a newly created instance
+        score3 = score_info.create_score()
+        self.assertEqual(sorted(vars(score3)), sorted(vars(score2)))
+        self.assertEqual(score3._names, score2._names)
+
+    def test_get_score_without_snapshot(self):
+        for score_class in (SenderScore, StateScore, MutableScore, ArrayScore):
+            score_info = IconScoreInfo(score_class, self.score_db, create_tx_hash())
+            score_info.get_score(REVISION_3)
+            self.assertIs(False, score_info._snapshot, score_class)
+
+        score_info = IconScoreInfo(SenderScore, self.score_db, create_tx_hash())
+        score1 = score_info.get_score(REVISION_3)
+        self.context.msg = Message(sender=create_address())
+        score2 = score_info.get_score(REVISION_3)
+        self.assertEqual(self.context.msg.sender, score2._sender)
+        self.assertNotEqual(score1._sender, score2._sender)
+
+    def test_get_score_before_revision3(self):
+        score_info = IconScoreInfo(SimpleScore, self.score_db, create_tx_hash())
+        score = score_info.get_score(REVISION_2)
+        self.assertIs(score, score_info.get_score(REVISION_2))
+        self.assertIsNone(score_info._snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest.mock import patch
+
+from iconcommons.logger import Logger
+
+from iconservice.base.address import AddressPrefix, MalformedAddress
+from iconservice.base.block import Block
+from iconservice.base.exception import ExceptionCode
+from iconservice.base.transaction import Transaction
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.iconscore.icon_score_result_store import TransactionResultStore
+from iconservice.utils import to_camel_case
+from tests import create_address, create_block_hash, create_tx_hash, rmtree
+
+
+class TestTransactionResultStore(unittest.TestCase):
+    def setUp(self):
+        self.path = 'tx_result_store'
+        rmtree(self.path)
+        self.store = TransactionResultStore.from_path(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        rmtree(self.path)
+
+    @staticmethod
+    def _make_tx_results(block_height: int) -> list:
+        block = Block(block_height, create_block_hash(), 0, None)
+        score_address = create_address(AddressPrefix.CONTRACT)
+        event_logs = [EventLog(score_address,
+                               ['Transfer(Address,Address,int)', create_address(), create_address()],
+                               [10 ** 30]),
+                      EventLog(score_address, ['Event(str,bytes,bool)', 'a'], [b'b', True])]
+
+        success = TransactionResult(Transaction(create_tx_hash(), 0), block, score_address, None,
+                                    1000, 10, 1000, event_logs, IconServiceEngine._generate_logs_bloom(event_logs),
+                                    TransactionResult.SUCCESS)
+
+        failure = TransactionResult(Transaction(create_tx_hash(), 1), block, MalformedAddress.from_string('hx1234'),
+                                    None, 2000, 10, 3000, [], IconServiceEngine._generate_logs_bloom([]),
+                                    TransactionResult.FAILURE)
+        failure.failure = TransactionResult.Failure(ExceptionCode.INVALID_PARAMETER.value, 'Invalid params')
+
+        return [success, failure]
+
+    def _put_block(self, tx_results: list) -> 'Block':
+        block = Block(tx_results[0].block_height, tx_results[0].block_hash, 0, None)
+        self.store.put_block(block, tx_results)
+        return block
+
+    def test_get(self):
+        tx_results = self._make_tx_results(1) + self._make_tx_results(2)
+        self._put_block(tx_results[:2])
+        self._put_block(tx_results[2:])
+
+        for tx_result in tx_results:
+            self.assertEqual(tx_result.to_dict(to_camel_case),
+                             self.store.get(tx_result.tx_hash).to_dict(to_camel_case))
+
+        self.assertIsNone(self.store.get(create_tx_hash()))
+
+    def test_reopen(self):
+        tx_results = self._make_tx_results(1)
+        block = self._put_block(tx_results)
+        self.store.close()
+
+        # Appended but not indexed
+        data_path = os.path.join(self.path, TransactionResultStore.DATA_FILE_NAME)
+        size = os.path.getsize(data_path)
+        with open(data_path, 'ab') as f:
+            f.write(b'\x00' * 10)
+
+        self.store = TransactionResultStore.from_path(self.path)
+        self.assertEqual(size, os.path.getsize(data_path))
+        self.assertEqual(tx_results[1].to_dict(), self.store.get(tx_results[1].tx_hash).to_dict())
+        self.assertEqual(block.height, self.store.last_block.height)
+        self.assertEqual(block.hash, self.store.last_block.hash)
+
+        tx_results = self._make_tx_results(2)
+        self._put_block(tx_results)
+        self.assertEqual(tx_results[0].to_dict(), self.store.get(tx_results[0].tx_hash).to_dict())
+
+    def test_check_last_block(self):
+        self.assertIsNone(self.store.last_block)
+        self.assertTrue(self.store.check_last_block(None))
+
+        block = self._put_block(self._make_tx_results(1))
+        self.store.close()
+        self.store = TransactionResultStore.from_path(self.path)
+
+        with patch.object(Logger, 'warning') as warning:
+            self.assertTrue(self.store.check_last_block(block))
+            warning.assert_not_called()
+
+            # The results of the blocks committed after it have been lost
+            self.assertFalse(self.store.check_last_block(Block(3, create_block_hash(), 0, None)))
+            self.assertIn('block 2 ~ 3 are missing', warning.call_args[0][0])
+
+            # Another chain
+            self.assertFalse(self.store.check_last_block(Block(1, create_block_hash(), 0, None)))
+            self.assertIn('does not match', warning.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
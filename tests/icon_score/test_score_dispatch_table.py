@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.block import Block
+from iconservice.base.message import Message
+from iconservice.base.transaction import Transaction
+from iconservice.deploy.icon_score_deploy_engine import IconScoreDeployEngine
+from iconservice.iconscore.icon_score_base import IconScoreBase, ScoreFuncInfo
+from iconservice.iconscore.icon_score_constant import CONST_CLASS_DISPATCH_TABLE
+from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContext, IconScoreContextType, \
+    IconScoreFuncType
+from tests.icon_score.test_external_payable_call_method import ExternalCallClass, ExternalPayableCallClass, \
+    ChildCallClass
+
+
+class TestScoreDispatchTable(unittest.TestCase):
+
+    def setUp(self):
+        IconScoreContext.icon_score_deploy_engine = Mock(spec=IconScoreDeployEngine)
+        self.context = Mock(spec=IconScoreContext)
+        self.context.attach_mock(Mock(spec=Transaction), "tx")
+        self.context.attach_mock(Mock(spec=Block), "block")
+        self.context.attach_mock(Mock(spec=Message), "msg")
+        self.context.type = IconScoreContextType.INVOKE
+        self.context.msg.value = 0
+
+        ContextContainer._push_context(self.context)
+
+    def tearDown(self):
+        ContextContainer._pop_context()
+
+    def test_dispatch_table(self):
+        table = getattr(ExternalCallClass, CONST_CLASS_DISPATCH_TABLE)
+        self.assertTrue(table['func1'].is_external)
+        self.assertTrue(table['func1'].is_readonly)
+        self.assertFalse(table['func1'].is_payable)
+        self.assertTrue(table['func2'].is_external)
+        self.assertFalse(table['func2'].is_readonly)
+        self.assertFalse(table['fallback'].is_external)
+
+        table = getattr(ExternalPayableCallClass, CONST_CLASS_DISPATCH_TABLE)
+        self.assertTrue(table['func1'].is_payable)
+        self.assertFalse(table['func2'].is_payable)
+
+        # The table is made of the functions of the most derived class
+        table = getattr(ChildCallClass, CONST_CLASS_DISPATCH_TABLE)
+        self.assertTrue(table['func1'].is_external)
+        self.assertNotIn('func2', table)
+
+        # The table is immutable
+        with self.assertRaises(TypeError):
+            table['func2'] = table['func1']
+
+        self.assertFalse(hasattr(IconScoreBase, CONST_CLASS_DISPATCH_TABLE))
+
+    def test_set_func_type(self):
+        score = ExternalCallClass(Mock())
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+
+        context.set_func_type_by_icon_score(score, 'func1')
+        self.assertEqual(IconScoreFuncType.READONLY, context.func_type)
+
+        for func_name in ('func2', 'fallback', 'unknown', None):
+            context.set_func_type_by_icon_score(score, func_name)
+            self.assertEqual(IconScoreFuncType.WRITABLE, context.func_type)
+
+    def test_score_func_info(self):
+        table = getattr(ExternalPayableCallClass, CONST_CLASS_DISPATCH_TABLE)
+        func_info: 'ScoreFuncInfo' = table['func1']
+        self.assertIsInstance(func_info, ScoreFuncInfo)
+        self.assertEqual('func1', func_info.name)
+        self.assertIs(func_info.func, ExternalPayableCallClass.__dict__['func1'])
+
+        # The converter is made once on the first use
+        self.assertIs(func_info.params_converter, func_info.params_converter)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@
 
 
 import unittest
+from copy import copy
 
 from iconservice.base.exception import InvalidParamsException, OutOfBalanceException
 from iconservice.icx.icx_account import AccountType, Account
@@ -101,6 +102,44 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(AccountType.GENESIS, account3.type)
         self.assertEqual(1024, account3.icx)
 
+    def test_cached_bytes(self):
+        account = Account(AccountType.GENERAL, icx=1024, locked=True)
+        data = account.to_bytes()
+
+        account2 = Account.from_bytes(data)
+        # The bytes are kept until changed
+        self.assertIs(data, account2.to_bytes())
+        self.assertEqual(1024, account2.icx)
+        self.assertIs(data, account2.to_bytes())
+
+        account2.deposit(1)
+        self.assertEqual(1025, Account.from_bytes(account2.to_bytes()).icx)
+
+        # The copy is changed independently
+        account3 = copy(account2)
+        account3.withdraw(1025)
+        self.assertEqual(1025, account2.icx)
+        self.assertEqual(0, account3.icx)
+        self.assertEqual(account2.to_bytes(), Account.from_bytes(account2.to_bytes()).to_bytes())
+
+        with self.assertRaises(AttributeError):
+            account3.unknown = 0
+
+    def test_from_bytes_with_unknown_fields(self):
+        data = bytearray(Account(AccountType.GENERAL, icx=1024, c_rep=True).to_bytes())
+        # Reserved byte and unknown flag
+        data[2] |= 0x80
+        data[3] = 0x01
+
+        account = Account.from_bytes(bytes(data))
+        self.assertTrue(account.c_rep)
+        self.assertEqual(1024, account.icx)
+        # Dropped as before
+        self.assertEqual(Account(AccountType.GENERAL, icx=1024, c_rep=True).to_bytes(), account.to_bytes())
+
+        data[1] = 10
+        self.assertRaises(ValueError, Account.from_bytes, bytes(data))
+
 
 if __name__ == '__main__':
     unittest.main()
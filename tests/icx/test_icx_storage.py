@@ -60,6 +60,33 @@ class TestIcxStorage(unittest.TestCase):
         account2 = self.storage.get_account(context, account.address)
         self.assertEqual(account, account2)
 
+    def test_decoded_accounts(self):
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.tx_batch = TransactionBatch()
+        context.block_batch = BlockBatch()
+
+        account = Account()
+        account.address = self.address
+        account.deposit(10 ** 19)
+        self.storage.put_account(context, account.address, account)
+        account.withdraw(10 ** 18)
+
+        # Not affected by the account changed after put
+        account2 = self.storage.get_account(context, self.address)
+        self.assertEqual(10 ** 19, account2.icx)
+        account2.withdraw(10 ** 18)
+
+        account3 = self.storage.get_account(context, self.address)
+        self.assertEqual(10 ** 19, account3.icx)
+        self.assertIsNot(account2, account3)
+
+        # Changed by another transaction
+        context.tx_batch[self.address.to_bytes()] = account.to_bytes()
+        self.assertEqual(9 * 10 ** 18, self.storage.get_account(context, self.address).icx)
+
+        self.storage.clear_decoded_accounts()
+        self.assertEqual(9 * 10 ** 18, self.storage.get_account(context, self.address).icx)
+
     def test_delete_account(self):
         context = self.context
         account = Account()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine asynchronous commit testcase
+"""
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.database.factory import ContextDatabaseFactory
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateAsyncCommit(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.ASYNC_COMMIT: True}
+
+    def _reopen_engine(self):
+        conf = self.icon_service_engine._conf
+        self.icon_service_engine.close()
+
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(conf)
+
+    def test_invoke_before_flush(self):
+        writer = ContextDatabaseFactory.get_shared_db().key_value_db.writer
+        event = threading.Event()
+        write_batch = writer._db.write_batch
+
+        def _write_batch(*args, **kwargs):
+            # Holds the writer thread until all blocks are committed
+            event.wait()
+            return write_batch(*args, **kwargs)
+
+        with patch.object(writer, '_db', Mock(write_batch=_write_batch)):
+            tx = self._make_deploy_tx("test_internal_call_scores",
+                                      "test_score",
+                                      self._addr_array[0],
+                                      ZERO_SCORE_ADDRESS,
+                                      deploy_params={'value': hex(0)})
+            prev_block, tx_results = self._make_and_req_block([tx])
+            self._write_precommit_state(prev_block)
+            self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+            score_address = tx_results[0].score_address
+
+            for i in range(3):
+                tx_list = [
+                    self._make_icx_send_tx(self._genesis, self._addr_array[1], self._icx_factor),
+                    self._make_score_call_tx(self._addr_array[0], score_address, 'set_value', {'value': hex(i)})
+                ]
+                prev_block, tx_results = self._make_and_req_block(tx_list)
+                self._write_precommit_state(prev_block)
+                for tx_result in tx_results:
+                    self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+
+            self.assertTrue(writer.pending_count > 0)
+
+            # The states of committed blocks are read before written to db
+            response = self._query({"address": self._addr_array[1]}, 'icx_getBalance')
+            self.assertEqual(3 * self._icx_factor, response)
+
+            event.set()
+
+        self._reopen_engine()
+
+        # Every committed state is written on close
+        last_block = self.icon_service_engine._precommit_data_manager.last_block
+        self.assertEqual(prev_block.hash, last_block.hash)
+        self.assertEqual(prev_block.height, last_block.height)
+        response = self._query({"address": self._addr_array[1]}, 'icx_getBalance')
+        self.assertEqual(3 * self._icx_factor, response)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_address,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(2, self._query(query_request))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,6 +68,7 @@ class TestIntegrateBase(TestCase):
         config.update_conf({ConfigKey.SCORE_ROOT_PATH: self._score_root_path,
                             ConfigKey.STATE_DB_ROOT_PATH: self._state_db_root_path})
         config.update_conf(self._make_init_config())
+        self._config = config
 
         self.icon_service_engine = IconServiceEngine()
         self.icon_service_engine.open(config)
@@ -20,6 +20,7 @@
 from typing import TYPE_CHECKING, Any
 
 from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.icon_constant import MAX_CALL_STACK_SIZE
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 if TYPE_CHECKING:
@@ -341,3 +342,32 @@ class TestIntegrateEventLog(TestIntegrateBase):
         event_log = tx_results[0].event_logs
         self.assertEqual(event_log[0].data[0], "A")
         self.assertEqual(event_log[1].data[0], "C")
+
+    def test_event_log_nested_call(self):
+        tx_result = self._deploy_score("test_nested_call_event_log_score")
+        self.assertEqual(tx_result.status, int(True))
+        score_addr = tx_result.score_address
+
+        tx_results = self._call_score(score_addr, "emit_nested", {"depth": hex(3), "count": hex(2)})
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual([(depth, index) for depth in range(3, -1, -1) for index in range(2)],
+                         [tuple(event_log.indexed[1:]) for event_log in tx_results[0].event_logs])
+
+        # The event logs of the reverted call and its internal calls are discarded
+        tx_results = self._call_score(
+            score_addr, "emit_nested", {"depth": hex(3), "count": hex(2), "revert_depth": hex(1)})
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual([(depth, index) for depth in range(3, 1, -1) for index in range(2)],
+                         [tuple(event_log.indexed[1:]) for event_log in tx_results[0].event_logs])
+
+    def test_event_log_deep_nested_call(self):
+        tx_result = self._deploy_score("test_nested_call_event_log_score")
+        self.assertEqual(tx_result.status, int(True))
+        score_addr = tx_result.score_address
+
+        depth = MAX_CALL_STACK_SIZE - 1
+        count = 100
+        tx_results = self._call_score(score_addr, "emit_nested", {"depth": hex(depth), "count": hex(count)})
+
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual((depth + 1) * count, len(tx_results[0].event_logs))
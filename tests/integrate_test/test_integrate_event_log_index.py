@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine event log index testcase
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.exception import InvalidParamsException, InvalidRequestException
+from iconservice.icon_constant import ConfigKey
+from iconservice.iconscore.icon_score_event_log_index import EventLogIndex
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_address
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+EVENT_SIGNATURE = 'NormalEventLog(str,str,str)'
+
+
+class TestIntegrateEventLogIndex(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.EVENT_LOG_INDEX: True}
+
+    def setUp(self):
+        super().setUp()
+
+        tx = self._make_deploy_tx("test_builtin",
+                                  "latest_version/governance",
+                                  self._admin,
+                                  GOVERNANCE_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        tx = self._make_deploy_tx("test_event_log_scores",
+                                  "test_event_log_score",
+                                  self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS,
+                                  deploy_params={})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+        self._score_address = tx_results[0].score_address
+
+    def _call_event_logs(self, values: list) -> list:
+        tx_list = []
+        for value in values:
+            tx_list.append(self._make_score_call_tx(self._addr_array[0],
+                                                    self._score_address,
+                                                    'call_valid_event_log',
+                                                    {'value1': value, 'value2': 'b', 'value3': 'c'}))
+
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+        return tx_results
+
+    def _get_event_logs(self, **params) -> dict:
+        return self._query(params, 'ise_getEventLogs')
+
+    def test_get_event_logs(self):
+        tx_results = []
+        for i in range(3):
+            tx_results.extend(self._call_event_logs([f'a{i}', f'a{i}x']))
+
+        # A block without event logs
+        tx = self._make_score_call_tx(self._addr_array[0], self._score_address, 'set_value', {'value': 'a'})
+        prev_block, _ = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        response = self._get_event_logs(address=self._score_address, event=EVENT_SIGNATURE)
+        self.assertNotIn('nextCursor', response)
+        event_logs = response['eventLogs']
+        self.assertEqual(len(tx_results), len(event_logs))
+
+        for tx_result, event_log in zip(tx_results, event_logs):
+            self.assertEqual(tx_result.block_height, event_log['blockHeight'])
+            self.assertEqual(tx_result.tx_hash, event_log['txHash'])
+            self.assertEqual(tx_result.tx_index, event_log['txIndex'])
+            self.assertEqual(0, event_log['logIndex'])
+            self.assertEqual(str(self._score_address), event_log['scoreAddress'])
+            self.assertEqual(tx_result.event_logs[0].indexed, event_log['indexed'])
+            self.assertEqual(tx_result.event_logs[0].data, event_log['data'])
+
+        # Filters the indexed arguments
+        event_logs = self._get_event_logs(event=EVENT_SIGNATURE, indexed=['a1'])['eventLogs']
+        self.assertEqual(1, len(event_logs))
+        self.assertEqual(['a1', 'b'], event_logs[0]['indexed'][1:])
+
+        event_logs = self._get_event_logs(event=EVENT_SIGNATURE, indexed=[None, 'b'])['eventLogs']
+        self.assertEqual(len(tx_results), len(event_logs))
+
+        event_logs = self._get_event_logs(event=EVENT_SIGNATURE, indexed=[None, 'c'])['eventLogs']
+        self.assertEqual(0, len(event_logs))
+
+        # Filters the heights
+        block_height = tx_results[2].block_height
+        event_logs = self._get_event_logs(fromBlock=block_height, toBlock=block_height)['eventLogs']
+        self.assertEqual(tx_results[2:4], [tx_result for tx_result in tx_results
+                                           if tx_result.tx_hash in (e['txHash'] for e in event_logs)])
+
+        # No event logs of other SCOREs or events
+        self.assertEqual([], self._get_event_logs(address=create_address(1))['eventLogs'])
+        self.assertEqual([], self._get_event_logs(event='Transfer(Address,Address,int)')['eventLogs'])
+
+    def test_get_event_logs_with_paging(self):
+        tx_results = []
+        for i in range(3):
+            tx_results.extend(self._call_event_logs([f'a{i}', f'b{i}']))
+
+        event_logs = []
+        params = {'address': self._score_address, 'limit': 4}
+        while True:
+            response = self._get_event_logs(**params)
+            self.assertLessEqual(len(response['eventLogs']), 4)
+            event_logs.extend(response['eventLogs'])
+            if 'nextCursor' not in response:
+                break
+            params['cursor'] = response['nextCursor']
+
+        self.assertEqual([tx_result.tx_hash for tx_result in tx_results],
+                         [event_log['txHash'] for event_log in event_logs])
+
+    def test_get_event_logs_over_missing_block(self):
+        tx_results = self._call_event_logs(['a0'])
+
+        # The index is not written after the block is committed, e.g. stopped by a crash
+        with patch.object(EventLogIndex, 'put_block'):
+            self._call_event_logs(['a1'])
+
+        tx_results.extend(self._call_event_logs(['a2']))
+
+        # The blocks indexed before the missing one are still available
+        event_logs = self._get_event_logs(address=self._score_address)['eventLogs']
+        self.assertEqual([tx_result.tx_hash for tx_result in tx_results],
+                         [event_log['txHash'] for event_log in event_logs])
+
+    def test_get_event_logs_invalid_params(self):
+        self._call_event_logs(['a'])
+
+        with self.assertRaises(InvalidParamsException):
+            self._get_event_logs(indexed=['a'])
+        with self.assertRaises(InvalidParamsException):
+            self._get_event_logs(event=EVENT_SIGNATURE, indexed=['a', 'b', 'c', 'd'])
+        with self.assertRaises(InvalidParamsException):
+            self._get_event_logs(limit=0)
+        with self.assertRaises(InvalidParamsException):
+            self._get_event_logs(cursor=b'\x00')
+
+
+class TestIntegrateEventLogIndexDisabled(TestIntegrateBase):
+
+    def test_get_event_logs(self):
+        with self.assertRaises(InvalidRequestException):
+            self._query({}, 'ise_getEventLogs')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine governance snapshot testcase
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.base.exception import ExceptionCode
+from iconservice.icon_constant import ConfigKey
+from iconservice.iconscore.governance_snapshot import GovernanceSnapshot
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateGovernanceSnapshot(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True}}
+
+    def setUp(self):
+        super().setUp()
+
+        tx = self._make_deploy_tx("test_builtin",
+                                  "latest_version/governance",
+                                  self._admin,
+                                  GOVERNANCE_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx_list = [
+            self._make_score_call_tx(self._admin,
+                                     GOVERNANCE_SCORE_ADDRESS,
+                                     "setRevision",
+                                     {"code": hex(3), "name": "1.1.2.7"}),
+            self._make_deploy_tx("test_deploy_scores",
+                                 "install/test_score",
+                                 self._admin,
+                                 ZERO_SCORE_ADDRESS,
+                                 deploy_params={'value': hex(0)})
+        ]
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+
+        self._score_address = tx_results[1].score_address
+
+    def _invoke_with_and_without_snapshot(self, tx_list: list) -> tuple:
+        """Invokes the same block with and without the governance snapshot
+
+        :return: (snapshot, response with snapshot, response without snapshot)
+        """
+        engine = self.icon_service_engine
+        block = Block(self._block_height, create_block_hash(), create_timestamp(), self._prev_block_hash)
+
+        snapshots = []
+        get = GovernanceSnapshot.get
+
+        def _get(snapshot, *args, **kwargs):
+            snapshots.append(snapshot)
+            return get(snapshot, *args, **kwargs)
+
+        with patch.object(GovernanceSnapshot, 'get', _get):
+            response = engine.invoke(block, tx_list)
+        self._remove_precommit_state(block)
+
+        with patch.object(GovernanceSnapshot, 'is_available', return_value=False):
+            response_without_snapshot = engine.invoke(block, tx_list)
+
+        self._write_precommit_state(block)
+        return snapshots[0], response, response_without_snapshot
+
+    def _assert_same_response(self, response: tuple, response_without_snapshot: tuple):
+        tx_results, state_root_hash = response
+        expected_tx_results, expected_state_root_hash = response_without_snapshot
+
+        self.assertEqual([tx_result.to_dict() for tx_result in expected_tx_results],
+                         [tx_result.to_dict() for tx_result in tx_results])
+        self.assertEqual(expected_state_root_hash, state_root_hash)
+
+    def test_reuse_governance_reads(self):
+        tx_list = []
+        for i in range(5):
+            tx_list.append(self._make_score_call_tx(self._admin,
+                                                    self._score_address,
+                                                    'set_value',
+                                                    {'value': hex(i)},
+                                                    pre_validation_enabled=False))
+
+        snapshot, response, response_without_snapshot = self._invoke_with_and_without_snapshot(tx_list)
+        self._assert_same_response(response, response_without_snapshot)
+        self.assertGreater(snapshot.hit_count, 0)
+
+        for tx_result in response[0]:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+
+    def test_governance_changed_in_block(self):
+        tx_list = [
+            self._make_score_call_tx(self._admin, self._score_address, 'set_value', {'value': hex(1)},
+                                     pre_validation_enabled=False),
+            self._make_score_call_tx(self._admin,
+                                     GOVERNANCE_SCORE_ADDRESS,
+                                     'setStepCost',
+                                     {'stepType': 'contractCall', 'cost': hex(2000)},
+                                     pre_validation_enabled=False),
+            self._make_score_call_tx(self._admin, self._score_address, 'set_value', {'value': hex(2)},
+                                     pre_validation_enabled=False),
+            self._make_score_call_tx(self._admin,
+                                     GOVERNANCE_SCORE_ADDRESS,
+                                     'addToScoreBlackList',
+                                     {'address': str(self._score_address)},
+                                     pre_validation_enabled=False),
+            self._make_score_call_tx(self._admin, self._score_address, 'set_value', {'value': hex(3)},
+                                     pre_validation_enabled=False)
+        ]
+
+        snapshot, response, response_without_snapshot = self._invoke_with_and_without_snapshot(tx_list)
+        self._assert_same_response(response, response_without_snapshot)
+
+        tx_results = response[0]
+        for tx_result in tx_results[:4]:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+        # The SCORE added to the blacklist in the same block is not available
+        self.assertEqual(tx_results[4].status, TransactionResult.FAILURE)
+        self.assertEqual(tx_results[4].failure.code, ExceptionCode.ACCESS_DENIED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine icx transfer fast path testcase
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.address import MalformedAddress
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateIcxTransfer(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True}}
+
+    def _make_block(self) -> 'Block':
+        return Block(self._block_height, create_block_hash(), create_timestamp(), self._prev_block_hash)
+
+    def _invoke_twice(self, block: 'Block', tx_list: list) -> tuple:
+        """Invokes a block with the fast path and without it
+
+        :return: the results and state root hash of both
+        """
+        tx_results, state_root_hash = self.icon_service_engine.invoke(block, tx_list)
+        self._remove_precommit_state(block)
+
+        with patch.object(IconServiceEngine, '_is_icx_transfer', return_value=False):
+            expected_tx_results, expected_state_root_hash = self.icon_service_engine.invoke(block, tx_list)
+
+        return (tx_results, state_root_hash), (expected_tx_results, expected_state_root_hash)
+
+    def test_same_results(self):
+        tx_list = [
+            self._make_icx_send_tx(self._genesis, self._addr_array[0], 3 * 10 ** 16),
+            self._make_icx_send_tx(self._genesis, self._addr_array[1], 10 ** 18)
+        ]
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+
+        step_limit = 10 ** 6
+        tx_list = [
+            self._make_icx_send_tx(self._genesis, self._addr_array[2], 10 ** 18),
+            # To itself
+            self._make_icx_send_tx(self._addr_array[1], self._addr_array[1], 10 ** 16, step_limit=step_limit),
+            # To the fee treasury
+            self._make_icx_send_tx(self._addr_array[1], self._fee_treasury, 10 ** 16, step_limit=step_limit),
+            self._make_icx_send_tx(self._addr_array[1], self._addr_array[2], 0, step_limit=step_limit),
+            self._make_icx_send_tx(self._genesis, MalformedAddress.from_string('hx1234'), 10 ** 16),
+            # Protocol v2
+            self._make_icx_send_tx(self._addr_array[0], self._addr_array[2], 10 ** 16, support_v2=True),
+            # Not enough to charge the fee after the first one
+            self._make_icx_send_tx(self._addr_array[0], self._addr_array[2], 10 ** 16, support_v2=True),
+            # Out of balance
+            self._make_icx_send_tx(self._addr_array[3], self._addr_array[2], 10 ** 18, disable_pre_validate=True),
+            self._make_icx_send_tx(self._genesis, self._addr_array[2], -1, disable_pre_validate=True),
+            # Out of step
+            self._make_icx_send_tx(self._genesis, self._addr_array[2], 10 ** 16,
+                                   disable_pre_validate=True, step_limit=1)
+        ]
+
+        block = self._make_block()
+        (tx_results, state_root_hash), (expected_tx_results, expected_state_root_hash) = \
+            self._invoke_twice(block, tx_list)
+
+        self.assertEqual(expected_state_root_hash, state_root_hash)
+        self.assertEqual([tx_result.to_dict() for tx_result in expected_tx_results],
+                         [tx_result.to_dict() for tx_result in tx_results])
+        self.assertEqual(TransactionResult.SUCCESS, tx_results[0].status)
+        self.assertEqual(TransactionResult.FAILURE, tx_results[-1].status)
+
+
+if __name__ == '__main__':
+    unittest.main()
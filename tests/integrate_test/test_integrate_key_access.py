@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine key access tracking testcase
+"""
+
+import unittest
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateKeyAccess(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.TRACK_KEY_ACCESS: True}
+
+    def test_icx_transfer(self):
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], 1 * self._icx_factor)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        tx_result = tx_results[0]
+        self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+        self.assertNotIn('key_access', tx_result.to_dict())
+
+        key_access = tx_result.key_access
+        self.assertEqual(0, key_access.reads[self._genesis.to_bytes()])
+        self.assertEqual(0, key_access.reads[self._addr_array[0].to_bytes()])
+        self.assertEqual(0, key_access.writes[self._genesis.to_bytes()])
+        self.assertEqual(0, key_access.writes[self._addr_array[0].to_bytes()])
+
+    def test_internal_call(self):
+        tx1 = self._make_deploy_tx("test_internal_call_scores",
+                                   "test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS)
+        tx2 = self._make_deploy_tx("test_internal_call_scores",
+                                   "test_link_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx1, tx2])
+        self._write_precommit_state(prev_block)
+        score_addr1 = tx_results[0].score_address
+        score_addr2 = tx_results[1].score_address
+
+        tx3 = self._make_score_call_tx(self._addr_array[0],
+                                       score_addr2,
+                                       'add_score_func',
+                                       {"score_addr": str(score_addr1)})
+        prev_block, tx_results = self._make_and_req_block([tx3])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+        self.assertEqual({0}, set(tx_results[0].key_access.writes.values()))
+
+        tx4 = self._make_score_call_tx(self._addr_array[0],
+                                       score_addr2,
+                                       'set_value',
+                                       {"value": hex(1)})
+        prev_block, tx_results = self._make_and_req_block([tx4])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        # test_score.set_value() is called by test_link_score
+        key_access = tx_results[0].key_access
+        self.assertIn(1, key_access.reads.values())
+        self.assertIn(1, key_access.writes.values())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,8 +19,15 @@
 
 import unittest
 from typing import Union
+from unittest.mock import patch
 
 from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import REVISION_2
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 
@@ -113,6 +120,60 @@ class TestScoreMemberVariable(TestIntegrateBase):
         response = self._query(request)
         self.assertEqual(response, '__init__')
 
+    def test_use_score_from_snapshot(self):
+        self._update_governance()
+        self._set_revision(3)
+
+        tx: dict = self._make_deploy_tx("test_internal_call_scores",
+                                        "test_score",
+                                        self._addr_array[0],
+                                        ZERO_SCORE_ADDRESS,
+                                        deploy_params={'value': hex(1)})
+        block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(block)
+        self.assertEqual(tx_results[0].status, int(True))
+        score_address: 'Address' = tx_results[0].score_address
+
+        tx_list = [self._make_score_call_tx(self._addr_array[i], score_address, 'set_value', {'value': hex(i)})
+                   for i in range(5)]
+        block = Block(self._block_height, create_block_hash(), create_timestamp(), self._prev_block_hash)
+
+        response_with_snapshot = self.icon_service_engine.invoke(block, tx_list)
+        self._remove_precommit_state(block)
+
+        get_score = IconScoreInfo.get_score
+
+        def _get_score(score_info: 'IconScoreInfo', revision: int):
+            if revision <= REVISION_2 or score_info.address == GOVERNANCE_SCORE_ADDRESS:
+                return get_score(score_info, revision)
+            return score_info.create_score()
+
+        with patch.object(IconScoreInfo, 'get_score', _get_score):
+            response_without_snapshot = self.icon_service_engine.invoke(block, tx_list)
+        self._write_precommit_state(block)
+
+        # Consensus-equivalent to creating a SCORE instance every time
+        self.assertEqual([tx_result.to_dict() for tx_result in response_without_snapshot[0]],
+                         [tx_result.to_dict() for tx_result in response_with_snapshot[0]])
+        self.assertEqual(response_without_snapshot[1], response_with_snapshot[1])
+        for tx_result in response_with_snapshot[0]:
+            self.assertEqual(tx_result.status, int(True))
+
+        score_info: 'IconScoreInfo' = IconScoreContext.icon_score_mapper[score_address]
+        self.assertIsInstance(score_info._snapshot, dict)
+
+        request = {
+            "version": self._version,
+            "from": self._addr_array[0],
+            "to": score_address,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(4, self._query(request))
+
 
 if __name__ == '__main__':
     unittest.main()
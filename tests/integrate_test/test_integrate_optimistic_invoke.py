@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine optimistic invoke testcase
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateOptimisticInvoke(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True},
+                ConfigKey.OPTIMISTIC_INVOKE_WORKERS: 4}
+
+    def setUp(self):
+        super().setUp()
+
+        tx = self._make_deploy_tx("test_builtin",
+                                  "latest_version/governance",
+                                  self._admin,
+                                  GOVERNANCE_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_score_call_tx(self._admin,
+                                      GOVERNANCE_SCORE_ADDRESS,
+                                      "setRevision",
+                                      {"code": hex(3), "name": "1.1.2.7"})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_deploy_tx("test_internal_call_scores",
+                                  "test_score",
+                                  self._admin,
+                                  ZERO_SCORE_ADDRESS,
+                                  deploy_params={'value': hex(0)})
+        tx_list = [tx]
+        for addr in self._addr_array:
+            tx_list.append(self._make_icx_send_tx(self._genesis, addr, 20_000 * self._icx_factor))
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+
+        self._score_address = tx_results[0].score_address
+
+    def _invoke_in_both_modes(self, tx_list: list) -> tuple:
+        """Invokes the same block optimistically and serially
+
+        :return: (speculation, optimistic invoke response, serial invoke response)
+        """
+        engine = self.icon_service_engine
+        block = Block(self._block_height, create_block_hash(), create_timestamp(), self._prev_block_hash)
+
+        speculations = []
+        execute = engine._optimistic_executor.execute
+
+        def _execute(jobs):
+            speculation = execute(jobs)
+            speculations.append(speculation)
+            return speculation
+
+        with patch.object(engine._optimistic_executor, 'execute', side_effect=_execute):
+            optimistic_response = engine.invoke(block, tx_list)
+        self._remove_precommit_state(block)
+
+        with patch.object(engine, '_optimistic_executor', None):
+            serial_response = engine.invoke(block, tx_list)
+
+        self._write_precommit_state(block)
+        self.assertEqual(1, len(speculations))
+
+        return speculations[0], optimistic_response, serial_response
+
+    def _assert_same_response(self, optimistic_response: tuple, serial_response: tuple):
+        optimistic_results, optimistic_state_root_hash = optimistic_response
+        serial_results, serial_state_root_hash = serial_response
+
+        self.assertEqual([tx_result.to_dict() for tx_result in serial_results],
+                         [tx_result.to_dict() for tx_result in optimistic_results])
+        self.assertEqual(serial_state_root_hash, optimistic_state_root_hash)
+
+    def test_independent_transactions(self):
+        tx_list = []
+        for i in range(5):
+            tx_list.append(
+                self._make_icx_send_tx(self._addr_array[i], self._addr_array[i + 5], self._icx_factor,
+                                       step_limit=10 ** 6))
+        tx_list.append(self._make_score_call_tx(self._addr_array[0],
+                                                self._score_address,
+                                                'set_value',
+                                                {'value': hex(100)}))
+
+        speculation, optimistic_response, serial_response = self._invoke_in_both_modes(tx_list)
+        self._assert_same_response(optimistic_response, serial_response)
+        self.assertEqual(5, speculation.hit_count)
+        self.assertEqual(1, speculation.conflict_count)
+
+        for tx_result in optimistic_response[0]:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+
+        response = self._query({"address": self._addr_array[5]}, 'icx_getBalance')
+        self.assertEqual(20_001 * self._icx_factor, response)
+
+    def test_conflicting_transactions(self):
+        tx_list = [
+            self._make_icx_send_tx(self._addr_array[0], self._addr_array[1], 5 * self._icx_factor,
+                                   step_limit=10 ** 6),
+            self._make_icx_send_tx(self._addr_array[1], self._addr_array[2], 20_004 * self._icx_factor,
+                                   disable_pre_validate=True, step_limit=10 ** 6),
+            self._make_icx_send_tx(self._addr_array[3], self._addr_array[4], 30_000 * self._icx_factor,
+                                   disable_pre_validate=True, step_limit=10 ** 6),
+            self._make_score_call_tx(self._addr_array[5], self._score_address, 'set_value', {'value': hex(1)}),
+            self._make_score_call_tx(self._addr_array[6], self._score_address, 'set_value', {'value': hex(2)})
+        ]
+
+        speculation, optimistic_response, serial_response = self._invoke_in_both_modes(tx_list)
+        self._assert_same_response(optimistic_response, serial_response)
+        # tx1 reads the balance of addr_array[1] changed by tx0
+        # tx4 reads the value of SCORE changed by tx3 to calculate the step of storage
+        self.assertEqual(3, speculation.hit_count)
+        self.assertEqual(2, speculation.conflict_count)
+
+        tx_results = optimistic_response[0]
+        # The balance of addr_array[1] is only enough after the first tx
+        self.assertEqual(tx_results[1].status, TransactionResult.SUCCESS)
+        # Out of balance
+        self.assertEqual(tx_results[2].status, TransactionResult.FAILURE)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": self._score_address,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(2, self._query(query_request))
+
+    def test_governance_transaction(self):
+        tx_list = [
+            self._make_icx_send_tx(self._addr_array[0], self._addr_array[1], self._icx_factor,
+                                   step_limit=10 ** 6),
+            self._make_score_call_tx(self._admin,
+                                     GOVERNANCE_SCORE_ADDRESS,
+                                     'setStepPrice',
+                                     {'stepPrice': hex(10 ** 10 * 2)}),
+            self._make_icx_send_tx(self._addr_array[2], self._addr_array[3], self._icx_factor,
+                                   step_limit=10 ** 6)
+        ]
+
+        speculation, optimistic_response, serial_response = self._invoke_in_both_modes(tx_list)
+        self._assert_same_response(optimistic_response, serial_response)
+        # The tx after governance one is executed serially
+        self.assertEqual(1, speculation.hit_count)
+        self.assertEqual(0, speculation.conflict_count)
+
+        tx_results = optimistic_response[0]
+        self.assertEqual(tx_results[1].status, TransactionResult.SUCCESS)
+        self.assertEqual(tx_results[2].step_price, 10 ** 10 * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine invoking blocks on top of uncommitted blocks testcase
+"""
+
+import unittest
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.base.exception import InvalidParamsException
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegratePrecommitFork(TestIntegrateBase):
+
+    def setUp(self):
+        super().setUp()
+
+        tx = self._make_deploy_tx("test_builtin",
+                                  "latest_version/governance",
+                                  self._admin,
+                                  GOVERNANCE_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_score_call_tx(self._admin,
+                                      GOVERNANCE_SCORE_ADDRESS,
+                                      "setRevision",
+                                      {"code": hex(3), "name": "1.1.2.7"})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+    def _invoke_block(self, parent: 'Block', tx_list: list) -> tuple:
+        block = Block(parent.height + 1, create_block_hash(), create_timestamp(), parent.hash)
+        tx_results, state_root_hash = self.icon_service_engine.invoke(block, tx_list)
+        return block, tx_results
+
+    def _get_balance(self, address) -> int:
+        return self._query({"address": address}, 'icx_getBalance')
+
+    def test_invoke_on_uncommitted_parent(self):
+        last_block = self.icon_service_engine._precommit_data_manager.last_block
+
+        # block1 and block1_fork are candidates of the same height
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], 10 * self._icx_factor)
+        block1, tx_results = self._invoke_block(last_block, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[1], 20 * self._icx_factor)
+        block1_fork, tx_results = self._invoke_block(last_block, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        # addr_array[0] has icx only on block1
+        tx = self._make_icx_send_tx(self._addr_array[0], self._addr_array[2], 3 * self._icx_factor,
+                                    disable_pre_validate=True)
+        block2, tx_results = self._invoke_block(block1, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_icx_send_tx(self._addr_array[2], self._addr_array[3], 1 * self._icx_factor,
+                                    disable_pre_validate=True)
+        block3, tx_results = self._invoke_block(block2, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        tx = self._make_icx_send_tx(self._addr_array[0], self._addr_array[2], 3 * self._icx_factor,
+                                    disable_pre_validate=True)
+        block2_fork, tx_results = self._invoke_block(block1_fork, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.FAILURE)
+
+        # Nothing is written before commit
+        self.assertEqual(0, self._get_balance(self._addr_array[0]))
+
+        # A block whose parent is not committed cannot be committed
+        self.assertRaises(InvalidParamsException, self.icon_service_engine.commit, block2)
+
+        self.icon_service_engine.commit(block1)
+        self.assertEqual(10 * self._icx_factor, self._get_balance(self._addr_array[0]))
+
+        # The losing fork has been pruned
+        precommit_data_manager = self.icon_service_engine._precommit_data_manager
+        self.assertIsNone(precommit_data_manager.get(block1_fork.hash))
+        self.assertIsNone(precommit_data_manager.get(block2_fork.hash))
+        self.assertIsNone(precommit_data_manager.get(block2.hash).block_batch.parent)
+        self.assertIsNotNone(precommit_data_manager.get(block3.hash).block_batch.parent)
+
+        self.icon_service_engine.commit(block2)
+        self.icon_service_engine.commit(block3)
+        self.assertTrue(precommit_data_manager.empty())
+
+        self.assertEqual(7 * self._icx_factor, self._get_balance(self._addr_array[0]))
+        self.assertEqual(2 * self._icx_factor, self._get_balance(self._addr_array[2]))
+        self.assertEqual(1 * self._icx_factor, self._get_balance(self._addr_array[3]))
+        self.assertEqual(0, self._get_balance(self._addr_array[1]))
+
+    def test_rollback(self):
+        last_block = self.icon_service_engine._precommit_data_manager.last_block
+
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], 10 * self._icx_factor)
+        block1, _ = self._invoke_block(last_block, [tx])
+        block2, _ = self._invoke_block(block1, [])
+        block3, _ = self._invoke_block(block2, [])
+
+        # The descendants are thrown away together
+        self.icon_service_engine.rollback(block2)
+
+        precommit_data_manager = self.icon_service_engine._precommit_data_manager
+        self.assertIsNotNone(precommit_data_manager.get(block1.hash))
+        self.assertIsNone(precommit_data_manager.get(block2.hash))
+        self.assertIsNone(precommit_data_manager.get(block3.hash))
+
+    def test_deployed_score_on_uncommitted_parent(self):
+        last_block = self.icon_service_engine._precommit_data_manager.last_block
+
+        tx = self._make_deploy_tx("test_internal_call_scores",
+                                  "test_score",
+                                  self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS,
+                                  deploy_params={'value': hex(1)})
+        block1, tx_results = self._invoke_block(last_block, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+        score_address = tx_results[0].score_address
+
+        tx = self._make_score_call_tx(self._addr_array[0], score_address, 'set_value', {'value': hex(2)},
+                                      pre_validation_enabled=False)
+        block2, tx_results = self._invoke_block(block1, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        self.icon_service_engine.commit(block1)
+        self.icon_service_engine.commit(block2)
+
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": score_address,
+            "dataType": "call",
+            "data": {
+                "method": "get_value",
+                "params": {}
+            }
+        }
+        self.assertEqual(2, self._query(query_request))
+
+    def test_step_properties_changed_on_uncommitted_parent(self):
+        prev_block = self.icon_service_engine._precommit_data_manager.last_block
+
+        tx = self._make_score_call_tx(self._admin,
+                                      GOVERNANCE_SCORE_ADDRESS,
+                                      'setStepPrice',
+                                      {'stepPrice': hex(10 ** 10 * 2)})
+        block1, tx_results = self._invoke_block(prev_block, [tx])
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+
+        block2 = Block(block1.height + 1, create_block_hash(), create_timestamp(), block1.hash)
+        self.assertRaises(InvalidParamsException, self.icon_service_engine.invoke, block2, [])
+
+
+class TestIntegratePrecommitForkBeforeRevision3(TestIntegrateBase):
+
+    def test_invoke_on_uncommitted_parent(self):
+        last_block = self.icon_service_engine._precommit_data_manager.last_block
+
+        block1 = Block(last_block.height + 1, create_block_hash(), create_timestamp(), last_block.hash)
+        self.icon_service_engine.invoke(block1, [])
+
+        block2 = Block(block1.height + 1, create_block_hash(), create_timestamp(), block1.hash)
+        self.assertRaises(InvalidParamsException, self.icon_service_engine.invoke, block2, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine query result cache testcase
+"""
+
+import unittest
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateQueryResultCache(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.QUERY_CACHE_SIZE: 100}
+
+    @property
+    def _cache(self):
+        return self.icon_service_engine._query_result_cache
+
+    def _get_balance(self, address) -> int:
+        return self._query({'address': address}, 'icx_getBalance')
+
+    def _transfer(self, to, value: int):
+        tx = self._make_icx_send_tx(self._genesis, to, value)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+    def _get_values(self, score_address) -> list:
+        return self._query({'to': score_address, 'dataType': 'call', 'data': {'method': 'get_values'}})
+
+    def _set_values(self, score_address):
+        tx = self._make_score_call_tx(self._addr_array[0], score_address, 'set_values', {})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+    def test_get_balance(self):
+        self._transfer(self._addr_array[0], 10)
+        self.assertEqual(10, self._get_balance(self._addr_array[0]))
+        self.assertEqual(0, self._get_balance(self._addr_array[1]))
+        self.assertEqual(10, self._get_balance(self._addr_array[0]))
+        self.assertEqual(1, self._cache.hit_count)
+
+        # Unrelated to the cached balance of addr_array[1]
+        self._transfer(self._addr_array[0], 20)
+        self.assertEqual(30, self._get_balance(self._addr_array[0]))
+        self.assertEqual(0, self._get_balance(self._addr_array[1]))
+        self.assertEqual(2, self._cache.hit_count)
+
+        self._transfer(self._addr_array[1], 40)
+        self.assertEqual(40, self._get_balance(self._addr_array[1]))
+        self.assertEqual(30, self._get_balance(self._addr_array[0]))
+        self.assertEqual(3, self._cache.hit_count)
+
+    def test_call(self):
+        tx = self._make_deploy_tx("test_scores", "test_array_db", self._addr_array[0], ZERO_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        score_address = tx_results[0].score_address
+
+        self._set_values(score_address)
+        values = self._get_values(score_address)
+        self.assertEqual([str(self._addr_array[0])], values)
+
+        # The response modified by the caller does not affect the cache
+        values.append('value')
+        self.assertEqual([str(self._addr_array[0])], self._get_values(score_address))
+        self.assertEqual(1, self._cache.hit_count)
+
+        self._set_values(score_address)
+        self.assertEqual([str(self._addr_array[0])] * 2, self._get_values(score_address))
+        self.assertEqual(1, self._cache.hit_count)
+
+    def test_score_update(self):
+        tx = self._make_deploy_tx("test_deploy_scores", "install/test_score", self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS, deploy_params={'value': hex(1)})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        score_address = tx_results[0].score_address
+
+        # Fills the committed deploy info cache
+        tx = self._make_score_call_tx(self._addr_array[0], score_address, 'set_value', {'value': hex(2)})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        request = {'to': score_address, 'dataType': 'call', 'data': {'method': 'get_value'}}
+        api: list = self._query({'address': score_address}, 'icx_getScoreApi')
+        self.assertIn('increase_value', [func['name'] for func in api])
+        self.assertEqual(2, self._query(request))
+        self.assertEqual(api, self._query({'address': score_address}, 'icx_getScoreApi'))
+        self.assertEqual(2, self._query(request))
+        self.assertEqual(2, self._cache.hit_count)
+
+        tx = self._make_deploy_tx("test_deploy_scores", "update/test_score", self._addr_array[0],
+                                  score_address, deploy_params={'value': hex(3)})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        # The results of the SCORE before the update are invalidated
+        api = self._query({'address': score_address}, 'icx_getScoreApi')
+        self.assertNotIn('increase_value', [func['name'] for func in api])
+        self.assertNotIn('fallback', [func['name'] for func in api])
+        self.assertEqual(5, self._query(request))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine query snapshot testcase
+"""
+
+import threading
+import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey
+from iconservice.icx.icx_engine import IcxEngine
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateQuerySnapshot(TestIntegrateBase):
+
+    def _get_balance(self, address) -> int:
+        return self._query({'address': address}, 'icx_getBalance')
+
+    def _transfer(self, value: int):
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], value)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+    def test_query_during_commit(self):
+        self._transfer(10)
+        self.assertEqual(10, self._get_balance(self._addr_array[0]))
+
+        started = threading.Event()
+        committed = threading.Event()
+        get_balance = IcxEngine.get_balance
+
+        def _get_balance(icx_engine, context, address):
+            if context is not None and context.db_snapshot is not None:
+                # The query reads the balance after the next block is committed
+                started.set()
+                committed.wait()
+            return get_balance(icx_engine, context, address)
+
+        with ThreadPoolExecutor(1) as executor:
+            with patch.object(IcxEngine, 'get_balance', _get_balance):
+                future = executor.submit(self._get_balance, self._addr_array[0])
+                started.wait()
+
+                self._transfer(20)
+                committed.set()
+
+                # The query sees the states of the block committed when it started
+                self.assertEqual(10, future.result())
+
+        self.assertEqual(30, self._get_balance(self._addr_array[0]))
+        # The snapshot released by the query has been closed
+        self.assertEqual(1, self.icon_service_engine._snapshot_manager.open_count)
+
+    def test_concurrent_queries(self):
+        self._transfer(10)
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(self._get_balance, self._addr_array[0]) for _ in range(100)]
+            self._transfer(20)
+
+            for future in futures:
+                self.assertIn(future.result(), (10, 30))
+
+        self.assertEqual(1, self.icon_service_engine._snapshot_manager.open_count)
+
+
+class TestIntegrateQuerySnapshotWithCache(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.STATE_DB_CACHE_SIZE: 1024 * 1024}
+
+    def test_query_from_caches(self):
+        tx = self._make_deploy_tx("test_deploy_scores/install", "sample_token", self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS, deploy_params={"init_supply": hex(1000), "decimal": "0x12"})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        score_address = tx_results[0].score_address
+
+        request = {
+            "from": self._admin,
+            "to": score_address,
+            "dataType": "call",
+            "data": {"method": "balance_of", "params": {"addr_from": str(self._addr_array[0])}}
+        }
+        self.assertEqual(1000 * 10 ** 18, self._query(request))
+        self.assertEqual(0, self._query({'address': self._addr_array[1]}, 'icx_getBalance'))
+
+        # The queries on the snapshot of the last committed block are served from the caches
+        cache = self.icon_service_engine._icx_context_db.key_value_db.cache
+        deploy_storage = self.icon_service_engine._icon_score_deploy_engine.icon_deploy_storage
+        cache_hits: int = cache.hits
+        deploy_info_hits: int = deploy_storage.hit_count
+
+        self.assertEqual(1000 * 10 ** 18, self._query(request))
+        self.assertEqual(0, self._query({'address': self._addr_array[1]}, 'icx_getBalance'))
+        self.assertLess(cache_hits, cache.hits)
+        self.assertLess(deploy_info_hits, deploy_storage.hit_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,11 +16,28 @@
 
 """score method parameters testcase"""
 
+from copy import deepcopy
+from unittest.mock import patch
+
 from iconservice import ZERO_SCORE_ADDRESS, Address
 from iconservice.base.exception import InvalidParamsException, ExceptionCode
+from iconservice.base.type_converter import TypeConverter
+from iconservice.iconscore.icon_score_engine import IconScoreEngine
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 
+def _convert_score_params_by_annotations_every_time(icon_score, func_name: str, kw_params: dict) -> dict:
+    """The way to convert params before the converters are cached per SCORE method"""
+    tmp_params = deepcopy(kw_params)
+
+    icon_score.validate_external_method(func_name)
+
+    score_func = getattr(icon_score, func_name)
+    annotation_params = TypeConverter.make_annotations_from_method(score_func)
+    TypeConverter.convert_data_params(annotation_params, tmp_params)
+    return tmp_params
+
+
 class TestIntegrateMethodParamters(TestIntegrateBase):
 
     def test_parameters_success_cases(self):
@@ -82,6 +99,48 @@ class TestIntegrateMethodParamters(TestIntegrateBase):
         response = self._query(query_request)
         self.assertEqual(response, 100 * 10 ** 18)
 
+    def test_query_with_cached_params_converter(self):
+        tx1 = self._make_deploy_tx("test_deploy_scores/install",
+                                   "sample_token",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS, deploy_params={"init_supply": hex(1000), "decimal": "0x12"})
+        tx2 = self._make_deploy_tx("test_internal_call_scores",
+                                   "test_score",
+                                   self._addr_array[0],
+                                   ZERO_SCORE_ADDRESS, deploy_params={"value": hex(1)})
+        prev_block, tx_results = self._make_and_req_block([tx1, tx2])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual(tx_results[1].status, int(True))
+
+        query_requests = []
+        for i in range(50):
+            query_requests.append({
+                "from": self._admin,
+                "to": tx_results[0].score_address,
+                "dataType": "call",
+                "data": {
+                    "method": "balance_of",
+                    "params": {"addr_from": str(self._addr_array[i % len(self._addr_array)])}
+                }
+            })
+            query_requests.append({
+                "from": self._admin,
+                "to": tx_results[1].score_address,
+                "dataType": "call",
+                "data": {"method": "get_value", "params": {}}
+            })
+
+        def _query_all() -> list:
+            return [self._query(request) for request in query_requests]
+
+        with patch.object(IconScoreEngine, '_convert_score_params_by_annotations',
+                          _convert_score_params_by_annotations_every_time):
+            expected = _query_all()
+        actual = _query_all()
+
+        self.assertEqual(expected, actual)
+
     def test_more_parameters_query(self):
         tx1 = self._make_deploy_tx("test_deploy_scores/install", "sample_token", self._addr_array[0],
                                    ZERO_SCORE_ADDRESS, deploy_params={"init_supply": hex(1000), "decimal": "0x12"})
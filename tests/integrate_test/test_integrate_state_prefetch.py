@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine state prefetch testcase
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateStatePrefetch(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.PREFETCH_STATE: True}
+
+    def _deploy_score(self):
+        tx = self._make_deploy_tx("test_internal_call_scores",
+                                  "test_score",
+                                  self._addr_array[0],
+                                  ZERO_SCORE_ADDRESS,
+                                  deploy_params={'value': hex(0)})
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(tx_results[0].status, TransactionResult.SUCCESS)
+        return tx_results[0].score_address
+
+    def _invoke(self, tx_list: list) -> list:
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+        self._write_precommit_state(prev_block)
+        for tx_result in tx_results:
+            self.assertEqual(tx_result.status, TransactionResult.SUCCESS)
+        return tx_results
+
+    def test_invoke(self):
+        score_address = self._deploy_score()
+
+        for i in range(3):
+            self._invoke([
+                self._make_icx_send_tx(self._genesis, self._addr_array[1], self._icx_factor),
+                self._make_score_call_tx(self._addr_array[0], score_address, 'set_value', {'value': hex(i)})
+            ])
+
+        self.assertEqual(3 * self._icx_factor, self._query({"address": self._addr_array[1]}, 'icx_getBalance'))
+        self.assertEqual(2, self._query({'to': score_address, 'dataType': 'call', 'data': {'method': 'get_value'}}))
+
+    def test_prefetched_states(self):
+        # Runs the prefetch synchronously
+        self.icon_service_engine._prefetch_executor.shutdown(wait=True)
+        self.icon_service_engine._prefetch_executor = Mock(submit=lambda fn, *args: fn(*args))
+
+        prefetchers = []
+        prefetch_states = self.icon_service_engine._prefetch_states
+
+        def _prefetch_states(tx_requests):
+            prefetchers.append(prefetch_states(tx_requests))
+            return prefetchers[-1]
+
+        self.icon_service_engine._prefetch_states = _prefetch_states
+
+        score_address = self._deploy_score()
+        self._invoke([
+            self._make_icx_send_tx(self._genesis, self._addr_array[1], self._icx_factor),
+            self._make_score_call_tx(self._addr_array[0], score_address, 'set_value', {'value': hex(1)})
+        ])
+
+        self.assertEqual(2, len(prefetchers))
+        self.assertTrue(prefetchers[-1].hit_count > 0)
+        self.assertIsNotNone(prefetchers[-1].get(self._genesis.to_bytes()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine transaction result store testcase
+"""
+
+import unittest
+from unittest.mock import patch
+
+from iconcommons.logger import Logger
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from iconservice.base.exception import InvalidParamsException, InvalidRequestException
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.iconscore.icon_score_result_store import TransactionResultStore
+from iconservice.utils import to_camel_case
+from tests import create_tx_hash
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateTxResultStore(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.TX_RESULT_STORE: True}
+
+    def _get_tx_result(self, tx_hash: bytes) -> dict:
+        return self._query({'txHash': tx_hash}, 'ise_getTransactionResult')
+
+    def test_get_tx_result(self):
+        tx = self._make_deploy_tx("test_builtin",
+                                  "latest_version/governance",
+                                  self._admin,
+                                  GOVERNANCE_SCORE_ADDRESS)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        tx_list = [
+            self._make_deploy_tx("test_event_log_scores",
+                                 "test_event_log_score",
+                                 self._addr_array[0],
+                                 ZERO_SCORE_ADDRESS,
+                                 deploy_params={}),
+            self._make_icx_send_tx(self._genesis, self._addr_array[1], 10 ** 18),
+            # Fails for the lack of balance
+            self._make_icx_send_tx(self._addr_array[2], self._addr_array[1], 10 ** 18, disable_pre_validate=True)
+        ]
+        prev_block, tx_results = self._make_and_req_block(tx_list)
+
+        # Not committed yet
+        with self.assertRaises(InvalidParamsException):
+            self._get_tx_result(tx_results[0].tx_hash)
+
+        self._write_precommit_state(prev_block)
+        self.assertEqual(TransactionResult.FAILURE, tx_results[2].status)
+
+        score_address = tx_results[0].score_address
+        tx = self._make_score_call_tx(self._addr_array[0],
+                                      score_address,
+                                      'call_valid_event_log',
+                                      {'value1': 'a', 'value2': 'b', 'value3': 'c'})
+        prev_block, call_tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        self.assertEqual(1, len(call_tx_results[0].event_logs))
+
+        for tx_result in tx_results + call_tx_results:
+            self.assertEqual(tx_result.to_dict(to_camel_case), self._get_tx_result(tx_result.tx_hash))
+
+        with self.assertRaises(InvalidParamsException):
+            self._get_tx_result(create_tx_hash())
+
+    def test_missing_results_on_open(self):
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], 10 ** 18)
+        prev_block, tx_results = self._make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+
+        # The results are not stored after the block is committed, e.g. stopped by a crash
+        tx = self._make_icx_send_tx(self._genesis, self._addr_array[0], 10 ** 18)
+        prev_block, missing_tx_results = self._make_and_req_block([tx])
+        with patch.object(TransactionResultStore, 'put_block'):
+            self._write_precommit_state(prev_block)
+
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        with patch.object(Logger, 'warning') as warning:
+            self.icon_service_engine.open(self._config)
+        self.assertIn(f'block {prev_block.height} ~ {prev_block.height} are missing',
+                      ' '.join(str(args[0]) for args, _ in warning.call_args_list))
+
+        # The results stored before are still available
+        self.assertEqual(tx_results[0].to_dict(to_camel_case), self._get_tx_result(tx_results[0].tx_hash))
+        with self.assertRaises(InvalidParamsException):
+            self._get_tx_result(missing_tx_results[0].tx_hash)
+
+
+class TestIntegrateTxResultStoreDisabled(TestIntegrateBase):
+
+    def test_get_tx_result(self):
+        with self.assertRaises(InvalidRequestException):
+            self._query({'txHash': create_tx_hash()}, 'ise_getTransactionResult')
+
+
+if __name__ == '__main__':
+    unittest.main()
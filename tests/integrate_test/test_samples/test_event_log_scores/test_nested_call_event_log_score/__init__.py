@@ -0,0 +1 @@
+from .test_nested_call_event_log_score import TestNestedCallEventLogScore
@@ -0,0 +1,32 @@
+from iconservice import *
+
+
+class TestNestedCallEventLogScore(IconScoreBase):
+    @eventlog(indexed=2)
+    def Emitted(self, depth: int, index: int):
+        pass
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def emit_nested(self, depth: int, count: int, revert_depth: int = -1):
+        for i in range(count):
+            self.Emitted(depth, i)
+
+        if depth > 0:
+            try:
+                self.call(addr_to=self.address,
+                          func_name="emit_nested",
+                          kw_dict={"depth": depth - 1, "count": count, "revert_depth": revert_depth})
+            except IconScoreException:
+                pass
+
+        if depth == revert_depth:
+            revert(f"revert at {depth}")
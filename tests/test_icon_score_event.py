@@ -29,17 +29,19 @@ from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.iconscore.icon_score_base import eventlog, IconScoreBase, IconScoreDatabase, external
 from iconservice.iconscore.icon_score_context import ContextContainer, \
     IconScoreContext, IconScoreContextType, IconScoreFuncType
+from iconservice.iconscore.icon_score_event_log import EventLog, EventLogEmitter
 from iconservice.iconscore.icon_score_step import IconScoreStepCounter
 from iconservice.icx import IcxEngine
 from iconservice.utils import int_to_bytes
 from iconservice.utils import to_camel_case
+from iconservice.utils.bloom import BloomFilter, get_bloom_bits
 
 
 class TestEventlog(unittest.TestCase):
     def setUp(self):
         address = Address.from_data(AddressPrefix.CONTRACT, os.urandom(20))
         db = Mock(spec=IconScoreDatabase)
-        db.attach_mock(address, 'address')
+        db.address = address
         context = IconScoreContext()
         traces = Mock(spec=list)
         step_counter = Mock(spec=IconScoreStepCounter)
@@ -316,6 +318,31 @@ class TestEventlog(unittest.TestCase):
         self.assertEqual(ICX_TRANSFER_EVENT_LOG, event_log.indexed[0])
         self.assertEqual(0, len(event_log.data))
 
+    def test_generate_logs_bloom(self):
+        score_addresses = [Address.from_data(AddressPrefix.CONTRACT, os.urandom(20)) for _ in range(3)]
+        event_logs = []
+        for i in range(3000):
+            indexed = [ICX_TRANSFER_EVENT_LOG,
+                       Address.from_data(AddressPrefix.EOA, os.urandom(20)),
+                       Address.from_data(AddressPrefix.EOA, os.urandom(20)),
+                       i]
+            event_logs.append(EventLog(score_addresses[i % 3], indexed, []))
+        event_logs.append(EventLog(score_addresses[0], ['Empty()'], []))
+
+        expected = BloomFilter()
+        for event_log in event_logs:
+            bloom_data = [EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address)]
+            bloom_data.extend(
+                EventLogEmitter.get_ordered_bytes(i, indexed_item) for i, indexed_item in enumerate(event_log.indexed))
+            for value in bloom_data:
+                for bloom_bits in get_bloom_bits(value):
+                    expected.value |= bloom_bits
+
+        logs_bloom = IconServiceEngine._generate_logs_bloom(event_logs)
+
+        self.assertEqual(int(expected), int(logs_bloom))
+        self.assertEqual(int(expected).to_bytes(256, 'big'), int(logs_bloom).to_bytes(256, 'big'))
+
     def assert_score_address_in_bloom(self, logs_bloom):
         # Asserts whether the SCORE address is included in the bloom
         address = self._mock_score.address
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.base.block import Block
+from iconservice.query_result_cache import QueryResultCache
+from tests import create_address, create_block_hash
+
+
+class TestQueryResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.block = Block(0, create_block_hash(), 0, None)
+        self.states = {b'key0': b'value0', b'key1': b'value1'}
+        self.cache = QueryResultCache(2, self.block)
+
+    def _make_snapshot(self):
+        return Mock(block=self.block, get=self.states.get)
+
+    def _commit(self, states: dict, clear: bool = False):
+        self.block = Block(self.block.height + 1, create_block_hash(), 0, self.block.hash)
+        self.states.update(states)
+        self.cache.on_block_committed(self.block, states.keys(), clear)
+
+    def _query(self, params: dict, *keys: bytes, block_accessed: bool = False):
+        def _func(snapshot, method, params_):
+            if block_accessed:
+                _ = snapshot.block.height
+            return [snapshot.get(key) for key in keys]
+
+        func = Mock(side_effect=_func)
+        ret = self.cache.query(self._make_snapshot(), 'icx_call', params, func)
+        return ret, func.called
+
+    def test_query(self):
+        params = {'to': create_address(), 'data': {'method': 'get', 'params': {'key': 'key0'}}}
+
+        self.assertEqual(([b'value0'], True), self._query(params, b'key0'))
+        self.assertEqual(([b'value0'], False), self._query(params, b'key0'))
+        self.assertEqual(1, self.cache.hit_count)
+        self.assertEqual(1, self.cache.miss_count)
+        self.assertEqual(0.5, self.cache.hit_rate)
+
+        # The cached value is not affected by the modification of the returned one
+        ret, _ = self._query(params, b'key0')
+        ret.append(b'value1')
+        self.assertEqual(([b'value0'], False), self._query(params, b'key0'))
+
+    def test_invalidation(self):
+        params0 = {'key': 'key0'}
+        params1 = {'key': 'key1'}
+        self._query(params0, b'key0')
+        self._query(params1, b'key1')
+
+        self._commit({b'key1': b'value11'})
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(1, self.cache.invalidated_count)
+        # Carried over to the new block
+        self.assertEqual(([b'value0'], False), self._query(params0, b'key0'))
+        self.assertEqual(([b'value11'], True), self._query(params1, b'key1'))
+
+        self._commit({}, clear=True)
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidation_by_recorded_key(self):
+        params = {'key': 'key0'}
+
+        def _func(snapshot, method, params_):
+            # Read from a cache kept out of the snapshot
+            snapshot.record(b'key1')
+            return self.states[b'key1']
+
+        self.cache.query(self._make_snapshot(), 'icx_call', params, _func)
+        self.assertEqual(1, len(self.cache))
+
+        self._commit({b'key1': b'value11'})
+        self.assertEqual(0, len(self.cache))
+
+    def test_block_dependent(self):
+        params = {'key': 'key0'}
+        self._query(params, b'key0', block_accessed=True)
+        self.assertEqual(0, len(self.cache))
+
+    def test_stale_snapshot(self):
+        params = {'key': 'key0'}
+        snapshot = self._make_snapshot()
+
+        def _func(snapshot_, method, params_):
+            # A block is committed while the query is running
+            self._commit({b'key0': b'value00'})
+            return snapshot_.get(b'key0')
+
+        self.cache.query(snapshot, 'icx_call', params, _func)
+        self.assertEqual(0, len(self.cache))
+
+        # The query pinned to the old block does not use the results of the new block
+        self._query(params, b'key0')
+        func = Mock(return_value=b'value0')
+        self.cache.query(snapshot, 'icx_call', params, func)
+        self.assertTrue(func.called)
+
+    def test_max_size(self):
+        for i in range(3):
+            self._query({'index': i}, b'key0')
+
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual(([b'value0'], True), self._query({'index': 0}, b'key0'))
+
+
+if __name__ == '__main__':
+    unittest.main()
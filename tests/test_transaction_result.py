@@ -21,7 +21,11 @@ from iconservice.base.exception import ExceptionCode
 from iconservice.base.address import AddressPrefix
 from iconservice.base.block import Block
 from iconservice.base.transaction import Transaction
-from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.base.type_converter import TypeConverter
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult, TransactionResultSerializer
+from iconservice.utils import to_camel_case
+from iconservice.utils.bloom import BloomFilter
 from tests import create_block_hash, create_tx_hash, create_address
 
 
@@ -74,3 +78,53 @@ class TestTransactionResult(unittest.TestCase):
         print(d)
         print(hex(tx_result.failure.code))
 
+    def _make_tx_result(self, tx_index: int, score_address: 'Address') -> 'TransactionResult':
+        tx = Transaction(create_tx_hash(), tx_index)
+        block = Block(block_height=10,
+                      block_hash=create_block_hash(),
+                      timestamp=0x1234567890,
+                      prev_hash=create_block_hash())
+
+        tx_result = TransactionResult(tx=tx, block=block, to=score_address)
+        tx_result.score_address = score_address
+        tx_result.step_used = 10 ** 5
+        tx_result.step_price = 10 ** 10
+        tx_result.cumulative_step_used = 10 ** 5 * (tx_index + 1)
+        tx_result.event_logs = [
+            EventLog(score_address,
+                     ['Transfer(Address,Address,int,bytes)', create_address(), score_address, 100],
+                     [b'\x00\x01', True, 'message', None, -1]),
+            EventLog(score_address, ['Changed(int)'], [])
+        ]
+        tx_result.logs_bloom = BloomFilter()
+        tx_result.logs_bloom.add(b'Transfer(Address,Address,int,bytes)')
+        tx_result.traces = []
+        tx_result.status = TransactionResult.SUCCESS
+
+        return tx_result
+
+    def test_serializer(self):
+        score_address = create_address(AddressPrefix.CONTRACT)
+        tx_results = [self._make_tx_result(i, score_address) for i in range(3)]
+        tx_results.append(self.tx_result)
+
+        serializer = TransactionResultSerializer()
+        for tx_result in tx_results:
+            actual = serializer.serialize(tx_result)
+            expected = TypeConverter.convert_type_reverse(tx_result.to_dict(to_camel_case))
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(list(expected.keys()), list(actual.keys()))
+
+        # failure is not serialized on success
+        self.tx_result.status = TransactionResult.SUCCESS
+        self.assertNotIn('failure', serializer.serialize(self.tx_result))
+
+    def test_serializer_does_not_modify_event_logs(self):
+        score_address = create_address(AddressPrefix.CONTRACT)
+        tx_result = self._make_tx_result(0, score_address)
+
+        TransactionResultSerializer().serialize(tx_result)
+        self.assertEqual(100, tx_result.event_logs[0].indexed[3])
+        self.assertIs(score_address, tx_result.event_logs[0].indexed[2])
+
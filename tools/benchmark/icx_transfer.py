@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the icx transfer fast path with the generic transaction path
+
+Usage: PYTHONPATH=. python tools/benchmark/icx_transfer.py
+"""
+
+import time
+import unittest
+from unittest.mock import patch
+
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_service_engine import IconServiceEngine
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class IcxTransferBenchmark(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True}}
+
+    def test_icx_transfer(self):
+        count = 500
+        tx_list = [self._make_icx_send_tx(self._genesis, self._addr_array[i % len(self._addr_array)], 10 ** 16)
+                   for i in range(count)]
+        block = Block(self._block_height, create_block_hash(), create_timestamp(), self._prev_block_hash)
+
+        def _measure() -> float:
+            # The best of 3 runs not to be affected by other processes
+            elapsed_times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                self.icon_service_engine.invoke(block, tx_list)
+                elapsed_times.append(time.perf_counter() - start)
+                self._remove_precommit_state(block)
+            return min(elapsed_times)
+
+        fast_path_time = _measure()
+        with patch.object(IconServiceEngine, '_is_icx_transfer', return_value=False):
+            generic_time = _measure()
+
+        print(f'Transfer block({count} txs): '
+              f'generic {generic_time * 1000:.2f}ms, fast path {fast_path_time * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    unittest.main()
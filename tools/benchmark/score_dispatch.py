@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the SCORE dispatch table with the attribute lookups IconScoreBase did before it
+
+Usage: PYTHONPATH=. python tools/benchmark/score_dispatch.py [count]
+"""
+
+import sys
+import time
+from unittest.mock import Mock
+
+from iconservice.base.exception import MethodNotFoundException, MethodNotPayableException
+from iconservice.base.message import Message
+from iconservice.deploy.icon_score_deploy_engine import IconScoreDeployEngine
+from iconservice.iconscore.icon_score_base import IconScoreBase
+from iconservice.iconscore.icon_score_constant import CONST_CLASS_EXTERNALS, CONST_CLASS_PAYABLES, \
+    CONST_BIT_FLAG, ConstBitFlag
+from iconservice.iconscore.icon_score_context import ContextContainer, IconScoreContext, IconScoreContextType, \
+    IconScoreFuncType
+from tests.icon_score.test_external_payable_call_method import ExternalCallClass
+
+
+class _LegacyDispatcher(object):
+    """Looks up SCORE functions as IconScoreBase did before the dispatch table
+    """
+
+    def __init__(self, score: 'IconScoreBase'):
+        self._score = score
+
+    def set_func_type(self, context: 'IconScoreContext', func_name: str):
+        if func_name is not None and self._is_func_readonly(func_name):
+            context.func_type = IconScoreFuncType.READONLY
+        else:
+            context.func_type = IconScoreFuncType.WRITABLE
+
+    def call(self, func_name: str, arg_params: list = None, kw_params: dict = None):
+        self._validate_external_method(func_name)
+        self._check_payable(func_name)
+        score_func = getattr(self._score, func_name)
+        if arg_params is None:
+            arg_params = []
+        if kw_params is None:
+            kw_params = {}
+        return score_func(*arg_params, **kw_params)
+
+    def _get_attr_dict(self, attr: str) -> dict:
+        return getattr(type(self._score), attr, {})
+
+    def _validate_external_method(self, func_name: str):
+        if not self._is_external_method(func_name):
+            raise MethodNotFoundException(func_name)
+
+    def _check_payable(self, func_name: str):
+        if self._score.msg.value > 0 and not self._is_payable_method(func_name):
+            raise MethodNotPayableException(func_name)
+
+    def _is_external_method(self, func_name: str) -> bool:
+        return func_name in self._get_attr_dict(CONST_CLASS_EXTERNALS)
+
+    def _is_payable_method(self, func_name: str) -> bool:
+        return func_name in self._get_attr_dict(CONST_CLASS_PAYABLES)
+
+    def _is_func_readonly(self, func_name: str) -> bool:
+        if not self._is_external_method(func_name):
+            return False
+
+        func = getattr(self._score, func_name)
+        return bool(getattr(func, CONST_BIT_FLAG, 0) & ConstBitFlag.ReadOnly)
+
+
+def _measure(count: int, set_func_type: callable, call: callable) -> float:
+    # The best of 5 runs not to be affected by other processes
+    elapsed_times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(count):
+            set_func_type('func2')
+            call(func_name='func2', kw_params={'value': 1})
+        elapsed_times.append(time.perf_counter() - start)
+    return min(elapsed_times)
+
+
+def main(count: int):
+    IconScoreContext.icon_score_deploy_engine = Mock(spec=IconScoreDeployEngine)
+    context = IconScoreContext(IconScoreContextType.INVOKE)
+    context.msg = Message(value=0)
+    ContextContainer._push_context(context)
+
+    try:
+        score = ExternalCallClass(Mock())
+        legacy = _LegacyDispatcher(score)
+        legacy_time = _measure(
+            count, lambda func_name: legacy.set_func_type(context, func_name), legacy.call)
+        dispatch_time = _measure(
+            count, lambda func_name: context.set_func_type_by_icon_score(score, func_name),
+            getattr(score, '_IconScoreBase__call'))
+    finally:
+        ContextContainer._pop_context()
+
+    print(f'SCORE call({count} times): '
+          f'attribute lookups {legacy_time * 1000:.2f}ms, dispatch table {dispatch_time * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)